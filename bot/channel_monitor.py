@@ -0,0 +1,298 @@
+"""
+여러 YouTube 채널 동시 모니터링
+
+채널 목록을 받아 채널마다 최근 영상을 동시에 페이지 단위로 흘려 받고 (동시 요청 수 제한),
+결과를 하나의 키워드 리포트로 합친다. 한 채널의 실패는 리포트에 기록만 하고 나머지는 계속한다.
+상태 저장소(state_store.MonitorState)를 넘기면 지난 실행 이후 새로 올라온 영상만 조회한다
+(채널 워터마크는 그 채널 조회를 끝까지 마친 뒤에만 당기고, 상세 조회에 실패한 영상은 다음 실행에서 다시 조회).
+키워드는 영상 통계(조회수/좋아요 증가 속도)로 점수를 매겨 report.trending에 상위 K개를 담는다
+(상태 저장소가 있으면 아직 보내지 않은 키워드 중에서).
+"""
+
+import asyncio
+import logging
+import os
+import time
+
+from keyword_report import KeywordReport
+from quota import ChannelCache, plan_channels
+from trending import TrendingScorer
+from youtube_api import MAX_IDS_PER_REQUEST, AsyncYouTubeClient, YouTubeAPIError, published_after_iso
+
+# 채널 쪽에서 미리 받아 둘 수 있는 영상 수 (재생목록 페이지 단위), 넘으면 다음 페이지 요청을 멈춤
+QUEUE_PAGES = 2
+
+
+def load_channel_ids():
+    """모니터링할 채널 ID 목록
+
+    YOUTUBE_CHANNEL_IDS (쉼표 구분) + YOUTUBE_CHANNELS_FILE (한 줄에 하나, '#'은 주석),
+    둘 다 없으면 기존 YOUTUBE_CHANNEL_ID 하나
+    """
+    channel_ids = [channel.strip() for channel in os.getenv('YOUTUBE_CHANNEL_IDS', '').split(',')]
+
+    channels_file = os.getenv('YOUTUBE_CHANNELS_FILE')
+    if channels_file:
+        with open(channels_file, encoding='utf-8') as f:
+            channel_ids.extend(line.split('#', 1)[0].strip() for line in f)
+
+    if not any(channel_ids):
+        channel_ids = [os.getenv('YOUTUBE_CHANNEL_ID', '')]
+
+    # 중복 제거 (순서 유지)
+    return list(dict.fromkeys(channel for channel in channel_ids if channel))
+
+
+def _statistics(video):
+    """(조회수, 좋아요 수), 좋아요를 숨긴 영상은 0"""
+    statistics = video.get('statistics', {})
+    return int(statistics.get('viewCount', 0)), int(statistics.get('likeCount', 0))
+
+
+def _published_at(item):
+    """재생목록 항목의 영상 업로드 시각 (재생목록에 추가된 시각은 대신 씀)"""
+    return item['contentDetails'].get('videoPublishedAt', item['snippet']['publishedAt'])
+
+
+class MultiChannelKeywordMonitor:
+    """채널 목록 → 통합 키워드 리포트
+
+    search(호출당 쿼터 100) 대신 채널의 업로드 재생목록(playlistItems, 1)을 훑는다.
+    재생목록 ID는 처음 한 번만 channels로 50개씩 묶어 조회해 캐시하고,
+    영상 상세는 videos 호출 하나에 50개씩 묶는다.
+    """
+
+    def __init__(self, api_key, channel_ids, days_to_monitor=4, daily_quota=None, cache=None, state=None,
+                 min_views=None, top_k=None, client_factory=None):
+        self.api_key = api_key
+        self.channel_ids = channel_ids
+        self.days_to_monitor = days_to_monitor
+        self.state = state
+        self.min_views = min_views
+        self.top_k = top_k or int(os.getenv('TRENDING_TOP_K', '10'))
+        self.daily_quota = daily_quota or int(os.getenv('YOUTUBE_DAILY_QUOTA', '10000'))
+        self.cache = cache or ChannelCache.from_env()
+        # 테스트에서 목 서버/MockTransport 클라이언트를 넣을 수 있게 (quota를 받아 클라이언트 생성)
+        self.client_factory = client_factory or (lambda quota: AsyncYouTubeClient.from_env(api_key, quota=quota))
+
+    async def _stream_channel(self, client, channel_id, playlist_id, published_after, queue, report, completed):
+        """채널의 새 영상을 큐에 넣음 (큐가 차면 다음 페이지를 요청하지 않고 기다림)
+
+        끝까지 조회한 채널만 completed[채널 ID]에 가장 최근 업로드 시각을 남긴다 (워터마크 후보).
+        """
+        error = None
+        latest = None
+        try:
+            if playlist_id is None:
+                raise YouTubeAPIError("업로드 재생목록을 찾을 수 없습니다")
+            known_ids = self.state.seen_video_ids if self.state is not None else None
+            # 지난 실행이 도중에 실패했으면 처리한 영상 뒤에 못 본 영상이 있을 수 있으므로
+            # 아는 영상은 건너뛰기만 하고 워터마크(published_after)까지 넘긴다
+            async for item in client.iter_recent_uploads(
+                playlist_id, published_after, known_ids=known_ids, stop_at_known=False
+            ):
+                latest = max(latest or '', _published_at(item))
+                await queue.put((channel_id, item))
+        except YouTubeAPIError as e:
+            logging.error(f"채널 조회 실패 ({channel_id}): {e}")
+            error = e
+        else:
+            if latest is not None:
+                completed[channel_id] = latest
+        report.add_channel(channel_id, error)
+
+    async def _stream_videos(self, producers, queue):
+        """채널들에서 들어오는 영상을 videos 호출 단위(50개)로 묶어 내보냄 (async generator)"""
+        async def close_when_done():
+            try:
+                await asyncio.gather(*producers)
+            finally:
+                await queue.put(None)
+
+        closer = asyncio.create_task(close_when_done())
+        try:
+            batch = []
+            while True:
+                entry = await queue.get()
+                if entry is None:
+                    break
+                batch.append(entry)
+                if len(batch) == MAX_IDS_PER_REQUEST:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+            await closer
+        finally:
+            for task in (*producers, closer):
+                task.cancel()
+
+    def _add_videos(self, entries, details, report, scorer):
+        """영상들을 키워드 리포트/점수에 추가 [(channel_id, video_id, published_at, title), ...]
+
+        details(영상 ID -> 상세)에 없는 영상은 재생목록 제목으로 리포트에만 넣는다.
+        """
+        tracked, snapshots = [], []
+        for channel_id, video_id, published_at, title in entries:
+            video = details.get(video_id)
+            keyword = report.add_video(channel_id, video_id, video['snippet']['title'] if video else title)
+            if keyword and video is not None:
+                views, likes = _statistics(video)
+                scorer.add(video_id, channel_id, keyword, published_at, views, likes)
+                tracked.append((video_id, channel_id, keyword, published_at))
+                snapshots.append((video_id, views, likes))
+
+        if self.state is not None:
+            self.state.track_videos(tracked)
+            self.state.record_snapshots(snapshots, scorer.now)
+
+    async def _add_batch(self, client, batch, report, scorer, deferred):
+        """영상 묶음 하나의 상세를 받아 키워드 리포트/점수에 추가하고 처리한 영상으로 기록
+
+        상세 조회에 실패한 묶음은 deferred에 (상태 저장소가 있으면 재시도 목록에도) 넣어 나중에 다시 조회한다.
+        """
+        entries = [
+            (channel_id, item['contentDetails']['videoId'], _published_at(item), item['snippet']['title'])
+            for channel_id, item in batch
+        ]
+        try:
+            details = {video['id']: video for video in await client.get_videos([entry[1] for entry in entries])}
+        except YouTubeAPIError as e:
+            logging.warning(f"영상 상세 조회 실패, 나중에 다시 조회합니다 ({len(entries)}개): {e}")
+            deferred.extend(entries)
+            if self.state is not None:
+                self.state.defer_videos(
+                    (video_id, channel_id, published_at, title) for channel_id, video_id, published_at, title in entries
+                )
+        else:
+            self._add_videos(entries, details, report, scorer)
+
+        if self.state is not None:
+            self.state.record_videos(
+                (video_id, channel_id, published_at) for channel_id, video_id, published_at, _ in entries
+            )
+
+    async def _retry_deferred(self, client, report, scorer, deferred, published_after):
+        """상세 조회에 실패한 영상을 다시 조회해 점수에 반영 (상태 저장소가 있으면 지난 실행에서 실패한 영상까지)
+
+        또 실패하면 상태 저장소에 남겨 다음 실행에서 다시 조회하고, 저장소가 없으면 재생목록 제목만 리포트에 넣는다.
+        """
+        if self.state is not None:
+            entries = [
+                (channel_id, video_id, video_published_at, title)
+                for video_id, channel_id, video_published_at, title in self.state.pending_videos(published_after)
+            ]
+        else:
+            entries = deferred
+        if not entries:
+            return
+
+        try:
+            details = {video['id']: video for video in await client.get_videos([entry[1] for entry in entries])}
+        except YouTubeAPIError as e:
+            logging.warning(f"영상 상세 재조회 실패 ({len(entries)}개): {e}")
+            if self.state is None:
+                self._add_videos(entries, {}, report, scorer)
+            return
+
+        # 응답에 없는 영상(삭제/비공개)은 제목만 리포트에 넣고 재시도 목록에서 뺀다
+        self._add_videos(entries, details, report, scorer)
+        if self.state is not None:
+            self.state.resolve_pending(entry[1] for entry in entries)
+
+    async def _rescore_tracked(self, client, scorer, published_after):
+        """지난 실행에서 본 키워드 영상의 통계를 다시 받아 스냅샷 사이의 조회수 증가 속도로 점수 반영
+
+        새 영상만 조회하면 어제 올라와 오늘 뜨는 영상을 놓치므로, 모니터링 기간 안의 추적 영상은
+        통계만 50개씩 묶어 다시 받는다 (videos 호출 하나에 쿼터 1).
+        """
+        rows = [row for row in self.state.tracked_videos(published_after) if row[0] not in scorer]
+        if rows:
+            previous = self.state.latest_snapshots(row[0] for row in rows)
+            try:
+                videos = {video['id']: video for video in await client.get_videos(
+                    [row[0] for row in rows], part='statistics'
+                )}
+            except YouTubeAPIError as e:
+                logging.warning(f"추적 영상 통계 조회 실패, 새 영상만으로 점수를 매깁니다: {e}")
+                return
+
+            snapshots = []
+            for video_id, channel_id, keyword, video_published_at in rows:
+                video = videos.get(video_id)
+                if video is None:
+                    continue
+                views, likes = _statistics(video)
+                scorer.add(video_id, channel_id, keyword, video_published_at, views, likes, previous.get(video_id))
+                snapshots.append((video_id, views, likes))
+            self.state.record_snapshots(snapshots, scorer.now)
+        self.state.prune_tracked(published_after)
+
+    async def collect(self):
+        """쿼터 안에서 채널들을 동시에 조회해 통합 키워드 리포트 생성
+
+        채널마다 재생목록 페이지를 넘기는 작업(생산자)이 크기가 정해진 큐에 영상을 넣고,
+        여기서 50개씩 꺼내 상세 조회와 키워드 추출을 한다. 뒤쪽이 밀리면 큐가 차서
+        생산자가 다음 페이지를 요청하지 않고 기다린다.
+        """
+        started = time.perf_counter()
+        published_after = published_after_iso(self.days_to_monitor)
+        # 채널별로 지난 실행에서 본 마지막 업로드 이후만 (모니터링 기간보다 오래되지는 않게)
+        watermarks = self.state.watermarks() if self.state is not None else {}
+        report = KeywordReport()
+        scorer = TrendingScorer.from_env(self.min_views)
+        quota = self.cache.quota_tracker(self.daily_quota)
+        playlists = self.cache.uploads_playlists
+
+        try:
+            async with self.client_factory(quota) as client:
+                channel_ids = plan_channels(self.channel_ids, quota, cached_channels=playlists)
+
+                missing = [channel_id for channel_id in channel_ids if channel_id not in playlists]
+                if missing:
+                    playlists.update(await client.get_uploads_playlists(missing))
+
+                queue = asyncio.Queue(maxsize=QUEUE_PAGES * MAX_IDS_PER_REQUEST)
+                completed, deferred = {}, []
+                producers = [
+                    asyncio.create_task(self._stream_channel(
+                        client, channel_id, playlists.get(channel_id),
+                        max(published_after, watermarks.get(channel_id, published_after)),
+                        queue, report, completed,
+                    ))
+                    for channel_id in channel_ids
+                ]
+                # 상세 조회는 최대 QUEUE_PAGES개 묶음까지 겹쳐서 (그 이상 밀리면 큐 소비를 멈춤)
+                pending = set()
+                async for batch in self._stream_videos(producers, queue):
+                    if len(pending) >= QUEUE_PAGES:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            task.result()
+                    pending.add(asyncio.create_task(self._add_batch(client, batch, report, scorer, deferred)))
+                if pending:
+                    await asyncio.gather(*pending)
+
+                await self._retry_deferred(client, report, scorer, deferred, published_after)
+                if self.state is not None:
+                    # 모든 묶음을 처리한 뒤, 끝까지 조회한 채널만 워터마크를 당긴다
+                    self.state.advance_watermarks(completed)
+                    await self._rescore_tracked(client, scorer, published_after)
+                    # 아직 안 보낸 키워드 중에서 점수 순으로 (이미 보낸 키워드가 상위를 차지해도 새 키워드가 밀리지 않게)
+                    self.state.record_keywords(report.keyword_counts())
+                    report.trending = scorer.top(self.top_k, keywords=self.state.pending_keywords(self.days_to_monitor))
+                else:
+                    report.trending = scorer.top(self.top_k)
+                request_count = client.request_count
+        finally:
+            self.cache.save(quota)
+
+        logging.info(
+            f"{report.channels_scanned}개 채널, 영상 {report.videos_scanned}개 조회 "
+            f"(API 요청 {request_count}회, 쿼터 {quota.to_dict()['by_endpoint']} / 오늘 {quota.used}/{quota.daily_limit}, "
+            f"{time.perf_counter() - started:.2f}초, 실패 채널 {len(report.failed_channels)}개)"
+        )
+        return report
+
+    def run(self):
+        return asyncio.run(self.collect())
@@ -0,0 +1,82 @@
+"""
+영상 제목 키워드 추출 및 채널 통합 키워드 리포트
+"""
+
+import re
+
+
+def extract_keyword_before_추천(title):
+    """
+    제목에서 '추천' 앞에 오는 키워드만 추출
+    """
+    if "추천" in title:
+        match = re.search(r'(.+?)\s*추천', title)
+        if match:
+            return match.group(1).strip()
+    return None
+
+
+def normalize_keyword(keyword):
+    """같은 키워드 판단용 (공백/대소문자 무시: '무선 이어폰' == '무선이어폰')"""
+    return ''.join(keyword.split()).lower()
+
+
+class KeywordReport:
+    """여러 채널의 영상에서 뽑은 키워드를 하나로 합친 리포트
+
+    같은 키워드는 한 번만 남기고, 몇 개 영상/채널에서 나왔는지 함께 센다.
+    """
+
+    def __init__(self):
+        # 키워드 -> {'count', 'channels', 'videos'} (처음 나온 순서 유지)
+        self.entries = {}
+        # 정규화한 키워드 -> 처음 나온 표기
+        self._display = {}
+        # 조회수 속도 기반 상위 키워드 (trending.TrendingScorer.top, 점수를 매긴 경우에만)
+        self.trending = []
+        self.videos_scanned = 0
+        self.channels_scanned = 0
+        self.failed_channels = []
+
+    def add_video(self, channel_id, video_id, title):
+        self.videos_scanned += 1
+        keyword = extract_keyword_before_추천(title)
+        if not keyword:
+            return None
+
+        keyword = self._display.setdefault(normalize_keyword(keyword), keyword)
+        entry = self.entries.setdefault(keyword, {'count': 0, 'channels': set(), 'videos': []})
+        entry['count'] += 1
+        entry['channels'].add(channel_id)
+        entry['videos'].append(video_id)
+        return keyword
+
+    def add_channel(self, channel_id, error=None):
+        self.channels_scanned += 1
+        if error is not None:
+            self.failed_channels.append(channel_id)
+
+    def keywords(self):
+        """많이 나온 키워드 순 (같으면 먼저 나온 순)"""
+        ranked = sorted(self.entries.items(), key=lambda item: -item[1]['count'])
+        return [keyword for keyword, _ in ranked]
+
+    def keyword_counts(self):
+        """키워드 -> 나온 영상 수 (많이 나온 순)"""
+        return {keyword: self.entries[keyword]['count'] for keyword in self.keywords()}
+
+    def summary(self):
+        return {
+            'channels': self.channels_scanned,
+            'failed_channels': len(self.failed_channels),
+            'videos': self.videos_scanned,
+            'keywords': [
+                {
+                    'keyword': keyword,
+                    'count': self.entries[keyword]['count'],
+                    'channels': len(self.entries[keyword]['channels']),
+                }
+                for keyword in self.keywords()
+            ],
+            'trending': self.trending,
+        }
@@ -0,0 +1,263 @@
+"""
+YouTube Data API 목 서버 (테스트/부하 실험용)
+
+채널 ID마다 결정적인 가짜 영상 목록을 만들어 실제 API와 같은 경로/응답 형태로 내려준다.
+API 키나 쿼터 없이 여러 채널 동시 조회를 시험할 때 쓴다.
+
+    python mock_youtube_server.py --port 8799 --latency 0.05
+    YOUTUBE_API_BASE_URL=http://127.0.0.1:8799/youtube/v3 YOUTUBE_CHANNEL_IDS=UC1,UC2 python youtube_keyword_monitor_once.py
+
+GET /__stats 는 엔드포인트별 요청 수를 돌려준다.
+테스트에서는 MockYouTubeData.upload로 새 영상을 올리고, missing_channels로 조회에 실패하는 채널을 만든다.
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = '/youtube/v3'
+
+PRODUCT_KEYWORDS = [
+    '무선 이어폰', '로봇청소기', '에어프라이어', '캠핑 의자', '전동 칫솔',
+    '가습기', '게이밍 마우스', '휴대용 선풍기', '제습기', '블루투스 스피커',
+]
+
+
+def _parse_time(value):
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+
+
+def _format_time(value):
+    return value.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class MockYouTubeData:
+    """채널별 가짜 영상 (채널 ID 해시로 키워드/조회수를 정해 실행할 때마다 같은 결과)"""
+
+    def __init__(self, videos_per_channel=8, interval_hours=6, now=None, missing_channels=()):
+        self.videos_per_channel = videos_per_channel
+        self.interval_hours = interval_hours
+        self.now = now or datetime.now(timezone.utc).replace(microsecond=0)
+        # 업로드 재생목록 조회가 404(playlistNotFound)로 실패하는 채널
+        self.missing_channels = set(missing_channels)
+        self._cache = {}
+        self._by_id = {}
+        self._lock = threading.Lock()
+        self._uploads = 0
+
+    def channel_videos(self, channel_id):
+        """최신순 영상 목록"""
+        with self._lock:
+            videos = self._cache.get(channel_id)
+            if videos is None:
+                videos = self._cache[channel_id] = self._generate(channel_id)
+                self._by_id.update((video['videoId'], video) for video in videos)
+            return videos
+
+    def upload(self, channel_id, keyword, views=1000):
+        """채널에 새 영상 하나를 올림 (지금까지의 어떤 영상보다 최신), 영상 ID 반환"""
+        videos = self.channel_videos(channel_id)
+        with self._lock:
+            self._uploads += 1
+            published_at = datetime.now(timezone.utc).replace(microsecond=0)
+            if videos:
+                published_at = max(published_at, _parse_time(videos[0]['publishedAt']) + timedelta(minutes=1))
+            video = {
+                'videoId': f"{channel_id[-6:]}n{self._uploads:04d}",
+                'channelId': channel_id,
+                'title': f"{keyword} 추천 BEST 5 (2025)",
+                'publishedAt': _format_time(published_at),
+                'viewCount': views,
+                'likeCount': views // 40,
+            }
+            videos.insert(0, video)
+            self._by_id[video['videoId']] = video
+        return video['videoId']
+
+    def _generate(self, channel_id):
+        seed = int(hashlib.sha1(channel_id.encode('utf-8')).hexdigest(), 16)
+        videos = []
+        for index in range(self.videos_per_channel):
+            keyword = PRODUCT_KEYWORDS[(seed + index * 3) % len(PRODUCT_KEYWORDS)]
+            # 세 번째 영상마다 '추천'이 없는 제목
+            title = f"{keyword} 언박싱 솔직 후기" if index % 3 == 2 else f"{keyword} 추천 BEST 5 (2025)"
+            published_at = self.now - timedelta(hours=self.interval_hours * index + seed % 5)
+            views = 200 + (seed >> index) % 50000
+            videos.append({
+                'videoId': f"{channel_id[-6:]}v{index:04d}",
+                'channelId': channel_id,
+                'title': title,
+                'publishedAt': _format_time(published_at),
+                'viewCount': views,
+                'likeCount': views // 40,
+            })
+        return videos
+
+    def channels(self, channel_ids):
+        return {
+            'kind': 'youtube#channelListResponse',
+            'items': [
+                {
+                    'kind': 'youtube#channel',
+                    'id': channel_id,
+                    # 실제 API처럼 업로드 재생목록 ID는 채널 ID의 'UC'를 'UU'로 바꾼 것
+                    'contentDetails': {'relatedPlaylists': {'uploads': 'UU' + channel_id[2:]}},
+                }
+                for channel_id in channel_ids
+            ],
+        }
+
+    def playlist_items(self, playlist_id, max_results=5, page_token=None):
+        videos = self.channel_videos('UC' + playlist_id[2:])
+        start = int(page_token or 0)
+        page = videos[start:start + max_results]
+        response = {
+            'kind': 'youtube#playlistItemListResponse',
+            'pageInfo': {'totalResults': len(videos), 'resultsPerPage': max_results},
+            'items': [
+                {
+                    'kind': 'youtube#playlistItem',
+                    'snippet': dict(self._snippet(video), resourceId={'kind': 'youtube#video', 'videoId': video['videoId']}),
+                    'contentDetails': {'videoId': video['videoId'], 'videoPublishedAt': video['publishedAt']},
+                }
+                for video in page
+            ],
+        }
+        if start + max_results < len(videos):
+            response['nextPageToken'] = str(start + max_results)
+        return response
+
+    def videos(self, video_ids):
+        items = []
+        for video_id in video_ids:
+            with self._lock:
+                video = self._by_id.get(video_id)
+            if video is None:
+                continue
+            items.append({
+                'kind': 'youtube#video',
+                'id': video_id,
+                'snippet': self._snippet(video),
+                # 실제 API도 통계 값은 문자열
+                'statistics': {'viewCount': str(video['viewCount']), 'likeCount': str(video['likeCount'])},
+            })
+        return {'kind': 'youtube#videoListResponse', 'items': items}
+
+    @staticmethod
+    def _snippet(video):
+        return {
+            'publishedAt': video['publishedAt'],
+            'channelId': video['channelId'],
+            'title': video['title'],
+        }
+
+
+class MockYouTubeHandler(BaseHTTPRequestHandler):
+    data = None
+    latency = 0.0
+    request_counts = Counter()
+    counts_lock = threading.Lock()
+    # 동시에 처리 중인 API 요청 수와 그 최댓값 (동시 조회 확인용)
+    in_flight = {'current': 0, 'max': 0}
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+
+        if parsed.path == '/__stats':
+            with self.counts_lock:
+                self._send_json(200, dict(self.request_counts))
+            return
+        if not parsed.path.startswith(API_PREFIX + '/'):
+            self._send_json(404, {'error': {'code': 404, 'message': 'Not Found'}})
+            return
+
+        endpoint = parsed.path[len(API_PREFIX) + 1:]
+        with self.counts_lock:
+            self.request_counts[endpoint] += 1
+            self.in_flight['current'] += 1
+            self.in_flight['max'] = max(self.in_flight['max'], self.in_flight['current'])
+        try:
+            self._handle_api(endpoint, query)
+        finally:
+            with self.counts_lock:
+                self.in_flight['current'] -= 1
+
+    def _handle_api(self, endpoint, query):
+        if self.latency:
+            time.sleep(self.latency)
+
+        if not query.get('key'):
+            self._send_json(403, {'error': {'code': 403, 'message': 'API key required'}})
+        elif endpoint == 'channels':
+            self._send_json(200, self.data.channels(self._ids(query)))
+        elif endpoint == 'playlistItems' and 'UC' + query.get('playlistId', '')[2:] in self.data.missing_channels:
+            self._send_json(404, {'error': {'code': 404, 'message': 'playlistNotFound'}})
+        elif endpoint == 'playlistItems':
+            self._send_json(200, self.data.playlist_items(
+                query.get('playlistId', ''),
+                max_results=min(int(query.get('maxResults', '5')), 50),
+                page_token=query.get('pageToken'),
+            ))
+        elif endpoint == 'videos':
+            self._send_json(200, self.data.videos(self._ids(query)))
+        else:
+            self._send_json(404, {'error': {'code': 404, 'message': f'Unknown endpoint: {endpoint}'}})
+
+    @staticmethod
+    def _ids(query):
+        return [value for value in query.get('id', '').split(',') if value][:50]
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server(host='127.0.0.1', port=0, latency=0.0, videos_per_channel=8, interval_hours=6, missing_channels=()):
+    """백그라운드 스레드에서 목 서버 시작 (port=0이면 빈 포트), 서버 객체 반환
+
+    서버 주소의 API 기준 URL은 f"http://{host}:{server.server_address[1]}/youtube/v3"
+    가짜 데이터/요청 수는 server.RequestHandlerClass의 data, request_counts, in_flight로 볼 수 있다.
+    """
+    handler = type('BoundMockYouTubeHandler', (MockYouTubeHandler,), {
+        'data': MockYouTubeData(videos_per_channel, interval_hours, missing_channels=missing_channels),
+        'latency': latency,
+        'request_counts': Counter(),
+        'counts_lock': threading.Lock(),
+        'in_flight': {'current': 0, 'max': 0},
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="YouTube Data API 목 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8799)
+    parser.add_argument('--latency', type=float, default=0.0, help="요청마다 지연 (초)")
+    parser.add_argument('--videos-per-channel', type=int, default=8)
+    parser.add_argument('--interval-hours', type=float, default=6)
+    args = parser.parse_args()
+
+    server = start_mock_server(args.host, args.port, args.latency, args.videos_per_channel, args.interval_hours)
+    print(f"🧪 YouTube 목 서버 실행 중: http://{args.host}:{server.server_address[1]}{API_PREFIX}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,135 @@
+"""
+YouTube Data API 쿼터 관리
+
+엔드포인트별 비용(search 100, 나머지 목록 조회 1)으로 하루 사용량을 세고,
+실행 전에 채널 수로 필요한 요청을 추정해 남은 쿼터 안에 들어오도록 채널 수를 줄인다.
+쿼터는 태평양 시간 자정에 초기화되므로 사용량도 그 날짜 기준으로 저장한다.
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from youtube_api import MAX_IDS_PER_REQUEST, YouTubeAPIError
+
+# https://developers.google.com/youtube/v3/determine_quota_cost
+QUOTA_COSTS = {
+    'search': 100,
+    'channels': 1,
+    'playlistItems': 1,
+    'videos': 1,
+}
+
+QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'youtube_cache.json')
+
+
+class QuotaExceeded(YouTubeAPIError):
+    """이번 요청을 보내면 하루 쿼터를 넘음"""
+
+
+def quota_day():
+    return datetime.now(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+
+class QuotaTracker:
+    def __init__(self, daily_limit=10000, used=0, by_endpoint=None, day=None):
+        self.daily_limit = daily_limit
+        self.day = day or quota_day()
+        self.used = used
+        self.by_endpoint = dict(by_endpoint or {})
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self):
+        return max(self.daily_limit - self.used, 0)
+
+    def reserve(self, endpoint):
+        """요청 하나의 비용을 차감 (한도를 넘으면 QuotaExceeded, 날짜가 바뀌면 초기화)"""
+        cost = QUOTA_COSTS.get(endpoint, 1)
+        with self._lock:
+            today = quota_day()
+            if today != self.day:
+                self.day, self.used, self.by_endpoint = today, 0, {}
+            if self.used + cost > self.daily_limit:
+                raise QuotaExceeded(f"일일 쿼터 초과: {endpoint} 비용 {cost}, 남은 쿼터 {self.remaining}")
+            self.used += cost
+            self.by_endpoint[endpoint] = self.by_endpoint.get(endpoint, 0) + cost
+
+    def to_dict(self):
+        return {'day': self.day, 'used': self.used, 'by_endpoint': dict(self.by_endpoint)}
+
+
+def estimate_cost(channel_count, uncached_channels=0, pages_per_channel=1, videos_per_channel=5):
+    """playlistItems 경로로 채널들을 훑는 데 드는 쿼터 추정치"""
+    channels_calls = math.ceil(uncached_channels / MAX_IDS_PER_REQUEST)
+    playlist_calls = channel_count * pages_per_channel
+    videos_calls = math.ceil(channel_count * videos_per_channel / MAX_IDS_PER_REQUEST)
+    return (channels_calls * QUOTA_COSTS['channels']
+            + playlist_calls * QUOTA_COSTS['playlistItems']
+            + videos_calls * QUOTA_COSTS['videos'])
+
+
+def plan_channels(channel_ids, quota, cached_channels=(), pages_per_channel=1, videos_per_channel=5):
+    """남은 쿼터 안에 들어오는 만큼의 채널 (앞에서부터, 줄였으면 로그)"""
+    cached = set(cached_channels)
+
+    def cost(count):
+        uncached = sum(1 for channel in channel_ids[:count] if channel not in cached)
+        return estimate_cost(count, uncached, pages_per_channel, videos_per_channel)
+
+    # 채널 수에 대해 비용이 단조 증가하므로 이분 탐색
+    low, high = 0, len(channel_ids)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if cost(middle) <= quota.remaining:
+            low = middle
+        else:
+            high = middle - 1
+
+    planned = list(channel_ids[:low])
+    if len(planned) < len(channel_ids):
+        logging.warning(
+            f"남은 쿼터({quota.remaining})로 {len(channel_ids)}개 중 {len(planned)}개 채널만 조회합니다."
+        )
+    return planned
+
+
+class ChannelCache:
+    """채널별 업로드 재생목록 ID와 오늘 쿼터 사용량을 실행 사이에 보관하는 JSON 파일"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.uploads_playlists = {}
+        self.quota = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+                self.uploads_playlists = data.get('uploads_playlists', {})
+                self.quota = data.get('quota', {})
+            except (OSError, ValueError) as e:
+                logging.warning(f"채널 캐시를 읽지 못해 새로 만듭니다 ({path}): {e}")
+
+    @classmethod
+    def from_env(cls):
+        return cls(os.getenv('YOUTUBE_CACHE_PATH', DEFAULT_CACHE_PATH))
+
+    def quota_tracker(self, daily_limit):
+        """저장된 오늘 사용량에서 이어 세는 쿼터 추적기"""
+        if self.quota.get('day') == quota_day():
+            return QuotaTracker(daily_limit, self.quota.get('used', 0), self.quota.get('by_endpoint'))
+        return QuotaTracker(daily_limit)
+
+    def save(self, quota=None):
+        if quota is not None:
+            self.quota = quota.to_dict()
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump({'uploads_playlists': self.uploads_playlists, 'quota': self.quota}, f, ensure_ascii=False, indent=2)
+        os.replace(temporary, self.path)
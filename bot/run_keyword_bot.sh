@@ -7,7 +7,9 @@
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 BOT_DIR="$SCRIPT_DIR"
 VENV_DIR="$BOT_DIR/venv"
-LOG_FILE="$BOT_DIR/cron_execution.log"
+LOG_DIR="$BOT_DIR/logs"
+LOG_FILE="$LOG_DIR/cron_execution.log"
+mkdir -p "$LOG_DIR"
 
 # 로그 함수
 log_message() {
@@ -0,0 +1,249 @@
+"""
+모니터링 봇 상태 저장소 (SQLite)
+
+실행마다 최근 DAYS_TO_MONITOR일을 다시 훑지 않도록 실행 사이에 다음을 보관한다.
+- 이미 처리한 영상 ID (모니터링 기간 안의 영상만, 기간을 벗어나면 삭제)
+- 채널별 마지막으로 본 업로드 시각 (다음 실행은 그 이후만 조회, 채널 조회를 끝까지 마친 뒤에만 갱신)
+- 상세 조회에 실패해 아직 점수를 못 매긴 영상 (다음 실행에서 다시 조회)
+- 키워드별 처음/마지막으로 본 시각과 마지막으로 보낸 시각 (새 키워드만 전송)
+- 키워드가 나온 영상의 조회수/좋아요 스냅샷 (실행 사이 조회수 증가 속도 계산)
+
+시각은 모두 API와 같은 UTC 'YYYY-MM-DDTHH:MM:SSZ' 문자열이라 그대로 비교할 수 있다.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+DEFAULT_STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'youtube_state.db')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen_videos (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    published_at TEXT NOT NULL,
+    first_seen_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS channel_watermarks (
+    channel_id TEXT PRIMARY KEY,
+    last_published_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    keyword TEXT PRIMARY KEY,
+    first_seen_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL,
+    video_count INTEGER NOT NULL DEFAULT 0,
+    emitted_at TEXT
+);
+CREATE TABLE IF NOT EXISTS tracked_videos (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    published_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pending_videos (
+    video_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    published_at TEXT NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS video_snapshots (
+    video_id TEXT NOT NULL,
+    captured_at TEXT NOT NULL,
+    view_count INTEGER NOT NULL,
+    like_count INTEGER NOT NULL,
+    PRIMARY KEY (video_id, captured_at)
+);
+"""
+
+# SQLite 바인딩 변수 개수 제한(오래된 버전 999)보다 작게 나눠서 조회
+QUERY_CHUNK_SIZE = 500
+
+
+def utc_now_iso(delta=None):
+    now = datetime.now(timezone.utc)
+    if delta is not None:
+        now -= delta
+    return now.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class MonitorState:
+    def __init__(self, path=DEFAULT_STATE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_env(cls):
+        return cls(os.getenv('YOUTUBE_STATE_PATH', DEFAULT_STATE_PATH))
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def watermarks(self):
+        """채널 ID -> 마지막으로 본 업로드 시각"""
+        return dict(self._conn.execute('SELECT channel_id, last_published_at FROM channel_watermarks'))
+
+    def seen_video_ids(self, video_ids):
+        """video_ids 중 이미 처리한 영상 ID"""
+        video_ids = list(video_ids)
+        seen = set()
+        for start in range(0, len(video_ids), QUERY_CHUNK_SIZE):
+            chunk = video_ids[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            seen.update(row[0] for row in self._conn.execute(
+                f'SELECT video_id FROM seen_videos WHERE video_id IN ({placeholders})', chunk
+            ))
+        return seen
+
+    def record_videos(self, videos):
+        """처리한 영상 기록 [(video_id, channel_id, published_at), ...]"""
+        now = utc_now_iso()
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO seen_videos (video_id, channel_id, published_at, first_seen_at) VALUES (?, ?, ?, ?)',
+                [(video_id, channel_id, published_at, now) for video_id, channel_id, published_at in videos]
+            )
+
+    def advance_watermarks(self, latest):
+        """채널 ID -> 이번 실행에서 본 가장 최근 업로드 시각 (조회를 끝까지 마친 채널만 넘긴다)
+
+        도중에 실패한 채널의 워터마크를 당기면 실패 지점보다 오래된 영상을 다음 실행에서 건너뛰게 된다.
+        """
+        now = utc_now_iso()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO channel_watermarks (channel_id, last_published_at, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT(channel_id) DO UPDATE SET
+                    last_published_at = MAX(last_published_at, excluded.last_published_at),
+                    updated_at = excluded.updated_at
+                """,
+                [(channel_id, published_at, now) for channel_id, published_at in latest.items()]
+            )
+
+    def defer_videos(self, videos):
+        """상세 조회에 실패한 영상 [(video_id, channel_id, published_at, title), ...] (다시 조회할 때까지 보관)"""
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO pending_videos (video_id, channel_id, published_at, title) VALUES (?, ?, ?, ?)',
+                list(videos)
+            )
+
+    def pending_videos(self, published_after):
+        """다시 조회할 영상 [(video_id, channel_id, published_at, title), ...]"""
+        return self._conn.execute(
+            'SELECT video_id, channel_id, published_at, title FROM pending_videos WHERE published_at > ?',
+            (published_after,)
+        ).fetchall()
+
+    def resolve_pending(self, video_ids):
+        """다시 조회해 처리한 (또는 삭제/비공개로 사라진) 영상"""
+        with self._conn:
+            self._conn.executemany('DELETE FROM pending_videos WHERE video_id = ?', [(video_id,) for video_id in video_ids])
+
+    def record_keywords(self, counts):
+        """이번 실행에서 나온 키워드 {키워드: 영상 수} (처음 본 시각은 유지, 마지막 본 시각 갱신)"""
+        now = utc_now_iso()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO keywords (keyword, first_seen_at, last_seen_at, video_count) VALUES (?, ?, ?, ?)
+                ON CONFLICT(keyword) DO UPDATE SET
+                    last_seen_at = excluded.last_seen_at,
+                    video_count = video_count + excluded.video_count
+                """,
+                [(keyword, now, now, count) for keyword, count in counts.items()]
+            )
+
+    def pending_keywords(self, quiet_days):
+        """보낼 키워드: 최근 quiet_days일 안에 나왔는데 아직 안 보냈거나 보낸 지 quiet_days일이 지난 것
+
+        전송에 실패해 mark_emitted가 안 된 키워드는 다음 실행에서 다시 나온다.
+        """
+        cutoff = utc_now_iso(timedelta(days=quiet_days))
+        rows = self._conn.execute(
+            """
+            SELECT keyword FROM keywords
+            WHERE last_seen_at >= ? AND (emitted_at IS NULL OR emitted_at < ?)
+            ORDER BY last_seen_at DESC, video_count DESC, first_seen_at
+            """,
+            (cutoff, cutoff)
+        )
+        return [row[0] for row in rows]
+
+    def mark_emitted(self, keywords):
+        now = utc_now_iso()
+        with self._conn:
+            self._conn.executemany(
+                'UPDATE keywords SET emitted_at = ? WHERE keyword = ?', [(now, keyword) for keyword in keywords]
+            )
+
+    def track_videos(self, videos):
+        """조회수 속도를 계속 볼 영상 [(video_id, channel_id, keyword, published_at), ...]"""
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO tracked_videos (video_id, channel_id, keyword, published_at) VALUES (?, ?, ?, ?)',
+                list(videos)
+            )
+
+    def tracked_videos(self, published_after):
+        """published_after 이후 게시된 추적 영상 [(video_id, channel_id, keyword, published_at), ...]"""
+        return self._conn.execute(
+            'SELECT video_id, channel_id, keyword, published_at FROM tracked_videos WHERE published_at > ?',
+            (published_after,)
+        ).fetchall()
+
+    def latest_snapshots(self, video_ids):
+        """영상 ID -> 가장 최근 스냅샷 (captured_at, view_count, like_count)"""
+        video_ids = list(video_ids)
+        snapshots = {}
+        for start in range(0, len(video_ids), QUERY_CHUNK_SIZE):
+            chunk = video_ids[start:start + QUERY_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            # SQLite는 MAX()와 같이 고른 행의 다른 열을 그대로 돌려준다
+            for video_id, captured_at, views, likes in self._conn.execute(
+                f"""
+                SELECT video_id, MAX(captured_at), view_count, like_count FROM video_snapshots
+                WHERE video_id IN ({placeholders}) GROUP BY video_id
+                """,
+                chunk
+            ):
+                snapshots[video_id] = (captured_at, views, likes)
+        return snapshots
+
+    def record_snapshots(self, snapshots, captured_at=None):
+        """조회수 스냅샷 저장 [(video_id, view_count, like_count), ...]"""
+        captured_at = captured_at or utc_now_iso()
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO video_snapshots (video_id, captured_at, view_count, like_count) VALUES (?, ?, ?, ?)',
+                [(video_id, captured_at, views, likes) for video_id, views, likes in snapshots]
+            )
+
+    def prune_tracked(self, published_after):
+        """모니터링 기간을 벗어난 처리/추적/재시도 영상과 스냅샷 삭제
+
+        그보다 오래된 영상은 조회 범위(워터마크와 모니터링 기간 중 늦은 쪽) 밖이라 다시 나오지 않는다.
+        """
+        with self._conn:
+            self._conn.execute('DELETE FROM seen_videos WHERE published_at <= ?', (published_after,))
+            self._conn.execute('DELETE FROM pending_videos WHERE published_at <= ?', (published_after,))
+            self._conn.execute(
+                'DELETE FROM video_snapshots WHERE video_id IN (SELECT video_id FROM tracked_videos WHERE published_at <= ?)',
+                (published_after,)
+            )
+            self._conn.execute('DELETE FROM tracked_videos WHERE published_at <= ?', (published_after,))
+
+    def stats(self):
+        return {
+            table: self._conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table in ('seen_videos', 'channel_watermarks', 'keywords', 'tracked_videos', 'video_snapshots', 'pending_videos')
+        }
@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+BOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BOT_DIR not in sys.path:
+    sys.path.insert(0, BOT_DIR)
+
+from channel_monitor import MultiChannelKeywordMonitor  # noqa: E402
+from mock_youtube_server import API_PREFIX, start_mock_server  # noqa: E402
+from quota import ChannelCache  # noqa: E402
+from state_store import MonitorState  # noqa: E402
+from youtube_api import AsyncYouTubeClient  # noqa: E402
+
+
+class MockYouTube:
+    """테스트마다 띄우는 목 서버와 그 서버를 가리키는 모니터 생성기"""
+
+    def __init__(self, tmp_path, **options):
+        self.server = start_mock_server(**options)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}{API_PREFIX}"
+        self.handler = self.server.RequestHandlerClass
+        self.state = MonitorState(str(tmp_path / 'state.db'))
+        self.cache_path = str(tmp_path / 'cache.json')
+
+    @property
+    def data(self):
+        return self.handler.data
+
+    @property
+    def request_counts(self):
+        return dict(self.handler.request_counts)
+
+    def monitor(self, channel_ids, max_concurrency=10, **kwargs):
+        kwargs.setdefault('state', self.state)
+        return MultiChannelKeywordMonitor(
+            'test-key', channel_ids,
+            cache=ChannelCache(self.cache_path),
+            client_factory=lambda quota: AsyncYouTubeClient(
+                'test-key', base_url=self.base_url, max_concurrency=max_concurrency, max_retries=0, quota=quota
+            ),
+            **kwargs
+        )
+
+    def close(self):
+        self.state.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def mock_youtube(tmp_path):
+    """목 서버 옵션(latency, missing_channels 등)을 받아 MockYouTube를 만드는 함수"""
+    instances = []
+
+    def start(**options):
+        instance = MockYouTube(tmp_path, **options)
+        instances.append(instance)
+        return instance
+
+    yield start
+    for instance in instances:
+        instance.close()
@@ -0,0 +1,89 @@
+from quota import QUOTA_COSTS, ChannelCache
+
+CHANNELS = [f'UC_channel{i:02d}' for i in range(12)]
+
+
+def test_channels_are_fetched_concurrently(mock_youtube):
+    youtube = mock_youtube(latency=0.05)
+
+    report = youtube.monitor(CHANNELS, max_concurrency=4).run()
+
+    assert report.channels_scanned == len(CHANNELS)
+    assert report.videos_scanned == len(CHANNELS) * 8
+    # 세마포어 한도까지 겹쳐서 요청하고 그 이상은 보내지 않는다
+    assert 1 < youtube.handler.in_flight['max'] <= 4
+
+
+def test_quota_matches_requests_sent(mock_youtube):
+    youtube = mock_youtube()
+
+    youtube.monitor(CHANNELS).run()
+
+    quota = ChannelCache(youtube.cache_path).quota
+    requests = youtube.request_counts
+    assert quota['by_endpoint'] == {endpoint: count * QUOTA_COSTS[endpoint] for endpoint, count in requests.items()}
+    assert quota['used'] == sum(quota['by_endpoint'].values())
+    # 채널 12개의 재생목록 ID는 channels 한 번, 영상 상세는 50개씩 묶어서
+    assert requests['channels'] == 1
+    assert requests['playlistItems'] == len(CHANNELS)
+    assert requests['videos'] == 2
+
+
+def test_channels_are_cut_to_fit_the_remaining_quota(mock_youtube):
+    youtube = mock_youtube()
+
+    report = youtube.monitor(CHANNELS, daily_quota=6).run()
+
+    assert 0 < report.channels_scanned < len(CHANNELS)
+    assert ChannelCache(youtube.cache_path).quota['used'] <= 6
+
+
+def test_second_run_returns_only_new_videos(mock_youtube):
+    youtube = mock_youtube()
+    channels = CHANNELS[:3]
+
+    first = youtube.monitor(channels).run()
+    second = youtube.monitor(channels).run()
+    video_id = youtube.data.upload(channels[1], '접이식 자전거')
+    third = youtube.monitor(channels).run()
+
+    assert first.videos_scanned == 24
+    assert second.videos_scanned == 0
+    assert second.keyword_counts() == {}
+    assert third.videos_scanned == 1
+    assert third.keyword_counts() == {'접이식 자전거': 1}
+    assert third.entries['접이식 자전거']['videos'] == [video_id]
+    # 이미 보낸 적 없는 새 키워드라 트렌딩 후보에 오른다
+    assert '접이식 자전거' in [entry['keyword'] for entry in third.trending]
+
+
+def test_failing_channel_does_not_affect_others(mock_youtube):
+    youtube = mock_youtube(missing_channels={'UC_channel01'})
+    channels = CHANNELS[:3]
+
+    report = youtube.monitor(channels).run()
+
+    assert report.failed_channels == ['UC_channel01']
+    assert report.channels_scanned == 3
+    assert report.videos_scanned == 16
+    # 실패한 채널은 워터마크를 남기지 않아 다음 실행에서 처음부터 다시 조회한다
+    assert sorted(youtube.state.watermarks()) == ['UC_channel00', 'UC_channel02']
+
+    youtube.data.missing_channels.clear()
+    retry = youtube.monitor(channels).run()
+
+    assert retry.failed_channels == []
+    assert retry.videos_scanned == 8
+    assert {entry_channel for entry in retry.entries.values() for entry_channel in entry['channels']} == {'UC_channel01'}
+
+
+def test_seen_videos_outside_the_window_are_pruned(mock_youtube):
+    youtube = mock_youtube()
+    channels = CHANNELS[:3]
+
+    youtube.monitor(channels).run()
+    assert youtube.state.stats()['seen_videos'] == 24
+
+    # 6시간 간격 업로드 8개 중 최근 하루(0/6/12/18시간 전) 것만 남는다
+    youtube.monitor(channels, days_to_monitor=1).run()
+    assert youtube.state.stats()['seen_videos'] == 12
@@ -0,0 +1,109 @@
+"""
+조회수 속도 기반 트렌딩 키워드 점수
+
+영상마다 게시 후(또는 지난 실행의 스냅샷 이후) 시간당 조회수/좋아요 증가량을 구해
+시간 감쇠를 곱하고, 키워드별로 합쳐 상위 K개를 고른다.
+- 같은 키워드는 표기(공백/대소문자)가 달라도 하나로 합친다.
+- 한 채널이 같은 키워드로 영상을 여러 개 올려도 그 채널에서 가장 높은 영상 하나만 센다.
+"""
+
+import heapq
+import os
+from datetime import datetime, timezone
+
+from keyword_report import normalize_keyword
+
+# 막 올라온 영상은 경과 시간이 0에 가까워 속도가 튀므로 최소 1시간으로 계산
+MIN_AGE_HOURS = 1.0
+
+
+def parse_iso(value):
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc)
+
+
+def hours_between(start, end):
+    return (parse_iso(end) - parse_iso(start)).total_seconds() / 3600
+
+
+class TrendingScorer:
+    def __init__(self, min_views=50, half_life_hours=24.0, like_weight=10.0, now=None):
+        self.min_views = min_views
+        self.half_life_hours = half_life_hours
+        # 좋아요 1개를 조회수 몇 회로 볼지
+        self.like_weight = like_weight
+        self.now = now or datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        # 정규화한 키워드 -> {'keyword', 'channels': {채널: 최고 점수}, 'videos': set}
+        self._keywords = {}
+        self._videos = set()
+        self.skipped_low_views = 0
+
+    def __contains__(self, video_id):
+        return video_id in self._videos
+
+    @classmethod
+    def from_env(cls, min_views=None):
+        return cls(
+            min_views=int(os.getenv('MIN_VIEWS', '50')) if min_views is None else min_views,
+            half_life_hours=float(os.getenv('TRENDING_HALF_LIFE_HOURS', '24')),
+            like_weight=float(os.getenv('TRENDING_LIKE_WEIGHT', '10')),
+        )
+
+    def video_score(self, published_at, views, likes, previous=None):
+        """시간당 (조회수 + 좋아요 × 가중치) × 감쇠
+
+        previous=(captured_at, views, likes) 스냅샷이 있으면 그 뒤의 증가량으로, 없으면 게시 후 전체로 속도를 낸다.
+        """
+        age_hours = max(hours_between(published_at, self.now), MIN_AGE_HOURS)
+        if previous is not None:
+            captured_at, previous_views, previous_likes = previous
+            elapsed = hours_between(captured_at, self.now)
+            if elapsed > 0:
+                views_per_hour = max(views - previous_views, 0) / max(elapsed, MIN_AGE_HOURS)
+                likes_per_hour = max(likes - previous_likes, 0) / max(elapsed, MIN_AGE_HOURS)
+            else:
+                previous = None
+        if previous is None:
+            views_per_hour = views / age_hours
+            likes_per_hour = likes / age_hours
+
+        decay = 0.5 ** (age_hours / self.half_life_hours)
+        return (views_per_hour + self.like_weight * likes_per_hour) * decay
+
+    def add(self, video_id, channel_id, keyword, published_at, views, likes, previous=None):
+        """영상 하나 반영 (같은 영상은 한 번만, 조회수가 MIN_VIEWS 미만이면 제외), 점수 반환"""
+        if not keyword or video_id in self._videos:
+            return None
+        self._videos.add(video_id)
+        if views < self.min_views:
+            self.skipped_low_views += 1
+            return None
+
+        score = self.video_score(published_at, views, likes, previous)
+        entry = self._keywords.setdefault(normalize_keyword(keyword), {'keyword': keyword, 'channels': {}, 'videos': set()})
+        entry['videos'].add(video_id)
+        entry['channels'][channel_id] = max(entry['channels'].get(channel_id, 0.0), score)
+        return score
+
+    def top(self, k=10, keywords=None):
+        """점수 상위 k개 키워드 (힙으로 선택)
+
+        keywords를 주면 그 키워드들 중에서만 고르고 표기도 keywords 쪽을 따른다 (예: 아직 안 보낸 키워드).
+        """
+        if keywords is None:
+            candidates = ((entry['keyword'], entry) for entry in self._keywords.values())
+        else:
+            candidates = (
+                (keyword, self._keywords[normalize_keyword(keyword)])
+                for keyword in dict.fromkeys(keywords)
+                if normalize_keyword(keyword) in self._keywords
+            )
+        scored = ((sum(entry['channels'].values()), keyword, entry) for keyword, entry in candidates)
+        return [
+            {
+                'keyword': keyword,
+                'score': round(score, 2),
+                'videos': len(entry['videos']),
+                'channels': len(entry['channels']),
+            }
+            for score, keyword, entry in heapq.nlargest(k, scored, key=lambda scored_entry: scored_entry[0])
+        ]
@@ -0,0 +1,151 @@
+"""
+YouTube Data API 비동기 클라이언트
+
+여러 채널을 동시에 조회할 수 있도록 httpx.AsyncClient 하나(커넥션 풀)를 공유하고,
+동시 요청 수는 세마포어로 제한한다. YOUTUBE_API_BASE_URL로 목 서버(mock_youtube_server.py)를
+가리키면 실제 API 키/쿼터 없이 테스트할 수 있다.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+DEFAULT_BASE_URL = 'https://www.googleapis.com/youtube/v3'
+
+# channels/videos는 id를 쉼표로 묶어 한 번에 최대 50개, playlistItems도 페이지당 최대 50개
+MAX_IDS_PER_REQUEST = 50
+
+# 일시적인 오류로 보고 다시 시도할 상태 코드
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 채널 수백 개를 조회하면 httpx가 요청마다 남기는 INFO 로그가 봇 로그를 덮는다
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+
+class YouTubeAPIError(Exception):
+    """재시도 후에도 실패한 API 요청"""
+
+
+def published_after_iso(days):
+    """days일 전 시각 (API의 publishedAfter 형식, UTC)"""
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class AsyncYouTubeClient:
+    def __init__(self, api_key, base_url=None, max_concurrency=10, timeout=10.0, max_retries=2, transport=None, quota=None):
+        self.api_key = api_key
+        # quota.QuotaTracker (있으면 요청마다 비용 차감, 한도를 넘기면 요청하지 않음)
+        self.quota = quota
+        self.base_url = (base_url or os.getenv('YOUTUBE_API_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            transport=transport,
+        )
+        self.request_count = 0
+
+    @classmethod
+    def from_env(cls, api_key=None, **kwargs):
+        """환경 변수로 클라이언트 설정 (YOUTUBE_MAX_CONCURRENCY, YOUTUBE_API_TIMEOUT)"""
+        return cls(
+            api_key or os.getenv('YOUTUBE_API_KEY'),
+            max_concurrency=int(os.getenv('YOUTUBE_MAX_CONCURRENCY', '10')),
+            timeout=float(os.getenv('YOUTUBE_API_TIMEOUT', '10')),
+            **kwargs
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def get(self, endpoint, **params):
+        """GET /{endpoint} (동시 요청 수 제한, 429/5xx는 지수 백오프로 재시도)"""
+        params['key'] = self.api_key
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                if self.quota is not None:
+                    self.quota.reserve(endpoint)
+                self.request_count += 1
+                try:
+                    response = await self._client.get(f'/{endpoint}', params=params)
+                except httpx.TransportError as e:
+                    error = e
+                else:
+                    if response.status_code not in RETRY_STATUS_CODES:
+                        if response.is_error:
+                            raise YouTubeAPIError(f"{endpoint} {response.status_code}: {response.text[:200]}")
+                        return response.json()
+                    error = YouTubeAPIError(f"{endpoint} {response.status_code}")
+
+            if attempt < self.max_retries:
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+        logging.warning(f"YouTube API 요청 실패 ({endpoint}): {error}")
+        raise YouTubeAPIError(str(error))
+
+    async def get_uploads_playlists(self, channel_ids):
+        """채널 ID -> 업로드 재생목록 ID (channels 호출 하나에 50개씩, 없는 채널은 빠짐)"""
+        chunks = [channel_ids[i:i + MAX_IDS_PER_REQUEST] for i in range(0, len(channel_ids), MAX_IDS_PER_REQUEST)]
+        responses = await asyncio.gather(*(
+            self.get('channels', id=','.join(chunk), part='contentDetails', maxResults=MAX_IDS_PER_REQUEST)
+            for chunk in chunks
+        ))
+        return {
+            item['id']: item['contentDetails']['relatedPlaylists']['uploads']
+            for res in responses
+            for item in res.get('items', [])
+        }
+
+    async def iter_recent_uploads(self, playlist_id, published_after, known_ids=None, page_size=MAX_IDS_PER_REQUEST,
+                                  stop_at_known=True):
+        """업로드 재생목록에서 publishedAfter 이후 영상을 최신순으로 하나씩 (async generator)
+
+        다음 페이지는 소비하는 쪽이 지금 페이지를 다 가져간 뒤에야 요청하므로,
+        일찍 멈추면 남은 페이지는 아예 요청하지 않는다.
+        known_ids(ids) -> 이미 처리한 id 집합: 페이지에서 처음 아는 영상이 나오면 거기서 중단
+        (업로드 재생목록은 최신순이라 그보다 오래된 영상은 이미 처리한 것).
+        처리한 영상이 최신순으로 끊김 없이 이어진다고 보장할 수 없으면 stop_at_known=False로
+        아는 영상은 건너뛰기만 하고 publishedAfter까지 계속 넘긴다.
+        """
+        page_token = None
+        while True:
+            params = {'playlistId': playlist_id, 'part': 'snippet,contentDetails', 'maxResults': page_size}
+            if page_token:
+                params['pageToken'] = page_token
+            res = await self.get('playlistItems', **params)
+
+            items = res.get('items', [])
+            known = known_ids([item['contentDetails']['videoId'] for item in items]) if known_ids and items else ()
+            for item in items:
+                # ISO 8601 문자열은 그대로 비교 가능
+                if item['contentDetails'].get('videoPublishedAt', item['snippet']['publishedAt']) <= published_after:
+                    return
+                if item['contentDetails']['videoId'] in known:
+                    if stop_at_known:
+                        return
+                    continue
+                yield item
+
+            page_token = res.get('nextPageToken')
+            if not page_token:
+                return
+
+    async def get_videos(self, video_ids, part='snippet,statistics'):
+        """영상 상세 (videos 호출 하나에 50개씩 묶어 동시에 요청)"""
+        chunks = [video_ids[i:i + MAX_IDS_PER_REQUEST] for i in range(0, len(video_ids), MAX_IDS_PER_REQUEST)]
+        responses = await asyncio.gather(*(
+            self.get('videos', id=','.join(chunk), part=part, maxResults=MAX_IDS_PER_REQUEST) for chunk in chunks
+        ))
+        return [item for res in responses for item in res.get('items', [])]
@@ -1,134 +1,66 @@
 import os
 import requests
 import logging
-import re
 import time
 import schedule
-from datetime import datetime, timedelta
+from datetime import datetime
 from dotenv import load_dotenv
 
+from channel_monitor import MultiChannelKeywordMonitor, load_channel_ids
+from state_store import MonitorState
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
+# 실행 로그 (YOUTUBE_MONITOR_LOG, 기본 bot/logs/youtube_monitor.log - git에서 제외)
+LOG_PATH = os.getenv(
+    'YOUTUBE_MONITOR_LOG', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs', 'youtube_monitor.log')
+)
+os.makedirs(os.path.dirname(os.path.abspath(LOG_PATH)), exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('youtube_monitor.log'),
+        logging.FileHandler(LOG_PATH),
         logging.StreamHandler()
     ]
 )
 
-def extract_keyword_before_추천(title):
-    """
-    제목에서 '추천' 앞에 오는 키워드만 추출
-    """
-    if "추천" in title:
-        match = re.search(r'(.+?)\s*추천', title)
-        if match:
-            return match.group(1).strip()
-    return None
-
 class YouTubeKeywordMonitor:
     def __init__(self):
         self.api_key = os.getenv('YOUTUBE_API_KEY')
-        self.channel_id = os.getenv('YOUTUBE_CHANNEL_ID')
+        # 여러 채널 모니터링 (YOUTUBE_CHANNEL_IDS / YOUTUBE_CHANNELS_FILE, 없으면 YOUTUBE_CHANNEL_ID 하나)
+        self.channel_ids = load_channel_ids()
         self.discord_webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
         self.keywords = os.getenv('KEYWORDS', '').split(',')
         self.min_views = int(os.getenv('MIN_VIEWS', '50'))
         self.days_to_monitor = int(os.getenv('DAYS_TO_MONITOR', '4'))
+        # 이미 처리한 영상/보낸 키워드 (YOUTUBE_STATE_PATH, 기본 bot/youtube_state.db)
+        self.state = MonitorState.from_env()
 
         # 설정 확인을 위한 디버깅 로그
         print("\n🔍 환경 설정 확인:")
         print(f"YouTube API Key: {'설정됨' if self.api_key else '설정되지 않음'}")
-        print(f"Channel ID: {'설정됨' if self.channel_id else '설정되지 않음'}")
+        print(f"Channels: {len(self.channel_ids)}개")
         print(f"Discord Webhook URL: {'설정됨' if self.discord_webhook_url else '설정되지 않음'}")
         print(f"Keywords: {self.keywords}")
         print(f"Min Views: {self.min_views}")
         print(f"Days to Monitor: {self.days_to_monitor}")
         print("-" * 50)
 
-        if not all([self.api_key, self.channel_id, self.discord_webhook_url]):
+        if not all([self.api_key, self.channel_ids, self.discord_webhook_url]):
             raise ValueError("Missing required environment variables")
 
-    def get_recent_videos(self):
-        """Fetch recent videos from the channel"""
-        published_after = (datetime.now() - timedelta(days=self.days_to_monitor)).isoformat("T") + "Z"
-        
-        url = 'https://www.googleapis.com/youtube/v3/search'
-        params = {
-            'key': self.api_key,
-            'channelId': self.channel_id,
-            'order': 'date',
-            'publishedAfter': published_after,
-            'type': 'video',
-            'part': 'snippet',
-            'maxResults': 5
-        }
-        
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            res = response.json()
-            
-            print("\n📺 최근 업로드된 영상:")
-            print("-" * 50)
-            for item in res.get('items', []):
-                title = item['snippet']['title']
-                published_at = item['snippet']['publishedAt']
-                video_id = item['id']['videoId']
-                keyword = extract_keyword_before_추천(title)
-                
-                print(f"제목: {title}")
-                if keyword:
-                    print(f"추출된 키워드: {keyword}")
-                print(f"업로드: {published_at}")
-                print(f"링크: https://youtu.be/{video_id}")
-                print("-" * 50)
-            
-            video_ids = [item['id']['videoId'] for item in res.get('items', [])]
-            return video_ids
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching videos: {e}")
-            return []
-
-    def get_video_details(self, video_ids):
-        """Get detailed information about videos"""
-        url = 'https://www.googleapis.com/youtube/v3/videos'
-        params = {
-            'key': self.api_key,
-            'id': ','.join(video_ids),
-            'part': 'snippet,statistics'
-        }
-
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json().get('items', [])
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching video details: {e}")
-            return []
-
     def contains_keywords(self, text):
         """Check if text contains any of the monitored keywords"""
         return any(keyword.lower() in text.lower() for keyword in self.keywords)
 
-    def collect_trending_keywords(self, videos):
-        """영상들에서 추천 키워드 수집"""
-        keywords = []
-        for item in videos:
-            title = item['snippet']['title']
-            keyword = extract_keyword_before_추천(title)
-            if keyword:
-                keywords.append(keyword)
-        return keywords
-
     def send_to_website(self, keywords):
         """Send keywords to website API"""
         if not keywords:
             logging.info("No keywords to send to website")
-            return
+            return False
             
         website_api_url = os.getenv('WEBSITE_API_URL', 'http://localhost:3000/api/trending-keywords')
         
@@ -142,15 +74,17 @@ class YouTubeKeywordMonitor:
             response.raise_for_status()
             print(f"✅ 웹사이트 전송 성공!")
             logging.info("Successfully sent keywords to website")
+            return True
         except requests.exceptions.RequestException as e:
             print(f"❌ 웹사이트 전송 실패: {str(e)}")
             logging.error(f"Error sending keywords to website: {e}")
+            return False
 
     def send_discord_notification(self, keywords):
         """Send trending keywords notification to Discord"""
         if not keywords:
             logging.info("No keywords to send")
-            return
+            return False
 
         keyword_list = "\n".join([f"◆ {keyword}" for keyword in keywords])
         
@@ -168,58 +102,45 @@ class YouTubeKeywordMonitor:
             response.raise_for_status()
             print(f"✅ 메시지 전송 성공!")
             logging.info("Successfully sent trending keywords notification")
+            return True
         except requests.exceptions.RequestException as e:
             print(f"❌ 메시지 전송 실패: {str(e)}")
             logging.error(f"Error sending Discord notification: {e}")
+            return False
 
     def run(self):
         """Main monitoring loop"""
         logging.info("Starting YouTube keyword monitor...")
         
         try:
-            # YouTube API URL 직접 선언
-            url = 'https://www.googleapis.com/youtube/v3/search'
-            params = {
-                'key': self.api_key,
-                'channelId': self.channel_id,
-                'order': 'date',
-                'publishedAfter': (datetime.now() - timedelta(days=self.days_to_monitor)).isoformat("T") + "Z",
-                'type': 'video',
-                'part': 'snippet',
-                'maxResults': 5
-            }
-            
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            videos = response.json().get('items', [])
+            # 채널들을 동시에 조회해 하나의 키워드 리포트로 합침
+            report = MultiChannelKeywordMonitor(
+                self.api_key, self.channel_ids, days_to_monitor=self.days_to_monitor, state=self.state,
+                min_views=self.min_views
+            ).run()
+            if report.failed_channels:
+                print(f"⚠️ 조회 실패 채널 {len(report.failed_channels)}개: {', '.join(report.failed_channels[:10])}")
             
-            if not videos:
-                logging.info("No recent videos found")
-                return
-
-            print("\n📺 최근 업로드된 영상:")
-            print("-" * 50)
-            keywords = []
-            for item in videos:
-                title = item['snippet']['title']
-                published_at = item['snippet']['publishedAt']
-                video_id = item['id']['videoId']
-                keyword = extract_keyword_before_추천(title)
-                
-                if keyword:
-                    keywords.append(keyword)
-                
-                print(f"제목: {title}")
-                if keyword:
-                    print(f"추출된 키워드: {keyword}")
-                print(f"업로드: {published_at}")
-                print(f"링크: https://youtu.be/{video_id}")
+            if report.videos_scanned:
+                print(f"\n📺 {report.channels_scanned}개 채널의 새 영상 {report.videos_scanned}개 확인")
+                print("-" * 50)
+                for entry in report.summary()['keywords']:
+                    print(f"추출된 키워드: {entry['keyword']} (영상 {entry['count']}개, 채널 {entry['channels']}개)")
                 print("-" * 50)
+            else:
+                logging.info("No new videos since last run")
+
+            # 아직 안 보낸 키워드(새로 나온 것 + 지난번 전송 실패) 중 조회수 증가 속도 상위 K개
+            for rank, entry in enumerate(report.trending, 1):
+                print(f"{rank}. {entry['keyword']} (점수 {entry['score']}, 영상 {entry['videos']}개, 채널 {entry['channels']}개)")
+            keywords = [entry['keyword'] for entry in report.trending]
             
             if keywords:
                 # 디스코드와 웹사이트 모두에 전송
-                self.send_discord_notification(keywords)
-                self.send_to_website(keywords)
+                sent = self.send_discord_notification(keywords)
+                sent = self.send_to_website(keywords) or sent
+                if sent:
+                    self.state.mark_emitted(keywords)
             
         except Exception as e:
             logging.error(f"Error in main execution: {e}")
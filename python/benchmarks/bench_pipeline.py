@@ -0,0 +1,179 @@
+# VIBE 리뷰 분석기 - 수집/분석 파이프라인 벤치마크
+# 저장된 쿠팡 상품/리뷰 페이지를 로컬 스텁 서버로 재생하면서 단계별 처리 속도와 최대 메모리 할당량을 잰다.
+# 메모리는 시간 측정과 별도로 tracemalloc을 켠 한 번의 실행에서 단계마다 잰다
+# (ru_maxrss는 프로세스 전체 누적 최대치라 단계/크기별 값이 될 수 없고, tracemalloc은 시간을 늘린다).
+#
+#   python benchmarks/bench_pipeline.py --sizes 100 1000 10000 --output bench.json
+#   python benchmarks/bench_pipeline.py --baseline bench.json   # 이전 결과와 비교
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from coupang_http import CoupangReviewFetcher  # noqa: E402
+from review_analysis import ReviewAnalyzer  # noqa: E402
+from review_batch import ReviewBatch  # noqa: E402
+from sentiment import get_sentiment_backend  # noqa: E402
+from stub_server import start_stub_server  # noqa: E402
+from tokenizer import KoreanRuleTokenizer  # noqa: E402
+
+PRODUCT_URL = 'https://www.coupang.com/vp/products/1000000001'
+
+STAGES = ('get_product_info', 'crawl_reviews', 'build_batch', 'analyze_sentiment', 'extract_keywords', 'generate_statistics')
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+class StageRunner:
+    """단계별 소요 시간과 (tracemalloc이 켜져 있으면) 최대 메모리 할당량 기록"""
+
+    def __init__(self):
+        self.timings = {}
+        self.peaks_mb = {}
+
+    def run(self, stage: str, fn, *args, **kwargs):
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # 단계 시작 시점에 이미 잡혀 있던 메모리(이전 단계 결과)는 빼고 이 단계의 최대 증가량만 잰다
+            tracemalloc.reset_peak()
+            held = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        value = fn(*args, **kwargs)
+        self.timings[stage] = time.perf_counter() - start
+        if tracing:
+            self.peaks_mb[stage] = (tracemalloc.get_traced_memory()[1] - held) / (1024 * 1024)
+        return value
+
+
+def run_size(fetcher: CoupangReviewFetcher, size: int, keep_duplicate_texts: bool) -> tuple:
+    """한 크기에서 단계별 측정, (수집한 리뷰 수, StageRunner) 반환"""
+    # 토크나이저 메모 캐시가 이전 크기의 결과를 재사용하지 않도록 매번 새로 만든다
+    analyzer = ReviewAnalyzer(sentiment_backend=get_sentiment_backend(), tokenizer=KoreanRuleTokenizer())
+    runner = StageRunner()
+
+    runner.run('get_product_info', fetcher.get_product_info, PRODUCT_URL)
+    # 스텁 서버도 같은 프로세스의 스레드라 수집 단계 할당량에는 서버 쪽 응답 생성분이 섞인다
+    reviews = runner.run('crawl_reviews', fetcher.crawl_reviews, PRODUCT_URL, size)
+
+    if not keep_duplicate_texts:
+        # 재생 페이지는 같은 리뷰가 반복되므로 번호를 붙여 토큰화 캐시 적중을 막는다
+        for number, review in enumerate(reviews):
+            review['text'] = f"{review['text']} {number}"
+
+    # 분석기는 열 단위 묶음으로 동작하므로 변환 시간도 따로 잰다
+    batch = runner.run('build_batch', ReviewBatch.from_records, reviews)
+    sentiment = runner.run('analyze_sentiment', analyzer.analyze_sentiment, batch)
+    polarities = [detail['polarity'] for detail in sentiment['details']]
+    runner.run('extract_keywords', analyzer.extract_keywords, batch, polarities=polarities)
+    runner.run('generate_statistics', analyzer.generate_statistics, batch, {})
+    return len(reviews), runner
+
+
+def compare(results, baseline_path: str):
+    """같은 크기/단계의 이전 결과 대비 처리량 변화 출력"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(row['size'], row['stage']): row for row in baseline['results']}
+
+    print(f"\n기준 결과: {baseline_path} ({baseline.get('revision', 'unknown')})")
+    print(f"{'reviews':>8} | {'stage':<20} | {'before/s':>10} | {'after/s':>10} | {'change':>7}")
+    for row in results:
+        before = previous.get((row['size'], row['stage']))
+        if not before or not before['reviews_per_second']:
+            continue
+        change = row['reviews_per_second'] / before['reviews_per_second'] - 1
+        print(f"{row['size']:>8} | {row['stage']:<20} | {before['reviews_per_second']:>10.0f} | "
+              f"{row['reviews_per_second']:>10.0f} | {change:>+6.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집/분석 파이프라인 벤치마크 (로컬 스텁 서버 재생)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--concurrency', type=int, default=4, help="HTTP 수집 동시 요청 수")
+    parser.add_argument('--repeat', type=int, default=1, help="크기별 반복 횟수 (단계별 최소 시간 사용)")
+    parser.add_argument('--keep-duplicate-texts', action='store_true', help="재생으로 반복된 리뷰 텍스트를 그대로 사용")
+    parser.add_argument('--skip-memory', action='store_true', help="tracemalloc 메모리 측정 실행 생략")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    page_size = 5
+    server = start_stub_server(replay_pages=-(-max(args.sizes) // page_size))
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    fetcher = CoupangReviewFetcher(base_url=base_url, page_size=page_size, concurrency=args.concurrency)
+
+    results = []
+    print(f"{'reviews':>8} | {'stage':<20} | {'seconds':>9} | {'reviews/s':>10} | {'peak alloc (MB)':>15}")
+    try:
+        for size in args.sizes:
+            best = {}
+            collected = 0
+            for _ in range(args.repeat):
+                collected, runner = run_size(fetcher, size, args.keep_duplicate_texts)
+                for stage, seconds in runner.timings.items():
+                    best[stage] = min(seconds, best.get(stage, float('inf')))
+
+            peaks = {}
+            if not args.skip_memory:
+                tracemalloc.start()
+                try:
+                    peaks = run_size(fetcher, size, args.keep_duplicate_texts)[1].peaks_mb
+                finally:
+                    tracemalloc.stop()
+
+            for stage in STAGES:
+                seconds = best[stage]
+                # 상품 정보는 요청 한 번이므로 처리량 대신 시간만 의미 있음
+                per_second = collected / seconds if seconds > 0 and stage != 'get_product_info' else 0
+                peak = peaks.get(stage)
+                results.append({
+                    'size': size,
+                    'reviews': collected,
+                    'stage': stage,
+                    'seconds': round(seconds, 6),
+                    'reviews_per_second': round(per_second, 1),
+                    'peak_alloc_mb': round(peak, 2) if peak is not None else None
+                })
+                peak_text = f"{peak:>15.2f}" if peak is not None else f"{'-':>15}"
+                print(f"{size:>8} | {stage:<20} | {seconds:>9.4f} | {per_second:>10.0f} | {peak_text}")
+    finally:
+        fetcher.close()
+        server.shutdown()
+
+    report = {
+        'benchmark': 'pipeline',
+        'created_at': datetime.now().isoformat(),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'concurrency': args.concurrency,
+        'repeat': args.repeat,
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# VIBE 리뷰 분석기 - 감정 분석 백엔드 벤치마크
+# 한국어 사전 배치 점수기와 기존 TextBlob 경로의 처리 속도를 비교한다.
+#
+#   python benchmarks/bench_sentiment.py --sizes 1000 10000 50000 --textblob-limit 10000
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sentiment import KoreanLexiconBackend, TextBlobBackend  # noqa: E402
+
+SAMPLE_SENTENCES = [
+    "배송이 빨라서 좋았어요.",
+    "포장도 꼼꼼하고 제품 상태도 만족합니다.",
+    "가격 대비 괜찮아요.",
+    "소음이 조금 있지만 쓸만합니다.",
+    "생각보다 작고 마감이 별로예요.",
+    "설명서가 부실해서 조립이 어려웠어요.",
+    "불량품이 와서 반품했어요.",
+    "디자인이 예쁘고 튼튼해요. 추천합니다.",
+    "색상이 사진이랑 조금 달라요.",
+    "재구매 의사 있어요!",
+    "좋지 않은 냄새가 나서 실망했어요.",
+    "그냥 무난해요.",
+]
+
+
+def make_texts(count: int, seed: int = 42):
+    """샘플 문장 1~4개를 섞어 리뷰 텍스트 생성"""
+    rng = random.Random(seed)
+    return [' '.join(rng.choices(SAMPLE_SENTENCES, k=rng.randint(1, 4))) for _ in range(count)]
+
+
+def time_backend(backend, texts, repeat: int = 3) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        backend.score_batch(texts)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감정 분석 백엔드 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--textblob-limit', type=int, default=10000, help="이보다 큰 크기는 TextBlob 측정 생략")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    lexicon = KoreanLexiconBackend()
+    print(f"사전 로드/컴파일: {time.perf_counter() - start:.4f}s ({len(lexicon.lexicon)}개 표현)")
+
+    try:
+        textblob = TextBlobBackend()
+        textblob.score_batch(["warm up"])
+    except ImportError:
+        textblob = None
+        print("textblob 미설치 - TextBlob 측정 생략")
+
+    print(f"{'reviews':>8} | {'lexicon (s)':>11} | {'reviews/s':>10} | {'textblob (s)':>12} | {'speedup':>7}")
+    for size in args.sizes:
+        texts = make_texts(size)
+        lexicon_seconds = time_backend(lexicon, texts)
+        row = f"{size:>8} | {lexicon_seconds:>11.4f} | {size / lexicon_seconds:>10.0f} | "
+
+        if textblob is not None and size <= args.textblob_limit:
+            textblob_seconds = time_backend(textblob, texts, repeat=1)
+            row += f"{textblob_seconds:>12.4f} | {textblob_seconds / lexicon_seconds:>6.1f}x"
+        else:
+            row += f"{'-':>12} | {'-':>7}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
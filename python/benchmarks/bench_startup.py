@@ -0,0 +1,66 @@
+# VIBE 리뷰 분석기 - 서비스 콜드 스타트 측정
+# 새 파이썬 프로세스에서 review_analyzer를 import하고 첫 요청(GET /)에 응답하기까지의 시간과
+# 그 시점에 이미 올라와 있는 무거운 모듈을 기록한다 (사전 워밍업은 끈 상태).
+#
+#   python benchmarks/bench_startup.py --runs 5 --output startup.json
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('numpy', 'pandas', 'matplotlib', 'seaborn', 'wordcloud', 'selenium', 'bs4', 'requests', 'textblob')
+
+# 자식 프로세스에서 실행: import 시간, 첫 응답 시간, 로드된 무거운 모듈을 JSON으로 출력
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import review_analyzer
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(review_analyzer.app) as client:
+    client.get('/')
+    first_response = time.perf_counter()
+heavy = [name for name in %r if name in sys.modules]
+print(json.dumps({'import': imported - start, 'first_response': first_response - start, 'heavy_modules': heavy}))
+"""
+
+
+def probe_once() -> dict:
+    env = dict(os.environ, ANALYZER_PREWARM='false', DRIVER_POOL_SIZE='0')
+    completed = subprocess.run(
+        [sys.executable, '-c', PROBE % (HEAVY_MODULES,)],
+        cwd=PYTHON_DIR, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리뷰 분석 서비스 콜드 스타트 측정")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    samples = [probe_once() for _ in range(args.runs)]
+    report = {
+        'runs': args.runs,
+        'import_seconds': round(statistics.median(sample['import'] for sample in samples), 4),
+        'first_response_seconds': round(statistics.median(sample['first_response'] for sample in samples), 4),
+        'heavy_modules_at_startup': samples[-1]['heavy_modules'],
+    }
+
+    print(f"import review_analyzer : {report['import_seconds']:.3f}s (중앙값, {args.runs}회)")
+    print(f"첫 응답까지            : {report['first_response_seconds']:.3f}s")
+    print(f"시작 시 로드된 무거운 모듈: {', '.join(report['heavy_modules_at_startup']) or '없음'}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+# VIBE 리뷰 분석기 - Selenium 브라우저 크롤러
+# HTTP 수집이 막히거나 쿠팡 외 쇼핑몰일 때 쓰는 브라우저 경로.
+# selenium을 불러오는 비용이 커서 브라우저 크롤링이 처음 필요할 때(또는 사전 워밍업 때) import한다.
+
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Set
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from coupang_http import parse_review_articles
+from driver_pool import create_chrome_driver
+from metrics import PAGE_LATENCY_SECONDS, PAGES_TOTAL
+from page_waits import AdaptiveWaiter
+from review_cache import normalize_review_text, review_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# 쿠팡 리뷰 목록의 '최신순' 정렬 버튼 (HTTP 수집의 sortBy=DATE_DESC와 같은 순서)
+NEWEST_SORT_SELECTOR = ".sdp-review__article__order__sort__newest-btn"
+# 상품 페이지 네트워크 유휴 대기 상한(초)
+NETWORK_IDLE_MAX_TIMEOUT = 3.0
+
+# 쿠팡 리뷰 페이지의 모든 리뷰를 [평점, 텍스트, 날짜, 도움됨 수, 리뷰 ID, 작성자] 배열로 한 번에 추출
+# (리뷰마다 find_element를 반복하면 WebDriver 왕복이 페이지당 수백 번 발생)
+EXTRACT_COUPANG_REVIEWS_SCRIPT = """
+var articles = document.querySelectorAll('article.sdp-review__article');
+var rows = [];
+for (var i = 0; i < articles.length; i++) {
+    var article = articles[i];
+    var star = article.querySelector('.sdp-review__rating__star');
+    if (!star) { continue; }
+    var rating = star.querySelectorAll('.icon--star-full').length
+        || parseInt(star.getAttribute('data-rating') || '0', 10);
+    var text = article.querySelector('.sdp-review__article__review');
+    var date = article.querySelector('.sdp-review__article__date');
+    var helpful = article.querySelector('.sdp-review__article__helpful__count');
+    var helpfulMatch = helpful ? helpful.textContent.replace(/,/g, '').match(/\\d+/) : null;
+    var user = article.querySelector('.sdp-review__article__user');
+    var idElement = article.hasAttribute('data-review-id') ? article : article.querySelector('[data-review-id]');
+    rows.push([
+        rating,
+        text ? text.innerText : '',
+        date ? date.textContent.trim() : '',
+        helpfulMatch ? parseInt(helpfulMatch[0], 10) : 0,
+        idElement ? idElement.getAttribute('data-review-id') : '',
+        user ? user.textContent : ''
+    ]);
+}
+return rows;
+"""
+
+class ReviewCrawler:
+    """리뷰 크롤러 클래스"""
+    
+    def __init__(self, headless: bool = True, driver=None):
+        self.headless = headless
+        self.page_loads = 0
+        self.extraction_timings: List[Dict[str, Any]] = []
+        # 풀에서 빌려온 드라이버는 close()에서 종료하지 않는다
+        self.owns_driver = driver is None
+        self.driver = driver
+        if self.owns_driver:
+            self.setup_driver()
+        # 고정 sleep 대신 페이지 준비 상태를 기다리고 대기 시간을 기록
+        self.waiter = AdaptiveWaiter(self.driver)
+    
+    def setup_driver(self):
+        """Selenium 드라이버 설정"""
+        try:
+            self.driver = create_chrome_driver(self.headless)
+            logger.info("Chrome 드라이버 초기화 완료")
+        except Exception as e:
+            logger.error(f"Chrome 드라이버 초기화 실패: {e}")
+            self.driver = None
+    
+    def detect_platform(self, url: str) -> str:
+        """URL에서 쇼핑몰 플랫폼 감지"""
+        if 'coupang.com' in url:
+            return 'coupang'
+        elif 'aliexpress.com' in url:
+            return 'aliexpress'
+        elif 'amazon.com' in url or 'amazon.co.kr' in url:
+            return 'amazon'
+        else:
+            raise ValueError("지원되지 않는 쇼핑몰입니다.")
+    
+    def get_product_info(self, url: str) -> Dict[str, Any]:
+        """상품 기본 정보 수집"""
+        platform = self.detect_platform(url)
+        
+        if not self.driver:
+            raise Exception("크롤러 초기화 실패")
+        
+        try:
+            self.driver.get(url)
+            self.page_loads += 1
+            self.waiter.wait_for_document_ready('product_page')
+            # 가격/평점은 로드 뒤 XHR로 채워지므로 요청이 잦아들 때까지 (끝없는 트래킹 요청 대비 상한)
+            self.waiter.wait_for_network_idle('product_network_idle', idle_ms=300, max_timeout=NETWORK_IDLE_MAX_TIMEOUT)
+            
+            if platform == 'coupang':
+                self.waiter.wait_for_element('product_title', "h1.prod-buy-header__title")
+                return self._get_coupang_product_info()
+            elif platform == 'aliexpress':
+                return self._get_aliexpress_product_info()
+            elif platform == 'amazon':
+                return self._get_amazon_product_info()
+        except Exception as e:
+            logger.error(f"상품 정보 수집 실패: {e}")
+            return {
+                'title': '상품명을 가져올 수 없습니다',
+                'rating': 0,
+                'review_count': 0,
+                'price': '가격 정보 없음',
+                'image': None
+            }
+    
+    def _get_coupang_product_info(self) -> Dict[str, Any]:
+        """쿠팡 상품 정보 수집"""
+        try:
+            # 상품명
+            title_element = self.driver.find_element(By.CSS_SELECTOR, "h1.prod-buy-header__title")
+            title = title_element.text.strip()
+            
+            # 평점
+            try:
+                rating_element = self.driver.find_element(By.CSS_SELECTOR, ".rating-star-num")
+                rating = float(rating_element.text.strip())
+            except:
+                rating = 0
+            
+            # 리뷰 수
+            try:
+                review_count_element = self.driver.find_element(By.CSS_SELECTOR, ".rating-total-review-count")
+                review_count = int(re.search(r'\d+', review_count_element.text).group())
+            except:
+                review_count = 0
+            
+            # 가격
+            try:
+                price_element = self.driver.find_element(By.CSS_SELECTOR, ".total-price strong")
+                price = price_element.text.strip()
+            except:
+                price = "가격 정보 없음"
+            
+            # 이미지
+            try:
+                image_element = self.driver.find_element(By.CSS_SELECTOR, ".prod-image__detail img")
+                image = image_element.get_attribute("src")
+            except:
+                image = None
+            
+            return {
+                'title': title,
+                'rating': rating,
+                'review_count': review_count,
+                'price': price,
+                'image': image
+            }
+        except Exception as e:
+            logger.error(f"쿠팡 상품 정보 수집 실패: {e}")
+            raise
+    
+    def _get_aliexpress_product_info(self) -> Dict[str, Any]:
+        """알리익스프레스 상품 정보 수집 (기본 구조)"""
+        # 실제 구현은 알리익스프레스 페이지 구조에 맞게 조정 필요
+        return {
+            'title': 'AliExpress 상품',
+            'rating': 4.5,
+            'review_count': 100,
+            'price': '$19.99',
+            'image': None
+        }
+    
+    def _get_amazon_product_info(self) -> Dict[str, Any]:
+        """아마존 상품 정보 수집 (기본 구조)"""
+        # 실제 구현은 아마존 페이지 구조에 맞게 조정 필요
+        return {
+            'title': 'Amazon 상품',
+            'rating': 4.2,
+            'review_count': 200,
+            'price': '$29.99',
+            'image': None
+        }
+    
+    def crawl_reviews(self, url: str, max_reviews: int = 100, progress_callback=None, known_fingerprints: Optional[Set[str]] = None, page_callback=None, stop_at_known: bool = False, outcome: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """리뷰 크롤링 메인 함수
+        
+        known_fingerprints: 캐시에 있는 리뷰 (건너뜀, stop_at_known이면 처음 만난 곳에서 중단)
+        page_callback: 페이지마다 새로 수집한 리뷰 목록으로 호출 (스트리밍 분석용)
+        outcome: covered/stopped_at_known/exhausted/sort 기록 (CoupangReviewFetcher.iter_review_pages와 같은 의미)
+        """
+        platform = self.detect_platform(url)
+        
+        if platform == 'coupang':
+            return self._crawl_coupang_reviews(url, max_reviews, progress_callback, known_fingerprints, page_callback, stop_at_known, outcome)
+        elif platform == 'aliexpress':
+            return self._crawl_aliexpress_reviews(url, max_reviews, progress_callback)
+        elif platform == 'amazon':
+            return self._crawl_amazon_reviews(url, max_reviews, progress_callback)
+    
+    def _crawl_coupang_reviews(self, url: str, max_reviews: int, progress_callback=None, known_fingerprints: Optional[Set[str]] = None, page_callback=None, stop_at_known: bool = False, outcome: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """쿠팡 리뷰 크롤링 (최신순)"""
+        reviews = []
+        known_fingerprints = known_fingerprints or set()
+        outcome = outcome if outcome is not None else {}
+        outcome.update({'sort': None, 'covered': 0, 'stopped_at_known': False, 'exhausted': False})
+        
+        try:
+            page_started = time.perf_counter()
+            # 리뷰 탭으로 이동
+            review_tab = self.waiter.wait(
+                'review_tab',
+                EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '상품리뷰')]"))
+            )
+            if review_tab is None:
+                raise TimeoutException("상품리뷰 탭을 찾을 수 없습니다.")
+            review_tab.click()
+            self.waiter.wait_for_element('review_list', "article.sdp-review__article")
+            self.waiter.wait_for_dom_quiet('review_list_settled', quiet_ms=200)
+            if self._sort_newest_first():
+                outcome['sort'] = 'DATE_DESC'
+            else:
+                # 순서를 모르면 아는 리뷰에서 멈출 수 없다 (건너뛰기만)
+                logger.warning("리뷰 최신순 정렬 실패, 기본 순서로 수집합니다.")
+                stop_at_known = False
+            
+            page = 1
+            while outcome['covered'] < max_reviews:
+                if progress_callback:
+                    progress = int((outcome['covered'] / max_reviews) * 70)  # 크롤링은 전체의 70%
+                    progress_callback(progress, f"리뷰 수집 중... ({len(reviews)}/{max_reviews})")
+                
+                # 현재 페이지의 리뷰를 한 번의 스크립트 호출로 수집
+                first_review = self.driver.find_elements(By.CSS_SELECTOR, "article.sdp-review__article")[:1]
+                if not first_review:
+                    break
+                
+                page_reviews = self._extract_page_reviews(page)
+                PAGE_LATENCY_SECONDS.observe(time.perf_counter() - page_started, mode='browser')
+                PAGES_TOTAL.inc(mode='browser')
+                new_reviews = []
+                for review in page_reviews:
+                    if outcome['covered'] >= max_reviews:
+                        break
+                    review['id'] = review_fingerprint(review)
+                    if review['id'] in known_fingerprints:
+                        if stop_at_known:
+                            outcome['stopped_at_known'] = True
+                            break
+                    else:
+                        new_reviews.append(review)
+                    outcome['covered'] += 1
+                reviews.extend(new_reviews)
+                if page_callback and new_reviews:
+                    page_callback(new_reviews)
+                
+                # 이미 캐시에 있는 최신순 앞부분까지 왔으면 나머지는 캐시에서 합친다
+                if outcome['stopped_at_known'] or outcome['covered'] >= max_reviews:
+                    break
+                
+                # 다음 페이지로
+                try:
+                    next_button = self.driver.find_element(By.CSS_SELECTOR, ".sdp-review__article__page__next")
+                    if "disabled" in next_button.get_attribute("class"):
+                        outcome['exhausted'] = True
+                        break
+                    page_started = time.perf_counter()
+                    next_button.click()
+                    self.page_loads += 1
+                    # 이전 페이지의 첫 리뷰가 교체될 때까지 대기
+                    if not self.waiter.wait_for_replacement('review_page', first_review[0], "article.sdp-review__article"):
+                        break
+                    page += 1
+                except:
+                    break
+            
+        except Exception as e:
+            logger.error(f"쿠팡 리뷰 크롤링 실패: {e}")
+        
+        return reviews
+    
+    def _sort_newest_first(self) -> bool:
+        """리뷰 목록을 최신순으로 바꾸고 목록이 다시 그려질 때까지 대기 (실패 시 False)"""
+        try:
+            first_review = self.driver.find_elements(By.CSS_SELECTOR, "article.sdp-review__article")[:1]
+            sort_button = self.driver.find_element(By.CSS_SELECTOR, NEWEST_SORT_SELECTOR)
+            sort_button.click()
+            if first_review:
+                self.waiter.wait_for_replacement('review_sort', first_review[0], "article.sdp-review__article")
+            self.waiter.wait_for_dom_quiet('review_sort_settled', quiet_ms=200)
+            return True
+        except Exception as e:
+            logger.warning(f"최신순 정렬 버튼을 찾지 못했습니다: {e}")
+            return False
+    
+    def _extract_page_reviews(self, page: int) -> List[Dict[str, Any]]:
+        """현재 페이지의 모든 리뷰를 execute_script 한 번으로 추출 (실패 시 page_source 파싱)"""
+        start = time.perf_counter()
+        try:
+            rows = self.driver.execute_script(EXTRACT_COUPANG_REVIEWS_SCRIPT) or []
+            page_reviews = [
+                {
+                    'rating': rating,
+                    # innerText의 줄바꿈을 HTTP 파서(get_text)와 같은 방식으로 정리
+                    'text': normalize_review_text(text),
+                    'date': date,
+                    'helpful_count': helpful_count,
+                    'platform': 'coupang',
+                    'review_id': review_id or '',
+                    'reviewer': normalize_review_text(reviewer)
+                }
+                for rating, text, date, helpful_count, review_id, reviewer in rows
+            ]
+            method = 'script'
+        except Exception as e:
+            logger.warning(f"스크립트 리뷰 추출 실패, page_source로 대체: {e}")
+            page_reviews = parse_review_articles(self.driver.page_source)
+            method = 'page_source'
+        
+        self.extraction_timings.append({
+            'page': page,
+            'reviews': len(page_reviews),
+            'seconds': round(time.perf_counter() - start, 4),
+            'method': method
+        })
+        return page_reviews
+    
+    def _crawl_aliexpress_reviews(self, url: str, max_reviews: int, progress_callback=None) -> List[Dict[str, Any]]:
+        """알리익스프레스 리뷰 크롤링 (기본 구조)"""
+        # 실제 구현 필요
+        return []
+    
+    def _crawl_amazon_reviews(self, url: str, max_reviews: int, progress_callback=None) -> List[Dict[str, Any]]:
+        """아마존 리뷰 크롤링 (기본 구조)"""
+        # 실제 구현 필요
+        return []
+    
+    def close(self):
+        """드라이버 종료"""
+        if self.driver and self.owns_driver:
+            self.driver.quit()
@@ -0,0 +1,204 @@
+# VIBE 리뷰 분석기 - 차트/워드클라우드 렌더링
+# 분석 결과(평점 분포, 감정 비율, 키워드 빈도)로 PNG/SVG 이미지를 만들어 디스크에 캐시한다.
+# 파일 이름은 입력 데이터의 해시라서 같은 분포/키워드 집합은 다시 렌더링하지 않는다.
+# matplotlib/wordcloud는 render_chart 안에서만 import한다 (분석 프로세스 풀에서 실행).
+
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+DEFAULT_CHART_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'charts')
+
+CHART_FORMATS = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+# 렌더링 방식이 바뀌면 올려서 이전 캐시 파일을 쓰지 않게 한다
+RENDER_VERSION = 1
+
+_FILENAME_PATTERN = re.compile(r'^([0-9a-f]{24})\.(png|svg)$')
+
+# CHART_FONT_PATH가 없을 때 찾아볼 한글 글꼴 (macOS, Windows, Linux 순)
+KOREAN_FONT_CANDIDATES = (
+    '/System/Library/Fonts/AppleSDGothicNeo.ttc',
+    '/Library/Fonts/AppleGothic.ttf',
+    'C:\\Windows\\Fonts\\malgun.ttf',
+    '/usr/share/fonts/truetype/nanum/NanumGothic.ttf',
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+    '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',
+)
+
+SENTIMENT_COLORS = {'positive': '#4caf50', 'neutral': '#9e9e9e', 'negative': '#f44336'}
+KEYWORD_COLORS = {'positive': '#2e7d32', 'neutral': '#616161', 'negative': '#c62828'}
+
+
+def find_korean_font() -> Optional[str]:
+    """설치된 한글 글꼴 경로 (없으면 None - 키워드가 네모로 그려짐)"""
+    return next((path for path in KOREAN_FONT_CANDIDATES if os.path.exists(path)), None)
+
+
+def chart_inputs(result: Dict[str, Any]) -> Dict[str, Any]:
+    """분석 결과에서 차트별 렌더링 입력만 추림 (해시 키가 되므로 순서를 고정)"""
+    statistics = result.get('statistics') or {}
+    sentiment = result.get('sentiment') or {}
+    keywords = result.get('keywords') or []
+
+    # 디스크에서 다시 읽은 결과는 평점 키가 문자열이다
+    distribution = {int(rating): count for rating, count in (statistics.get('rating_distribution') or {}).items()}
+    inputs: Dict[str, Any] = {
+        'rating_distribution': [[rating, distribution.get(rating, 0)] for rating in range(1, 6)],
+        'sentiment': [[label, sentiment.get(label, 0)] for label in ('positive', 'neutral', 'negative')],
+    }
+    if keywords:
+        inputs['wordcloud'] = [[keyword['word'], keyword['count'], keyword.get('sentiment', 'neutral')] for keyword in keywords]
+    return inputs
+
+
+def render_chart(kind: str, data: List[List[Any]], fmt: str = 'png', font_path: Optional[str] = None) -> bytes:
+    """차트 하나를 이미지 바이트로 렌더링 (pickle 가능한 인자만 받음 - 프로세스 풀용)"""
+    if fmt not in CHART_FORMATS:
+        raise ValueError(f"지원하지 않는 이미지 형식입니다: {fmt}")
+    if kind == 'wordcloud':
+        return _render_wordcloud(data, fmt, font_path)
+
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+
+    if font_path:
+        font_manager.fontManager.addfont(font_path)
+        plt.rcParams['font.family'] = font_manager.FontProperties(fname=font_path).get_name()
+    else:
+        plt.rcParams['font.family'] = 'DejaVu Sans'
+    plt.rcParams['axes.unicode_minus'] = False
+    # SVG 요소 ID를 고정해 같은 입력이면 같은 파일이 나오게 한다
+    plt.rcParams['svg.hashsalt'] = 'vibe-review-analyzer'
+
+    fig, ax = plt.subplots(figsize=(6, 3.6))
+    try:
+        if kind == 'rating_distribution':
+            ratings = [f"{rating}★" for rating, _ in data]
+            counts = [count for _, count in data]
+            bars = ax.bar(ratings, counts, color='#ffb300')
+            ax.bar_label(bars, padding=2)
+            ax.set_xlabel('Rating')
+            ax.set_ylabel('Reviews')
+            ax.spines[['top', 'right']].set_visible(False)
+        elif kind == 'sentiment':
+            labels = [label for label, value in data if value > 0]
+            values = [value for _, value in data if value > 0]
+            ax.pie(
+                values or [1], labels=[label.capitalize() for label in labels] or ['No data'],
+                colors=[SENTIMENT_COLORS[label] for label in labels] or ['#e0e0e0'],
+                autopct='%1.0f%%' if values else None, startangle=90, counterclock=False,
+                wedgeprops={'width': 0.45}
+            )
+            ax.set_aspect('equal')
+        else:
+            raise ValueError(f"알 수 없는 차트 종류입니다: {kind}")
+
+        fig.tight_layout()
+        buffer = io.BytesIO()
+        # 생성 시각 메타데이터를 빼서 같은 입력이면 같은 바이트가 나오게 한다
+        metadata = {'Date': None} if fmt == 'svg' else {'Software': None}
+        fig.savefig(buffer, format=fmt, dpi=120, metadata=metadata)
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def _render_wordcloud(data: List[List[Any]], fmt: str, font_path: Optional[str]) -> bytes:
+    from wordcloud import WordCloud
+
+    frequencies = {word: count for word, count, _ in data}
+    sentiments = {word: sentiment for word, _, sentiment in data}
+
+    def color_func(word, **kwargs):
+        return KEYWORD_COLORS.get(sentiments.get(word), KEYWORD_COLORS['neutral'])
+
+    cloud = WordCloud(
+        width=800, height=400, background_color='white', font_path=font_path,
+        prefer_horizontal=0.9, random_state=42, color_func=color_func
+    ).generate_from_frequencies(frequencies)
+
+    if fmt == 'svg':
+        return cloud.to_svg(embed_font=bool(font_path)).encode('utf-8')
+    buffer = io.BytesIO()
+    cloud.to_image().save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+class ChartCache:
+    """입력 해시로 이름 붙인 차트 이미지 파일 캐시"""
+
+    def __init__(self, directory: str = DEFAULT_CHART_DIR, font_path: Optional[str] = None):
+        self.directory = directory
+        # 한글 키워드를 그리려면 한글 글꼴 필요 (없으면 matplotlib/wordcloud 기본 글꼴)
+        self.font_path = font_path
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.renders = 0
+
+    @classmethod
+    def from_env(cls) -> "ChartCache":
+        """환경 변수로 캐시 설정"""
+        return cls(
+            directory=os.getenv('CHART_CACHE_DIR', DEFAULT_CHART_DIR),
+            font_path=os.getenv('CHART_FONT_PATH') or find_korean_font(),
+        )
+
+    def key(self, kind: str, data: List[List[Any]], fmt: str) -> str:
+        """차트 종류 + 입력 데이터 + 형식 + 글꼴의 내용 해시"""
+        payload = json.dumps(
+            [RENDER_VERSION, kind, fmt, os.path.basename(self.font_path or ''), data],
+            ensure_ascii=False, separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]
+
+    def path(self, digest: str, fmt: str) -> str:
+        return os.path.join(self.directory, f"{digest}.{fmt}")
+
+    def contains(self, digest: str, fmt: str) -> bool:
+        found = os.path.exists(self.path(digest, fmt))
+        if found:
+            with self._lock:
+                self.hits += 1
+        return found
+
+    def store(self, digest: str, fmt: str, body: bytes):
+        """임시 파일에 쓴 뒤 이름을 바꿔 읽는 쪽이 반쯤 쓴 파일을 보지 않게 한다"""
+        os.makedirs(self.directory, exist_ok=True)
+        target = self.path(digest, fmt)
+        temporary = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, 'wb') as f:
+            f.write(body)
+        os.replace(temporary, target)
+        with self._lock:
+            self.renders += 1
+
+    def load(self, filename: str) -> Optional[bytes]:
+        """'<해시>.<형식>' 파일 내용 (이름이 형식에 맞지 않거나 없으면 None)"""
+        if not _FILENAME_PATTERN.match(filename):
+            return None
+        try:
+            with open(os.path.join(self.directory, filename), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def media_type(filename: str) -> str:
+        return CHART_FORMATS[filename.rsplit('.', 1)[-1]]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'directory': self.directory,
+                'font_path': self.font_path,
+                'hits': self.hits,
+                'renders': self.renders,
+            }
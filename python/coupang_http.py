@@ -0,0 +1,273 @@
+# VIBE 리뷰 분석기 - 쿠팡 HTTP 리뷰 수집기
+# 브라우저 렌더링 없이 리뷰 목록 HTML 조각을 직접 받아 BeautifulSoup으로 파싱한다.
+# 차단되거나 구조가 바뀌어 결과가 없으면 호출 측에서 Selenium 크롤러로 대체한다.
+
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from metrics import FAILURES_TOTAL, PAGE_LATENCY_SECONDS, PAGES_TOTAL
+from product_urls import extract_product_id
+from review_cache import normalize_review_text, review_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# 리뷰는 항상 최신순으로 받는다 (캐시의 '아는 리뷰에서 멈춤'이 최신순 앞부분을 전제로 함)
+REVIEW_SORT = 'DATE_DESC'
+
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8',
+}
+
+
+def _first_int(text: str, default: int = 0) -> int:
+    match = re.search(r'\d+', text.replace(',', '')) if text else None
+    return int(match.group()) if match else default
+
+
+def parse_review_articles(html: str) -> List[Dict[str, Any]]:
+    """리뷰 목록 HTML에서 리뷰 레코드 추출 (Selenium 크롤러와 같은 셀렉터 사용)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    reviews = []
+
+    for article in soup.select('article.sdp-review__article'):
+        try:
+            star = article.select_one('.sdp-review__rating__star')
+            if star is None:
+                continue
+            rating = len(star.select('.icon--star-full'))
+            if rating == 0 and star.get('data-rating'):
+                rating = int(star['data-rating'])
+
+            text_element = article.select_one('.sdp-review__article__review')
+            date_element = article.select_one('.sdp-review__article__date')
+            helpful_element = article.select_one('.sdp-review__article__helpful__count')
+            user_element = article.select_one('.sdp-review__article__user')
+            id_element = article if article.get('data-review-id') else article.select_one('[data-review-id]')
+
+            reviews.append({
+                'rating': rating,
+                'text': normalize_review_text(text_element.get_text(' ')) if text_element else '',
+                'date': date_element.get_text(strip=True) if date_element else '',
+                'helpful_count': _first_int(helpful_element.get_text()) if helpful_element else 0,
+                'platform': 'coupang',
+                'review_id': id_element['data-review-id'] if id_element else '',
+                'reviewer': normalize_review_text(user_element.get_text(' ')) if user_element else ''
+            })
+        except Exception as e:
+            logger.warning(f"개별 리뷰 파싱 실패: {e}")
+            continue
+
+    return reviews
+
+
+def parse_product_page(html: str) -> Optional[Dict[str, Any]]:
+    """상품 페이지 HTML에서 기본 정보 추출 (상품명이 없으면 None)"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    title_element = soup.select_one('h1.prod-buy-header__title')
+    if title_element is None:
+        return None
+
+    rating_element = soup.select_one('.rating-star-num')
+    try:
+        rating = float(rating_element.get_text(strip=True)) if rating_element else 0
+    except ValueError:
+        rating = 0
+
+    review_count_element = soup.select_one('.rating-total-review-count')
+    price_element = soup.select_one('.total-price strong')
+    image_element = soup.select_one('.prod-image__detail img')
+
+    return {
+        'title': title_element.get_text(strip=True),
+        'rating': rating,
+        'review_count': _first_int(review_count_element.get_text()) if review_count_element else 0,
+        'price': price_element.get_text(strip=True) if price_element else '가격 정보 없음',
+        'image': image_element.get('src') if image_element else None
+    }
+
+
+class CoupangReviewFetcher:
+    """커넥션 풀을 공유하는 requests 세션으로 리뷰 페이지를 동시에 받아오는 수집기"""
+
+    def __init__(
+        self,
+        base_url: str = 'https://www.coupang.com',
+        page_size: int = 5,
+        concurrency: int = 4,
+        timeout: float = 10.0,
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency, max_retries=1)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    @classmethod
+    def from_env(cls) -> "CoupangReviewFetcher":
+        """환경 변수로 수집기 설정 (COUPANG_BASE_URL로 로컬 스텁 서버 지정 가능)"""
+        return cls(
+            base_url=os.getenv('COUPANG_BASE_URL', 'https://www.coupang.com'),
+            concurrency=int(os.getenv('HTTP_CRAWL_CONCURRENCY', '4')),
+            timeout=float(os.getenv('HTTP_CRAWL_TIMEOUT', '10')),
+        )
+
+    def get_product_info(self, url: str) -> Optional[Dict[str, Any]]:
+        """상품 페이지를 받아 기본 정보 추출 (실패 시 None)"""
+        product_id = extract_product_id(url)
+        if not product_id:
+            return None
+
+        try:
+            response = self.session.get(f"{self.base_url}/vp/products/{product_id}", timeout=self.timeout)
+            response.raise_for_status()
+            return parse_product_page(response.text)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"상품 페이지 요청 실패: {e}")
+            return None
+
+    def fetch_review_page(self, product_id: str, page: int, sort_by: str = REVIEW_SORT) -> List[Dict[str, Any]]:
+        """리뷰 목록 HTML 조각 한 페이지 요청 및 파싱"""
+        params = {
+            'productId': product_id,
+            'page': page,
+            'size': self.page_size,
+            'sortBy': sort_by,
+            'ratings': '',
+            'q': '',
+            'viRoleCode': 3,
+            'ratingSummary': 'true'
+        }
+        headers = {'Referer': f"{self.base_url}/vp/products/{product_id}"}
+
+        start = time.perf_counter()
+        try:
+            response = self.session.get(
+                f"{self.base_url}/vp/product/reviews",
+                params=params,
+                headers=headers,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            FAILURES_TOTAL.inc(stage='page_fetch')
+            raise
+
+        reviews = parse_review_articles(response.text)
+        PAGE_LATENCY_SECONDS.observe(time.perf_counter() - start, mode='http')
+        PAGES_TOTAL.inc(mode='http')
+        return reviews
+
+    def iter_review_pages(
+        self,
+        url: str,
+        max_reviews: int = 100,
+        progress_callback=None,
+        known_fingerprints: Optional[Set[str]] = None,
+        stop_at_known: bool = False,
+        outcome: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """최신순으로 concurrency 개의 페이지를 한 번에 요청하며 새 리뷰를 페이지 단위로 반환
+
+        첫 페이지부터 본 리뷰(새 리뷰 + known_fingerprints에 있는 리뷰)가 max_reviews개가 되거나
+        마지막 페이지에 닿으면 끝난다. 아는 리뷰는 건너뛰기만 하고,
+        stop_at_known이면 (캐시가 최신순 앞부분을 충분히 갖고 있을 때) 처음 만난 아는 리뷰에서 멈춘다.
+        outcome에는 covered(첫 페이지부터 끊김 없이 본 리뷰 수), stopped_at_known, exhausted를 기록한다.
+        """
+        product_id = extract_product_id(url)
+        if not product_id:
+            raise ValueError("쿠팡 상품 ID를 찾을 수 없습니다.")
+
+        known_fingerprints = known_fingerprints or set()
+        outcome = outcome if outcome is not None else {}
+        outcome.update({'sort': REVIEW_SORT, 'covered': 0, 'stopped_at_known': False, 'exhausted': False})
+        collected = 0
+        next_page = 1
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while outcome['covered'] < max_reviews:
+                if progress_callback:
+                    progress = int((outcome['covered'] / max_reviews) * 70)  # 크롤링은 전체의 70%
+                    progress_callback(progress, f"리뷰 수집 중... ({collected}/{max_reviews})")
+
+                remaining_pages = -(-(max_reviews - outcome['covered']) // self.page_size)
+                pages = list(range(next_page, next_page + min(self.concurrency, remaining_pages)))
+                next_page = pages[-1] + 1
+
+                # 요청은 동시에, 결과는 페이지 순서대로 도착하는 대로 처리
+                results = executor.map(lambda page: self.fetch_review_page(product_id, page), pages)
+
+                done = False
+                for page_reviews in results:
+                    if not page_reviews:
+                        outcome['exhausted'] = True
+                        done = True
+                        break
+
+                    new_reviews = []
+                    consumed = 0
+                    for review in page_reviews:
+                        if outcome['covered'] >= max_reviews:
+                            break
+                        review['id'] = review_fingerprint(review)
+                        if review['id'] in known_fingerprints:
+                            if stop_at_known:
+                                # 여기부터는 캐시가 가진 최신순 앞부분
+                                outcome['stopped_at_known'] = True
+                                break
+                        else:
+                            new_reviews.append(review)
+                        outcome['covered'] += 1
+                        consumed += 1
+
+                    collected += len(new_reviews)
+                    if new_reviews:
+                        yield new_reviews
+
+                    # 덜 찬 페이지를 끝까지 읽었으면 마지막 리뷰까지 본 것
+                    last_page = len(page_reviews) < self.page_size
+                    outcome['exhausted'] = last_page and consumed == len(page_reviews)
+                    if outcome['stopped_at_known'] or last_page or outcome['covered'] >= max_reviews:
+                        done = True
+                        break
+
+                if done:
+                    break
+
+    def crawl_reviews(
+        self,
+        url: str,
+        max_reviews: int = 100,
+        progress_callback=None,
+        known_fingerprints: Optional[Set[str]] = None,
+        stop_at_known: bool = False,
+        outcome: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """iter_review_pages의 모든 페이지를 하나의 목록으로"""
+        reviews: List[Dict[str, Any]] = []
+        for page_reviews in self.iter_review_pages(
+            url, max_reviews, progress_callback, known_fingerprints, stop_at_known, outcome
+        ):
+            reviews.extend(page_reviews)
+        return reviews
+
+    def close(self):
+        self.session.close()
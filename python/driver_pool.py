@@ -0,0 +1,248 @@
+# VIBE 리뷰 분석기 - Chrome 드라이버 풀
+# 분석 작업마다 Chrome을 새로 띄우지 않도록 고정된 개수의 브라우저를 재사용한다.
+
+import logging
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def create_chrome_driver(headless: bool = True):
+    """봇 감지 우회 옵션이 적용된 Chrome 드라이버 생성"""
+    # selenium은 import 비용이 커서 드라이버를 처음 만들 때 불러온다
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+class DriverPoolExhausted(Exception):
+    """제한 시간 안에 사용 가능한 드라이버를 얻지 못함"""
+
+
+class PooledDriver:
+    """풀에서 관리되는 드라이버와 사용 이력"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.page_loads = 0
+        self.checkouts = 0
+        self.created_at = time.time()
+
+    def mark_page_load(self, count: int = 1):
+        """페이지 로드 횟수 기록 (재활용 판단 기준)"""
+        self.page_loads += count
+
+
+class DriverPool:
+    """크기가 제한된 Chrome 드라이버 풀
+
+    - warm_up: 서버 시작 시 드라이버를 미리 띄워 둔다
+    - checkout/checkin: 드라이버를 빌리고 반납한다 (lease 컨텍스트 매니저 권장)
+    - 빌려줄 때 헬스 체크, 반납 시 페이지 로드 수가 max_page_loads를 넘으면 폐기 후 재생성
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_page_loads: int = 50,
+        headless: bool = True,
+        checkout_timeout: float = 120.0,
+        driver_factory: Optional[Callable[[bool], Any]] = None,
+    ):
+        self.size = size
+        self.max_page_loads = max_page_loads
+        self.headless = headless
+        self.checkout_timeout = checkout_timeout
+        self.driver_factory = driver_factory or create_chrome_driver
+
+        # 가장 최근에 반납된 드라이버부터 재사용 (캐시가 따뜻한 브라우저 우선)
+        self._idle: "queue.LifoQueue[PooledDriver]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._live = 0
+        self._closed = False
+
+        self.created_count = 0
+        self.recycled_count = 0
+        self.unhealthy_count = 0
+
+    @classmethod
+    def from_env(cls) -> "DriverPool":
+        """환경 변수로 풀 설정"""
+        return cls(
+            size=int(os.getenv('DRIVER_POOL_SIZE', '2')),
+            max_page_loads=int(os.getenv('DRIVER_MAX_PAGE_LOADS', '50')),
+            headless=os.getenv('DRIVER_HEADLESS', 'true').lower() != 'false',
+            checkout_timeout=float(os.getenv('DRIVER_CHECKOUT_TIMEOUT', '120')),
+        )
+
+    def warm_up(self, count: Optional[int] = None) -> int:
+        """드라이버를 미리 생성해 유휴 상태로 둔다"""
+        target = min(self.size, count if count is not None else self.size)
+        created = 0
+        while True:
+            with self._lock:
+                if self._closed or self._live >= target:
+                    break
+                self._live += 1
+            try:
+                self._idle.put(self._create())
+                created += 1
+            except Exception as e:
+                with self._lock:
+                    self._live -= 1
+                logger.error(f"드라이버 워밍업 실패: {e}")
+                break
+        logger.info(f"드라이버 풀 워밍업 완료 ({created}개 생성, 총 {self._live}/{self.size})")
+        return created
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledDriver:
+        """사용 가능한 드라이버 대여 (없으면 풀 한도 안에서 새로 생성)"""
+        if self._closed:
+            raise DriverPoolExhausted("드라이버 풀이 종료되었습니다.")
+
+        wait = self.checkout_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=wait):
+            raise DriverPoolExhausted(f"{wait:.0f}초 동안 사용 가능한 드라이버가 없습니다.")
+
+        deadline = time.monotonic() + wait
+        try:
+            while True:
+                try:
+                    pooled = self._idle.get_nowait()
+                except queue.Empty:
+                    # 생성 여유를 _live로 예약 (warm_up과 같은 락/한도 검사)
+                    with self._lock:
+                        can_create = self._live < self.size
+                        if can_create:
+                            self._live += 1
+                    if can_create:
+                        try:
+                            pooled = self._create()
+                        except Exception:
+                            with self._lock:
+                                self._live -= 1
+                            raise
+                        break
+
+                    # 한도까지 이미 생성 중(워밍업)이면 그 드라이버가 유휴 큐에 들어오길 기다린다
+                    # (워밍업이 실패해 자리가 나면 다음 바퀴에 직접 생성하도록 짧게 나눠 대기)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DriverPoolExhausted(f"{wait:.0f}초 동안 사용 가능한 드라이버가 없습니다.")
+                    try:
+                        pooled = self._idle.get(timeout=min(remaining, 0.5))
+                    except queue.Empty:
+                        continue
+
+                if self._is_healthy(pooled):
+                    break
+                self.unhealthy_count += 1
+                logger.warning("응답 없는 드라이버를 폐기합니다.")
+                self._discard(pooled)
+
+            pooled.checkouts += 1
+            return pooled
+        except Exception:
+            self._slots.release()
+            raise
+
+    def checkin(self, pooled: PooledDriver, broken: bool = False):
+        """드라이버 반납 (고장났거나 수명을 다했으면 폐기)"""
+        try:
+            if self._closed or broken:
+                self._discard(pooled)
+                return
+
+            if pooled.page_loads >= self.max_page_loads:
+                self.recycled_count += 1
+                logger.info(f"드라이버 재활용 (페이지 로드 {pooled.page_loads}회)")
+                self._discard(pooled)
+                return
+
+            try:
+                # 이전 작업의 페이지를 비워 메모리를 돌려받는다
+                pooled.driver.get("about:blank")
+            except Exception as e:
+                logger.warning(f"드라이버 초기화 실패, 폐기합니다: {e}")
+                self._discard(pooled)
+                return
+
+            self._idle.put(pooled)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """with 블록 동안 드라이버를 빌려준다"""
+        pooled = self.checkout(timeout)
+        broken = False
+        try:
+            yield pooled
+        except Exception:
+            broken = not self._is_healthy(pooled)
+            raise
+        finally:
+            self.checkin(pooled, broken=broken)
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태"""
+        idle = self._idle.qsize()
+        return {
+            'size': self.size,
+            'live': self._live,
+            'idle': idle,
+            'in_use': self._live - idle,
+            'created': self.created_count,
+            'recycled': self.recycled_count,
+            'unhealthy': self.unhealthy_count,
+        }
+
+    def close(self):
+        """모든 유휴 드라이버 종료 (대여 중인 드라이버는 반납 시 종료)"""
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(pooled)
+        logger.info("드라이버 풀 종료")
+
+    def _create(self) -> PooledDriver:
+        driver = self.driver_factory(self.headless)
+        self.created_count += 1
+        logger.info("Chrome 드라이버 초기화 완료")
+        return PooledDriver(driver)
+
+    def _discard(self, pooled: PooledDriver):
+        with self._lock:
+            self._live -= 1
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"드라이버 종료 실패: {e}")
+
+    @staticmethod
+    def _is_healthy(pooled: PooledDriver) -> bool:
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
@@ -0,0 +1,215 @@
+# VIBE 리뷰 분석기 - 분석 작업 스케줄러
+# 블로킹 크롤링은 스레드 풀에서, CPU 위주의 분석은 프로세스 풀에서 실행해
+# 이벤트 루프(/status 폴링 등)가 멈추지 않게 한다.
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# 같은 쇼핑몰의 다른 호스트 → 제한을 함께 받을 도메인 (없는 호스트는 호스트명 그대로)
+# 마지막 두 라벨만 남기면 *.co.kr 쇼핑몰이 모두 'co.kr' 하나로 묶이므로 명시적으로 나열한다.
+DOMAIN_ALIASES: Dict[str, str] = {
+    'coupang.com': 'coupang.com',
+    'www.coupang.com': 'coupang.com',
+    'm.coupang.com': 'coupang.com',
+}
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+
+class JobScheduler:
+    """동시 실행 수와 대기열 깊이가 제한된 분석 작업 스케줄러
+
+    - submit: 작업을 대기열에 넣고 실행 슬롯이 나면 FIFO 순서로 시작
+    - run_in_thread: 크롤링 같은 블로킹 I/O 단계를 스레드 풀에서 실행
+    - run_in_process: 감정 분석 같은 CPU 단계를 프로세스 풀에서 실행
+    """
+
+    def __init__(
+        self,
+        max_concurrent_jobs: int = 2,
+        max_queue_depth: int = 20,
+        crawl_workers: Optional[int] = None,
+        analysis_workers: Optional[int] = None,
+    ):
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_queue_depth = max_queue_depth
+        self.crawl_workers = crawl_workers or max_concurrent_jobs
+        self.analysis_workers = analysis_workers or min(max_concurrent_jobs, os.cpu_count() or 1)
+
+        self._pending: Deque[Tuple[str, Callable[[], Awaitable[Any]]]] = deque()
+        self._running: Set[str] = set()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    @classmethod
+    def from_env(cls) -> "JobScheduler":
+        """환경 변수로 스케줄러 설정"""
+        crawl_workers = os.getenv('CRAWL_WORKERS')
+        analysis_workers = os.getenv('ANALYSIS_WORKERS')
+        return cls(
+            max_concurrent_jobs=int(os.getenv('ANALYSIS_MAX_CONCURRENT', '2')),
+            max_queue_depth=int(os.getenv('ANALYSIS_MAX_QUEUE', '20')),
+            crawl_workers=int(crawl_workers) if crawl_workers else None,
+            analysis_workers=int(analysis_workers) if analysis_workers else None,
+        )
+
+    def ensure_capacity(self, count: int = 1):
+        """작업 count개를 더 받아도 대기열이 max_queue_depth를 넘지 않는지 확인 (넘으면 QueueFullError)
+
+        빈 실행 슬롯으로 바로 시작할 작업은 대기열을 차지하지 않는다.
+        """
+        free_slots = max(0, self.max_concurrent_jobs - len(self._running))
+        if len(self._pending) + max(0, count - free_slots) > self.max_queue_depth:
+            raise QueueFullError(f"대기 중인 분석이 너무 많습니다. ({self.max_queue_depth}개)")
+
+    def submit(self, job_id: str, job: Callable[[], Awaitable[Any]]) -> int:
+        """작업 등록 후 대기 순번 반환 (0이면 바로 실행, 대기열이 가득 차면 QueueFullError)"""
+        self.ensure_capacity(1)
+        self._pending.append((job_id, job))
+        self._dispatch()
+        return self.queue_position(job_id) or 0
+
+    def queue_position(self, job_id: str) -> Optional[int]:
+        """대기 순번 (1부터 시작, 실행 중이거나 없는 작업은 None)"""
+        for index, (pending_id, _) in enumerate(self._pending):
+            if pending_id == job_id:
+                return index + 1
+        return None
+
+    def is_running(self, job_id: str) -> bool:
+        return job_id in self._running
+
+    async def run_in_thread(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """블로킹 함수를 크롤링 스레드 풀에서 실행"""
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.crawl_workers, thread_name_prefix="crawl"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._thread_pool, functools.partial(fn, *args, **kwargs))
+
+    async def run_in_process(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """CPU 위주의 함수를 분석 프로세스 풀에서 실행 (fn과 인자는 pickle 가능해야 함)"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.analysis_workers)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._process_pool, functools.partial(fn, *args, **kwargs))
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄러 상태"""
+        return {
+            'running': len(self._running),
+            'queued': len(self._pending),
+            'max_concurrent_jobs': self.max_concurrent_jobs,
+            'max_queue_depth': self.max_queue_depth,
+        }
+
+    def shutdown(self):
+        """실행 중인 작업 취소 및 풀 정리"""
+        for task in list(self._tasks.values()):
+            task.cancel()
+        self._pending.clear()
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False, cancel_futures=True)
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while self._pending and len(self._running) < self.max_concurrent_jobs:
+            job_id, job = self._pending.popleft()
+            self._running.add(job_id)
+            self._tasks[job_id] = loop.create_task(self._run(job_id, job))
+
+    async def _run(self, job_id: str, job: Callable[[], Awaitable[Any]]):
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"작업 실행 실패 ({job_id}): {e}")
+        finally:
+            self._running.discard(job_id)
+            self._tasks.pop(job_id, None)
+            self._dispatch()
+
+
+class DomainRateLimiter:
+    """도메인별 동시 수집 수와 수집 시작 간격 제한 (크롤링 스레드에서 사용)
+
+    같은 쇼핑몰로 향하는 수집이 몰려도 동시에 max_concurrent개까지만,
+    시작 간격은 min_interval초 이상으로 벌린다.
+    """
+
+    def __init__(self, max_concurrent: int = 2, min_interval: float = 1.0):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+        self._active: Dict[str, int] = {}
+        self.waited_seconds = 0.0
+
+    @classmethod
+    def from_env(cls) -> "DomainRateLimiter":
+        """환경 변수로 제한 설정"""
+        return cls(
+            max_concurrent=int(os.getenv('DOMAIN_MAX_CONCURRENT', '2')),
+            min_interval=float(os.getenv('DOMAIN_MIN_INTERVAL', '1.0')),
+        )
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        host = (urlsplit(url).hostname or '').lower().rstrip('.')
+        return DOMAIN_ALIASES.get(host, host)
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """도메인 슬롯을 얻고 시작 간격을 지킨 뒤 수집 실행"""
+        domain = self.domain_of(url)
+        with self._lock:
+            semaphore = self._semaphores.setdefault(domain, threading.BoundedSemaphore(self.max_concurrent))
+
+        start = time.monotonic()
+        semaphore.acquire()
+        try:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_start.get(domain, now))
+                self._next_start[domain] = start_at + self.min_interval
+                self._active[domain] = self._active.get(domain, 0) + 1
+            if start_at > now:
+                time.sleep(start_at - now)
+            with self._lock:
+                self.waited_seconds += time.monotonic() - start
+
+            yield
+        finally:
+            with self._lock:
+                self._active[domain] = self._active.get(domain, 1) - 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'min_interval': self.min_interval,
+                'active': {domain: count for domain, count in self._active.items() if count},
+                'waited_seconds': round(self.waited_seconds, 3),
+            }
@@ -0,0 +1,348 @@
+# VIBE 리뷰 분석기 - 분석 작업 저장소
+# 진행 중/최근 작업 상태는 메모리(LRU + TTL)에, 끝난 작업의 결과는 압축 JSON으로 SQLite에 둔다.
+# 메모리에서 밀려난 결과는 /results 요청 때 디스크에서 다시 읽고, 서버를 재시작해도 남는다.
+# 디스크에도 보관 기간/최대 건수가 있어 작업이 끝날 때마다 오래된 작업부터 지운다.
+# 직렬화/압축/디스크 입출력은 메모리 상태 잠금 밖에서 하므로 상태 조회가 디스크 쓰기를 기다리지 않는다.
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from progress_events import TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'jobs.sqlite3')
+
+# 디스크에 저장하지 않는 작업 필드 (결과는 별도 컬럼, 중간 결과는 진행 중에만 의미 있음)
+_VOLATILE_FIELDS = ('result', 'partial_result')
+
+
+class JobStore:
+    """분석 작업 상태/결과 저장소
+
+    - 작업 상태: 최대 max_tasks개를 메모리에 유지, 끝난 지 ttl_seconds가 지난 작업부터 제거
+      (진행 중인 작업은 제거하지 않음)
+    - 결과: 최근 max_results개만 메모리에 두고 나머지는 디스크에서 지연 로드
+    - 디스크: 끝난 지 disk_ttl_seconds가 지났거나 최근 disk_max_jobs개 밖인 작업은 삭제 (0이면 제한 없음)
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_JOB_STORE_PATH,
+        max_tasks: int = 1000,
+        max_results: int = 20,
+        ttl_seconds: float = 3600,
+        persist: bool = True,
+        dedup_ttl: float = 600,
+        disk_ttl_seconds: float = 7 * 24 * 3600,
+        disk_max_jobs: int = 5000,
+        on_evict: Optional[Callable[[str], None]] = None,
+    ):
+        self.path = path
+        self.max_tasks = max_tasks
+        self.max_results = max_results
+        self.ttl_seconds = ttl_seconds
+        self.persist = persist
+        # 같은 요청 키의 완료 결과를 재사용하는 시간
+        self.dedup_ttl = dedup_ttl
+        self.disk_ttl_seconds = disk_ttl_seconds
+        self.disk_max_jobs = disk_max_jobs
+        # 작업 상태가 메모리에서 빠질 때 호출 (진행 이벤트 정리 등)
+        self.on_evict = on_evict
+
+        # _lock: 메모리 상태, _db_lock: SQLite 연결 (둘 다 필요하면 _lock을 먼저 잡지 않는다)
+        self._lock = threading.RLock()
+        self._db_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # job_id -> (결과, 직렬화 크기)
+        self._results: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        # 요청 키 -> 가장 최근 작업 ID (메모리에 있는 작업만)
+        self._dedup_keys: Dict[str, str] = {}
+
+        # 스크레이프 때 잠금/디스크 없이 읽는 메모리 적재량
+        self.result_bytes_in_memory = 0
+
+        self.result_hits = 0
+        self.result_loads = 0
+        self.task_evictions = 0
+        self.result_evictions = 0
+        self.deduplicated = 0
+        self.disk_evictions = 0
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "JobStore":
+        """환경 변수로 저장소 설정"""
+        return cls(
+            path=os.getenv('JOB_STORE_PATH', DEFAULT_JOB_STORE_PATH),
+            max_tasks=int(os.getenv('JOB_STORE_MAX_TASKS', '1000')),
+            max_results=int(os.getenv('JOB_STORE_MAX_RESULTS', '20')),
+            ttl_seconds=float(os.getenv('JOB_STORE_TTL', '3600')),
+            persist=os.getenv('JOB_STORE_PERSIST', 'true').lower() != 'false',
+            dedup_ttl=float(os.getenv('JOB_DEDUP_TTL', '600')),
+            disk_ttl_seconds=float(os.getenv('JOB_STORE_DISK_TTL', str(7 * 24 * 3600))),
+            disk_max_jobs=int(os.getenv('JOB_STORE_DISK_MAX_JOBS', '5000')),
+            **kwargs
+        )
+
+    @property
+    def tasks_in_memory(self) -> int:
+        return len(self._tasks)
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 (_db_lock을 잡은 상태에서 호출)"""
+        if self._conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    task TEXT NOT NULL,
+                    result BLOB,
+                    result_size INTEGER,
+                    finished_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_finished_at ON jobs (finished_at)")
+        return self._conn
+
+    def create(self, job_id: str, task: Dict[str, Any], dedup_key: Optional[str] = None):
+        with self._lock:
+            self._tasks[job_id] = dict(task, dedup_key=dedup_key)
+            if dedup_key is not None:
+                self._dedup_keys[dedup_key] = job_id
+            self._evict_tasks()
+
+    def find_duplicate(self, dedup_key: str, include_completed: bool = True) -> Optional[str]:
+        """같은 요청 키로 진행 중인 작업, 또는 dedup_ttl 안에 완료된 작업의 ID (없으면 None)"""
+        with self._lock:
+            job_id = self._dedup_keys.get(dedup_key)
+            task = self._tasks.get(job_id) if job_id else None
+            if task is None:
+                return None
+
+            status = task.get('status')
+            if status not in TERMINAL_STATUSES:
+                self.deduplicated += 1
+                return job_id
+            if (include_completed and status == 'completed'
+                    and time.time() - task['finished_at'] <= self.dedup_ttl):
+                self.deduplicated += 1
+                return job_id
+            return None
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 사본 (메모리에 없으면 디스크에서, 결과 본문은 get_result로)"""
+        with self._lock:
+            task = self._tasks.get(job_id)
+            if task is not None:
+                self._tasks.move_to_end(job_id)
+                return dict(task)
+
+        if not self.persist:
+            return None
+        with self._db_lock:
+            row = self._connect().execute("SELECT task FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        with self._lock:
+            task = self._tasks.setdefault(job_id, json.loads(row[0]))
+            self._evict_tasks()
+            return dict(task)
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+    def update(self, job_id: str, **fields) -> Optional[Dict[str, Any]]:
+        """작업 상태 갱신 후 사본 반환, 종료 상태가 되면 결과와 함께 디스크에 저장 (블로킹)"""
+        with self._lock:
+            task = self._tasks.get(job_id)
+            if task is None:
+                return None
+
+            result = fields.pop('result', None)
+            task.update(fields)
+            self._tasks.move_to_end(job_id)
+
+            finished = task.get('status') in TERMINAL_STATUSES
+            if finished:
+                task.setdefault('finished_at', time.time())
+                for field in _VOLATILE_FIELDS:
+                    task.pop(field, None)
+                if result is not None:
+                    task['has_result'] = True
+                    # 디스크에 쓰는 동안에도 결과를 읽을 수 있게 먼저 메모리에 올린다 (크기는 직렬화 후)
+                    self._store_result(job_id, result, 0)
+            snapshot = dict(task)
+
+        if finished:
+            self._finish(job_id, snapshot, result)
+        return snapshot
+
+    def _finish(self, job_id: str, task: Dict[str, Any], result: Optional[Dict[str, Any]]):
+        """끝난 작업을 직렬화해 저장 (메모리 상태 잠금 밖에서)"""
+        blob = None
+        size = 0
+        if result is not None:
+            encoded = json.dumps(result, ensure_ascii=False).encode('utf-8')
+            size = len(encoded)
+            if self.persist:
+                blob = zlib.compress(encoded, 6)
+
+        if self.persist:
+            with self._db_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO jobs (job_id, task, result, result_size, finished_at) VALUES (?, ?, ?, ?, ?)",
+                        (job_id, json.dumps(task, ensure_ascii=False), blob, size, task['finished_at'])
+                    )
+                    self._prune_disk(conn)
+
+        with self._lock:
+            if result is not None and job_id in self._results and self._results[job_id][0] is result:
+                self._store_result(job_id, result, size)
+            # 디스크에 쓴 뒤에 밀어내야 그 사이 조회가 결과를 놓치지 않는다
+            self._evict_results()
+            self._evict_tasks()
+
+    def _prune_disk(self, conn: sqlite3.Connection):
+        """보관 기간이 지났거나 최대 건수를 넘은 작업을 디스크에서 삭제 (_db_lock을 잡은 트랜잭션 안에서 호출)"""
+        deleted = 0
+        if self.disk_ttl_seconds > 0:
+            deleted += conn.execute(
+                "DELETE FROM jobs WHERE finished_at < ?", (time.time() - self.disk_ttl_seconds,)
+            ).rowcount
+        if self.disk_max_jobs > 0:
+            deleted += conn.execute(
+                "DELETE FROM jobs WHERE job_id NOT IN (SELECT job_id FROM jobs ORDER BY finished_at DESC LIMIT ?)",
+                (self.disk_max_jobs,)
+            ).rowcount
+        if deleted:
+            self.disk_evictions += deleted
+
+    def _store_result(self, job_id: str, result: Dict[str, Any], size: int):
+        previous = self._results.get(job_id)
+        if previous is not None:
+            self.result_bytes_in_memory -= previous[1]
+        self._results[job_id] = (result, size)
+        self._results.move_to_end(job_id)
+        self.result_bytes_in_memory += size
+
+    def get_result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """완료된 작업의 결과 (메모리에 없으면 디스크에서 읽어 LRU에 올림)"""
+        with self._lock:
+            entry = self._results.get(job_id)
+            if entry is not None:
+                self._results.move_to_end(job_id)
+                self.result_hits += 1
+                return entry[0]
+
+        if not self.persist:
+            return None
+        with self._db_lock:
+            row = self._connect().execute(
+                "SELECT result, result_size FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+
+        result = json.loads(zlib.decompress(row[0]).decode('utf-8'))
+        with self._lock:
+            self.result_loads += 1
+            self._store_result(job_id, result, row[1])
+            self._evict_results()
+        return result
+
+    def delete(self, job_id: str):
+        with self._lock:
+            task = self._tasks.pop(job_id, None)
+            if task is not None:
+                self._forget_dedup_key(job_id, task)
+            entry = self._results.pop(job_id, None)
+            if entry is not None:
+                self.result_bytes_in_memory -= entry[1]
+        if self.persist:
+            with self._db_lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+        if self.on_evict:
+            self.on_evict(job_id)
+
+    def _evict_tasks(self):
+        """TTL이 지났거나 한도를 넘은 종료 작업을 오래된 것부터 메모리에서 제거"""
+        now = time.time()
+        over = len(self._tasks) - self.max_tasks
+        evicted = []
+        for job_id, task in self._tasks.items():
+            finished_at = task.get('finished_at')
+            if finished_at is None:
+                continue
+            if over > 0 or now - finished_at > self.ttl_seconds:
+                evicted.append(job_id)
+                over -= 1
+
+        for job_id in evicted:
+            self._forget_dedup_key(job_id, self._tasks.pop(job_id))
+            self.task_evictions += 1
+            if self.on_evict:
+                self.on_evict(job_id)
+
+    def _forget_dedup_key(self, job_id: str, task: Dict[str, Any]):
+        dedup_key = task.get('dedup_key')
+        if dedup_key is not None and self._dedup_keys.get(dedup_key) == job_id:
+            del self._dedup_keys[dedup_key]
+
+    def _evict_results(self):
+        while len(self._results) > self.max_results:
+            _, (_, size) = self._results.popitem(last=False)
+            self.result_bytes_in_memory -= size
+            self.result_evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """메모리 적재 현황과 디스크 저장 규모 (블로킹, 디스크 조회 포함)"""
+        with self._lock:
+            running = sum(1 for task in self._tasks.values() if task.get('status') not in TERMINAL_STATUSES)
+            stats = {
+                'tasks_in_memory': len(self._tasks),
+                'running_tasks': running,
+                'results_in_memory': len(self._results),
+                'result_bytes_in_memory': self.result_bytes_in_memory,
+                'max_tasks': self.max_tasks,
+                'max_results': self.max_results,
+                'ttl_seconds': self.ttl_seconds,
+                'result_hits': self.result_hits,
+                'result_loads': self.result_loads,
+                'task_evictions': self.task_evictions,
+                'result_evictions': self.result_evictions,
+                'deduplicated': self.deduplicated,
+                'dedup_ttl': self.dedup_ttl,
+                'persist': self.persist,
+                'disk_ttl_seconds': self.disk_ttl_seconds,
+                'disk_max_jobs': self.disk_max_jobs,
+                'disk_evictions': self.disk_evictions
+            }
+        if self.persist:
+            with self._db_lock:
+                count, compressed, raw = self._connect().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(result)), 0), COALESCE(SUM(result_size), 0) FROM jobs"
+                ).fetchone()
+            stats.update({'jobs_on_disk': count, 'disk_bytes': compressed, 'disk_raw_bytes': raw})
+        return stats
+
+    def close(self):
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
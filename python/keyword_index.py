@@ -0,0 +1,58 @@
+# VIBE 리뷰 분석기 - 키워드 역색인
+# 리뷰를 한 번만 토큰화해 토큰 → 리뷰 번호 목록을 만들고,
+# 키워드별 감정은 이미 계산된 리뷰 극성을 평균 내는 집계로 처리한다.
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tokenizer import Tokenizer, get_tokenizer
+
+
+class KeywordIndex:
+    """토큰/구 빈도 + 토큰/구 → 리뷰 번호 역색인"""
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.phrase_counts: Counter = Counter()
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self.num_reviews = 0
+
+    @classmethod
+    def build(cls, texts: Iterable[str], tokenizer: Optional[Tokenizer] = None) -> "KeywordIndex":
+        """텍스트 목록을 한 번 훑어 색인 생성"""
+        tokenizer = tokenizer or get_tokenizer()
+        index = cls()
+        for text in texts:
+            tokens = tokenizer.tokenize(text)
+            index.add(tokens, tokenizer.phrases(tokens))
+        return index
+
+    def add(self, tokens: Sequence[str], phrases: Sequence[str] = ()) -> int:
+        """리뷰 하나의 토큰과 구 추가, 부여된 리뷰 번호 반환"""
+        review_index = self.num_reviews
+        self.num_reviews += 1
+        self.counts.update(tokens)
+        self.phrase_counts.update(phrases)
+        for term in set(tokens).union(phrases):
+            self._postings[term].append(review_index)
+        return review_index
+
+    def most_common(self, n: int) -> List[Tuple[str, int]]:
+        return self.counts.most_common(n)
+
+    def most_common_phrases(self, n: int, min_count: int = 2) -> List[Tuple[str, int]]:
+        """min_count번 이상 나온 구 상위 n개"""
+        return [(phrase, count) for phrase, count in self.phrase_counts.most_common(n) if count >= min_count]
+
+    def review_ids(self, term: str) -> np.ndarray:
+        """토큰/구가 등장한 리뷰 번호"""
+        return np.asarray(self._postings.get(term, ()), dtype=np.int64)
+
+    def mean_polarity(self, term: str, polarities: np.ndarray) -> Optional[float]:
+        """토큰/구가 등장한 리뷰들의 평균 극성 (등장 리뷰가 없으면 None)"""
+        ids = self.review_ids(term)
+        if ids.size == 0:
+            return None
+        return float(polarities[ids].mean())
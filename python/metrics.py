@@ -0,0 +1,258 @@
+# VIBE 리뷰 분석기 - 계측 및 Prometheus 형식 지표
+# 카운터/게이지/히스토그램을 외부 의존성 없이 모아 /metrics에서 텍스트 형식으로 내보내고,
+# 분석 작업마다 단계별 소요 시간(StageTimer)을 기록해 결과에 붙인다.
+
+import bisect
+import math
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labelnames: Sequence[str], values: LabelValues, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(zip(labelnames, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = defaultdict(float)
+
+    def inc(self, amount: float = 1, **labels):
+        with self._lock:
+            self._values[self._key(labels)] += amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """스크레이프 시점에 콜백으로 값을 읽는 게이지 (콜백은 숫자 또는 {라벨값 튜플: 숫자})"""
+
+    kind = 'gauge'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Union[float, Dict[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def samples(self) -> List[str]:
+        value = self.callback()
+        if not isinstance(value, dict):
+            return [f"{self.name} {_format_value(value)}"]
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(sample)}"
+            for key, sample in value.items()
+        ]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨값 -> [버킷별 개수..., 합계, 전체 개수]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                entry[index] += 1
+            entry[-2] += value
+            entry[-1] += 1
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(entry)) for key, entry in self._values.items()]
+
+        lines = []
+        for key, entry in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {_format_value(cumulative)}")
+            labels = _format_labels(self.labelnames, key, [('le', '+Inf')])
+            lines.append(f"{self.name}_bucket{labels} {_format_value(entry[-1])}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(entry[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {_format_value(entry[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표 등록 및 텍스트 형식(text/plain; version=0.0.4) 출력"""
+
+    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, callback, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, callback, labelnames))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines: List[str] = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:  # 콜백 게이지 하나가 실패해도 나머지는 내보낸다
+                lines.append(f"# {metric.name} 수집 실패: {e}")
+                continue
+            lines.extend(metric.header())
+            lines.extend(samples)
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'review_analyzer_stage_seconds', "Time spent per analysis stage", ('stage',)
+)
+PAGE_LATENCY_SECONDS = REGISTRY.histogram(
+    'review_analyzer_page_latency_seconds', "Review page fetch/render latency", ('mode',),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+)
+PAGES_TOTAL = REGISTRY.counter('review_analyzer_pages_total', "Review pages fetched", ('mode',))
+REVIEWS_TOTAL = REGISTRY.counter('review_analyzer_reviews_total', "Reviews collected", ('mode',))
+RETRIES_TOTAL = REGISTRY.counter('review_analyzer_retries_total', "Crawl retries and fallbacks", ('reason',))
+FAILURES_TOTAL = REGISTRY.counter('review_analyzer_failures_total', "Failures by stage", ('stage',))
+ANALYSES_TOTAL = REGISTRY.counter('review_analyzer_analyses_total', "Finished analyses", ('status',))
+
+
+class StageTimer:
+    """분석 작업 하나의 단계별 소요 시간
+
+    stage()는 중첩될 수 있고, 안쪽 단계 시간은 바깥 단계에서 빠진다 (스레드별 스택).
+    그래서 breakdown()의 단계 시간을 더하면 계측된 전체 시간과 같다.
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[List]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        stack = self._stack()
+        frame = [name, 0.0]  # [단계 이름, 안쪽 단계 시간]
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            self.add(name, elapsed - frame[1])
+            if stack:
+                stack[-1][1] += elapsed
+
+    def add(self, name: str, seconds: float):
+        with self._lock:
+            self._totals[name] = self._totals.get(name, 0.0) + seconds
+
+    def breakdown(self) -> Dict[str, float]:
+        with self._lock:
+            totals = dict(self._totals)
+        breakdown = {name: round(seconds, 4) for name, seconds in totals.items()}
+        breakdown['total'] = round(sum(totals.values()), 4)
+        return breakdown
+
+    def publish(self, histogram: Optional[Histogram] = None):
+        """단계별 합계를 히스토그램에 기록 (작업 종료 시 한 번)"""
+        histogram = histogram or STAGE_SECONDS
+        with self._lock:
+            totals = dict(self._totals)
+        for name, seconds in totals.items():
+            histogram.observe(seconds, stage=name)
@@ -0,0 +1,243 @@
+# VIBE 리뷰 분석기 - 페이지 준비 상태 대기
+# 고정된 time.sleep 대신 WebDriverWait 조건(DOM 변화, 요소 교체, 네트워크 유휴)으로 기다리고,
+# 최근 페이지 지연 시간으로 타임아웃을 조정하며 대기별 소요 시간을 기록한다.
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# 마지막 DOM 변경 시각을 window에 기록하는 MutationObserver 설치 스크립트
+_INSTALL_MUTATION_OBSERVER = """
+if (!window.__vibeMutationObserver) {
+    window.__vibeLastMutation = performance.now();
+    window.__vibeMutationObserver = new MutationObserver(function () {
+        window.__vibeLastMutation = performance.now();
+    });
+    window.__vibeMutationObserver.observe(document, {childList: true, subtree: true, attributes: true});
+}
+"""
+
+_MS_SINCE_LAST_MUTATION = "return performance.now() - (window.__vibeLastMutation || 0);"
+
+# 진행 중인 fetch/XMLHttpRequest 수와 마지막으로 끝난 시각을 window에 기록하는 카운터 설치 스크립트
+# (Resource Timing 항목은 요청이 끝난 뒤에야 생기므로 진행 중인 요청은 이렇게 따로 센다)
+_INSTALL_REQUEST_COUNTER = """
+if (!window.__vibeRequestCounter) {
+    window.__vibeRequestCounter = true;
+    window.__vibePendingRequests = 0;
+    window.__vibeLastRequestEnd = performance.now();
+    var finished = function () {
+        window.__vibePendingRequests = Math.max(0, window.__vibePendingRequests - 1);
+        window.__vibeLastRequestEnd = performance.now();
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            window.__vibePendingRequests++;
+            try {
+                var response = originalFetch.apply(this, arguments);
+            } catch (error) {
+                finished();
+                throw error;
+            }
+            response.then(finished, finished);
+            return response;
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        window.__vibePendingRequests++;
+        this.addEventListener('loadend', finished);
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (error) {
+            this.removeEventListener('loadend', finished);
+            finished();
+            throw error;
+        }
+    };
+}
+"""
+
+# [마지막으로 끝난 요청/리소스 이후 경과 시간(ms), 진행 중인 fetch/XHR 수]
+_NETWORK_STATE = """
+var entries = performance.getEntriesByType('resource');
+var lastEnd = window.__vibeLastRequestEnd || 0;
+for (var i = 0; i < entries.length; i++) {
+    if (entries[i].responseEnd > lastEnd) { lastEnd = entries[i].responseEnd; }
+}
+return [performance.now() - lastEnd, window.__vibePendingRequests || 0];
+"""
+
+
+class LatencyHistory:
+    """대기 종류별 최근 소요 시간 (여러 크롤러가 공유)"""
+
+    def __init__(self, size: int = 50):
+        self.size = size
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.size))
+        self._lock = threading.Lock()
+
+    def record(self, label: str, seconds: float):
+        with self._lock:
+            self._samples[label].append(seconds)
+
+    def percentile(self, label: str, q: float = 0.9) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(label, ()))
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(round(q * (len(samples) - 1))))
+        return samples[index]
+
+
+# 프로세스 전체에서 공유하는 페이지 지연 기록
+page_latencies = LatencyHistory()
+
+
+class AdaptiveWaiter:
+    """WebDriverWait 기반 대기 + 적응형 타임아웃 + 대기별 소요 시간 기록
+
+    타임아웃 = 최근 성공한 같은 종류 대기의 p90 × multiplier (min_timeout ~ max_timeout 범위),
+    기록이 없으면 default_timeout.
+    """
+
+    def __init__(
+        self,
+        driver,
+        latencies: Optional[LatencyHistory] = None,
+        default_timeout: float = 10.0,
+        min_timeout: float = 2.0,
+        max_timeout: float = 20.0,
+        multiplier: float = 3.0,
+        poll_frequency: float = 0.1,
+    ):
+        self.driver = driver
+        self.latencies = latencies or page_latencies
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.multiplier = multiplier
+        self.poll_frequency = poll_frequency
+        self.timings: List[Dict[str, Any]] = []
+
+    def timeout_for(self, label: str) -> float:
+        """최근 지연 시간으로 계산한 타임아웃"""
+        p90 = self.latencies.percentile(label)
+        if p90 is None:
+            return self.default_timeout
+        return max(self.min_timeout, min(self.max_timeout, p90 * self.multiplier))
+
+    def wait(self, label: str, condition: Callable[[Any], Any], timeout: Optional[float] = None) -> Any:
+        """조건이 참이 될 때까지 대기 (타임아웃이면 None 반환, 예외 없음)"""
+        timeout = timeout if timeout is not None else self.timeout_for(label)
+        start = time.perf_counter()
+        result = None
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+        except TimeoutException:
+            pass
+        elapsed = time.perf_counter() - start
+
+        timed_out = result is None
+        if not timed_out:
+            self.latencies.record(label, elapsed)
+        else:
+            logger.warning(f"페이지 대기 시간 초과: {label} ({timeout:.1f}초)")
+
+        self.timings.append({
+            'label': label,
+            'seconds': round(elapsed, 3),
+            'timeout': round(timeout, 2),
+            'timed_out': timed_out
+        })
+        return result
+
+    def wait_for_document_ready(self, label: str = 'document_ready'):
+        """document.readyState가 complete가 될 때까지"""
+        return self.wait(
+            label,
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
+
+    def wait_for_element(self, label: str, selector: str):
+        """CSS 셀렉터에 맞는 요소가 나타날 때까지"""
+        return self.wait(label, EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+
+    def wait_for_replacement(self, label: str, old_element, selector: str):
+        """기존 요소가 교체(DOM에서 제거 또는 내용 변경)되고 새 요소가 나타날 때까지 (페이지 넘김 감지)"""
+        try:
+            old_text = old_element.text
+        except WebDriverException:
+            old_text = None
+
+        def replaced(driver):
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if not elements:
+                return False
+            if EC.staleness_of(old_element)(driver):
+                return elements
+            try:
+                return elements if elements[0].text != old_text else False
+            except StaleElementReferenceException:
+                return False
+
+        return self.wait(label, replaced)
+
+    def wait_for_dom_quiet(self, label: str = 'dom_quiet', quiet_ms: int = 300):
+        """quiet_ms 동안 DOM 변경이 없을 때까지 (MutationObserver)"""
+        try:
+            self.driver.execute_script(_INSTALL_MUTATION_OBSERVER)
+        except WebDriverException as e:
+            logger.warning(f"MutationObserver 설치 실패: {e}")
+            return None
+        return self.wait(
+            label,
+            lambda driver: driver.execute_script(_MS_SINCE_LAST_MUTATION) >= quiet_ms
+        )
+
+    def wait_for_network_idle(self, label: str = 'network_idle', idle_ms: int = 500, max_timeout: Optional[float] = None):
+        """진행 중인 fetch/XHR이 없고 idle_ms 동안 끝난 요청/리소스가 없을 때까지
+
+        fetch/XHR 카운터는 처음 기다릴 때 설치되므로 그 전에 시작해 아직 안 끝난 요청은 세지 못한다
+        (끝나면 Resource Timing으로 유휴 시간에는 반영된다).
+        광고/트래킹 요청이 계속 오가는 페이지는 유휴 상태가 오지 않을 수 있어 max_timeout으로 상한을 둔다.
+        """
+        try:
+            self.driver.execute_script(_INSTALL_REQUEST_COUNTER)
+        except WebDriverException as e:
+            logger.warning(f"요청 카운터 설치 실패: {e}")
+            return None
+
+        def idle(driver):
+            since_last, pending = driver.execute_script(_NETWORK_STATE)
+            return pending == 0 and since_last >= idle_ms
+
+        timeout = self.timeout_for(label)
+        if max_timeout is not None:
+            timeout = min(timeout, max_timeout)
+        return self.wait(label, idle, timeout=timeout)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """대기 종류별 횟수, 합계/평균/최대 소요 시간, 타임아웃 수"""
+        summary: Dict[str, Dict[str, Any]] = {}
+        for timing in self.timings:
+            entry = summary.setdefault(timing['label'], {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            entry['count'] += 1
+            entry['total'] += timing['seconds']
+            entry['max'] = max(entry['max'], timing['seconds'])
+            entry['timeouts'] += int(timing['timed_out'])
+
+        for entry in summary.values():
+            entry['total'] = round(entry['total'], 3)
+            entry['mean'] = round(entry['total'] / entry['count'], 3)
+        return summary
@@ -0,0 +1,27 @@
+# VIBE 리뷰 분석기 - 상품 URL 처리
+# 요청 라우팅(중복 분석 키, 캐시 키)에 쓰는 가벼운 URL 함수들.
+# HTTP 수집기(requests/bs4)를 불러오지 않고도 쓸 수 있도록 따로 둔다.
+
+import re
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
+
+
+def extract_product_id(url: str) -> Optional[str]:
+    """쿠팡 상품 URL에서 productId 추출"""
+    match = re.search(r'/products/(\d+)', url)
+    if match:
+        return match.group(1)
+    match = re.search(r'[?&]productId=(\d+)', url)
+    return match.group(1) if match else None
+
+
+def normalize_product_url(url: str) -> str:
+    """같은 상품을 가리키는 URL을 하나의 키로 (쿠팡은 상품 ID, 그 외는 fragment/끝 슬래시 제거)"""
+    url = url.strip()
+    product_id = extract_product_id(url) if 'coupang.com' in url else None
+    if product_id:
+        return f"coupang:{product_id}"
+
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
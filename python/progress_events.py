@@ -0,0 +1,115 @@
+# VIBE 리뷰 분석기 - 진행 상황 푸시 브로커
+# 크롤링/분석 스레드가 올리는 상태 이벤트를 작업별 "최신 상태 하나"로만 보관하고,
+# 구독자(SSE 연결)는 변경 알림을 받을 때 최신 상태만 읽어 간다.
+# 구독자마다 최소 전송 간격을 두므로 리뷰 단위로 쏟아지는 갱신도 초당 몇 건으로 합쳐진다.
+
+import asyncio
+import os
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+# 이 상태의 이벤트를 보내면 스트림을 닫는다
+TERMINAL_STATUSES = ('completed', 'error')
+
+
+class ProgressBroker:
+    """작업별 최신 진행 이벤트 보관 + 구독자 알림 (발행은 어느 스레드에서나 가능)"""
+
+    def __init__(self, min_interval: float = 0.25, heartbeat: float = 15.0):
+        self.min_interval = min_interval
+        self.heartbeat = heartbeat
+
+        self._lock = threading.Lock()
+        # job_id -> (버전, 최신 이벤트)
+        self._latest: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # job_id -> [(구독자 이벤트 루프, 알림 이벤트)]
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+        self._published = 0
+        self._delivered = 0
+
+    @classmethod
+    def from_env(cls) -> "ProgressBroker":
+        """환경 변수로 브로커 설정"""
+        return cls(
+            min_interval=float(os.getenv('PROGRESS_MIN_INTERVAL', '0.25')),
+            heartbeat=float(os.getenv('PROGRESS_HEARTBEAT', '15')),
+        )
+
+    def publish(self, job_id: str, event: Dict[str, Any]):
+        """작업의 최신 상태 교체 후 구독자 깨우기 (이전 이벤트는 덮어씀)"""
+        with self._lock:
+            version = self._latest.get(job_id, (0, None))[0] + 1
+            self._latest[job_id] = (version, event)
+            self._published += 1
+            subscribers = list(self._subscribers.get(job_id, ()))
+
+        for loop, waiter in subscribers:
+            try:
+                loop.call_soon_threadsafe(waiter.set)
+            except RuntimeError:
+                # 구독자 루프가 이미 닫힘
+                pass
+
+    def latest(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._latest.get(job_id)
+        return entry[1] if entry else None
+
+    def discard(self, job_id: str):
+        """작업 상태 삭제 (작업 저장소에서 제거될 때)"""
+        with self._lock:
+            self._latest.pop(job_id, None)
+
+    async def subscribe(self, job_id: str) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """변경될 때마다 최신 이벤트를 내보내는 비동기 이터레이터
+
+        전송 후 min_interval 동안은 쌓인 변경을 마지막 것 하나로 합치고,
+        heartbeat초 동안 변경이 없으면 연결 유지용으로 None을 내보낸다.
+        종료 상태 이벤트를 보낸 뒤 끝난다.
+        """
+        loop = asyncio.get_running_loop()
+        waiter = asyncio.Event()
+        subscriber = (loop, waiter)
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append(subscriber)
+
+        try:
+            sent_version = 0
+            while True:
+                # 깨우기를 놓치지 않도록 읽기 전에 알림을 초기화
+                waiter.clear()
+                with self._lock:
+                    version, event = self._latest.get(job_id, (0, None))
+
+                if version != sent_version and event is not None:
+                    sent_version = version
+                    with self._lock:
+                        self._delivered += 1
+                    yield event
+                    if event.get('status') in TERMINAL_STATUSES:
+                        return
+                    await asyncio.sleep(self.min_interval)
+                    continue
+
+                try:
+                    await asyncio.wait_for(waiter.wait(), timeout=self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(job_id, [])
+                if subscriber in subscribers:
+                    subscribers.remove(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(job_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """발행/전송 이벤트 수 (전송 < 발행이면 그만큼 합쳐진 것)"""
+        with self._lock:
+            return {
+                'jobs': len(self._latest),
+                'subscribers': sum(len(subscribers) for subscribers in self._subscribers.values()),
+                'published': self._published,
+                'delivered': self._delivered,
+                'min_interval': self.min_interval,
+            }
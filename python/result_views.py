@@ -0,0 +1,142 @@
+# VIBE 리뷰 분석기 - 분석 결과 응답 가공
+# /results 응답에서 필요한 필드만 고르고, 리뷰 목록/리뷰별 감정은 커서로 나눠 보내며,
+# 빠른 JSON 직렬화(orjson)와 gzip/brotli 압축, ETag 생성을 담당한다.
+
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 사용
+    brotli = None
+
+# 커서 페이지 단위로 나눠 보내는 목록 (결과 내 경로)
+PAGINATED_LISTS: Tuple[Tuple[str, ...], ...] = (
+    ('raw_reviews',),
+    ('sentiment', 'details'),
+)
+
+# 이보다 작은 응답은 압축하지 않음
+MIN_COMPRESS_BYTES = 1024
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """'product_info,statistics' → 정렬된 필드 튜플 (없으면 전체)"""
+    if not fields:
+        return None
+    return tuple(sorted({field.strip() for field in fields.split(',') if field.strip()}))
+
+
+def project_result(
+    result: Dict[str, Any],
+    fields: Optional[Sequence[str]] = None,
+    cursor: int = 0,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """필드 선택 + 리뷰 목록 커서 페이지 적용 (원본은 수정하지 않음)
+
+    limit이 없으면 목록 전체, 있으면 목록마다 [cursor, cursor + limit) 구간과
+    다음 커서를 'page'에 담는다. 결과는 완료 후 바뀌지 않으므로 위치 커서로 충분하다.
+    """
+    if fields:
+        view = {key: result[key] for key in ('id', *fields) if key in result}
+    else:
+        view = dict(result)
+
+    if limit is None:
+        return view
+
+    page: Dict[str, Any] = {'cursor': cursor, 'limit': limit, 'next_cursor': None}
+    for path in PAGINATED_LISTS:
+        parent = view
+        for key in path[:-1]:
+            if not isinstance(parent.get(key), dict):
+                parent = None
+                break
+            # 상위 사전을 복사해 원본 결과의 목록을 바꾸지 않는다
+            parent[key] = dict(parent[key])
+            parent = parent[key]
+
+        if parent is None or not isinstance(parent.get(path[-1]), list):
+            continue
+
+        items = parent[path[-1]]
+        parent[path[-1]] = items[cursor:cursor + limit]
+        page[f"{'.'.join(path)}_total"] = len(items)
+        if cursor + limit < len(items):
+            page['next_cursor'] = cursor + limit
+
+    view['page'] = page
+    return view
+
+
+def dumps(obj: Any) -> bytes:
+    """JSON 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        # rating_distribution처럼 정수 키를 쓰는 사전이 있다
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding의 q값으로 고른 압축 방식 (br은 brotli 설치 시, q=0은 거절, 같은 q면 br 우선)"""
+    if not accept_encoding:
+        return None
+
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(','):
+        name, *params = [token.strip() for token in part.split(';')]
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name.lower()] = quality
+
+    available = (('br',) if brotli is not None else ()) + ('gzip',)
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = qualities.get(encoding, qualities.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def result_etag(analysis_id: str, version: Any, *view_params: Any, encoding: Optional[str] = None) -> str:
+    """결과 버전 + 응답 형태(필드/커서/페이지 크기) + 압축 방식으로 만든 ETag
+
+    같은 결과라도 gzip/br/비압축 본문은 바이트가 다르므로 압축 방식마다 다른 강한 ETag를 쓴다.
+    """
+    key = '|'.join(str(part) for part in (analysis_id, version, *view_params))
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates: Iterable[str] = (tag.strip() for tag in if_none_match.split(','))
+    return any(tag == '*' or tag.removeprefix('W/') == etag for tag in candidates)
+
+
+def compress(body: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    """negotiate_encoding으로 고른 방식으로 압축, (본문, Content-Encoding) 반환 (작은 본문은 그대로)"""
+    if len(body) < MIN_COMPRESS_BYTES or not encoding:
+        return body, None
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(body, quality=5), 'br'
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=6), 'gzip'
+    return body, None
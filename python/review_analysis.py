@@ -0,0 +1,248 @@
+# VIBE 리뷰 분석기 - 리뷰 감정/키워드/통계 분석
+# numpy 기반 감정 백엔드와 키워드 역색인을 쓰므로 첫 분석 때(또는 사전 워밍업 때) import한다.
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from keyword_index import KeywordIndex
+from review_batch import MAX_RATING, ReviewBatch
+from sentiment import POLARITY_THRESHOLD, SentimentBackend, classify_polarities, get_sentiment_backend
+from tokenizer import Tokenizer, get_tokenizer
+
+# 분석기 메서드는 열 묶음을 받고, 수집기의 리뷰 사전 목록은 변환해서 쓴다
+Reviews = Union[ReviewBatch, Sequence[Dict[str, Any]]]
+
+class ReviewAnalyzer:
+    """리뷰 분석기 클래스"""
+    
+    def __init__(self, sentiment_backend: Optional[SentimentBackend] = None, tokenizer: Optional[Tokenizer] = None):
+        self.sentiment_backend = sentiment_backend or get_sentiment_backend()
+        self.tokenizer = tokenizer or get_tokenizer()
+    
+    def analyze_sentiment(self, reviews: Reviews, progress_callback=None) -> Dict[str, Any]:
+        """감정 분석 (백엔드가 전체 리뷰를 한 번에 점수화)"""
+        batch = ReviewBatch.coerce(reviews)
+        total_reviews = len(batch)
+        if progress_callback:
+            progress_callback(70, f"AI 감정 분석 중... ({total_reviews}개)")
+        
+        polarities = self.sentiment_backend.score_batch(batch.texts)
+        labels = classify_polarities(polarities)
+        
+        summary = self.summarize_sentiment(
+            total_reviews,
+            int(np.count_nonzero(labels == 'positive')),
+            int(np.count_nonzero(labels == 'negative')),
+            float(polarities.sum())
+        )
+        summary['details'] = [
+            {'sentiment': sentiment, 'polarity': polarity}
+            for sentiment, polarity in zip(labels.tolist(), polarities.tolist())
+        ]
+        
+        if progress_callback:
+            progress_callback(90, "AI 감정 분석 완료")
+        
+        return summary
+    
+    def summarize_sentiment(self, total_reviews: int, positive_count: int, negative_count: int, polarity_sum: float) -> Dict[str, Any]:
+        """감정 개수/극성 합 → 비율 요약 (details 제외)"""
+        neutral_count = total_reviews - positive_count - negative_count
+        avg_score = polarity_sum / total_reviews if total_reviews > 0 else 0
+        
+        return {
+            'positive': round((positive_count / total_reviews) * 100, 1) if total_reviews > 0 else 0,
+            'negative': round((negative_count / total_reviews) * 100, 1) if total_reviews > 0 else 0,
+            'neutral': round((neutral_count / total_reviews) * 100, 1) if total_reviews > 0 else 0,
+            'score': round(avg_score, 3),
+            'backend': self.sentiment_backend.name
+        }
+    
+    def build_keyword_index(self, reviews: Reviews) -> KeywordIndex:
+        """리뷰를 한 번 토큰화해 키워드/구 역색인 생성 (같은 텍스트는 토크나이저가 메모)"""
+        return KeywordIndex.build(ReviewBatch.coerce(reviews).texts, self.tokenizer)
+    
+    def extract_keywords(self, reviews: Optional[Reviews], top_n: int = 20, polarities: Optional[np.ndarray] = None, index: Optional[KeywordIndex] = None) -> List[Dict[str, Any]]:
+        """키워드 추출 및 분석
+        
+        키워드 감정은 해당 키워드가 나온 리뷰들의 극성 평균으로 집계한다.
+        polarities(analyze_sentiment 결과)와 index가 없으면 한 번만 계산한다.
+        둘 다 넘기면 reviews는 쓰지 않는다 (None 가능).
+        """
+        index = index if index is not None else self.build_keyword_index(reviews)
+        polarities = self._review_polarities(reviews, polarities)
+        return [
+            self._keyword_entry(index, word, count, polarities)
+            for word, count in index.most_common(top_n)
+        ]
+    
+    def extract_phrases(self, reviews: Optional[Reviews], top_n: int = 10, polarities: Optional[np.ndarray] = None, index: Optional[KeywordIndex] = None) -> List[Dict[str, Any]]:
+        """두 단어 구(바이그램) 추출 및 감정 집계 (2번 이상 나온 구만)"""
+        index = index if index is not None else self.build_keyword_index(reviews)
+        polarities = self._review_polarities(reviews, polarities)
+        return [
+            self._keyword_entry(index, phrase, count, polarities)
+            for phrase, count in index.most_common_phrases(top_n)
+        ]
+    
+    def _review_polarities(self, reviews: Optional[Reviews], polarities: Optional[np.ndarray]) -> np.ndarray:
+        if polarities is None:
+            polarities = self.sentiment_backend.score_batch(ReviewBatch.coerce(reviews).texts)
+        return np.asarray(polarities, dtype=np.float64)
+    
+    @staticmethod
+    def _keyword_entry(index: KeywordIndex, word: str, count: int, polarities: np.ndarray) -> Dict[str, Any]:
+        avg_sentiment = index.mean_polarity(word, polarities)
+        
+        if avg_sentiment is None:
+            sentiment = 'neutral'
+        elif avg_sentiment > POLARITY_THRESHOLD:
+            sentiment = 'positive'
+        elif avg_sentiment < -POLARITY_THRESHOLD:
+            sentiment = 'negative'
+        else:
+            sentiment = 'neutral'
+        
+        return {
+            'word': word,
+            'count': count,
+            'sentiment': sentiment
+        }
+    
+    def generate_statistics(self, reviews: Reviews, product_info: Dict[str, Any]) -> Dict[str, Any]:
+        """기본 통계 생성 (평점/길이 열의 벡터 연산)"""
+        batch = ReviewBatch.coerce(reviews)
+        return self.summarize_statistics(
+            len(batch),
+            batch.rating_counts(),
+            int(batch.ratings.sum(dtype=np.int64)),
+            int(batch.lengths.sum(dtype=np.int64))
+        )
+    
+    @staticmethod
+    def summarize_statistics(total_reviews: int, rating_counts: np.ndarray, rating_sum: int, length_sum: int) -> Dict[str, Any]:
+        """평점별 리뷰 수(인덱스 = 평점)/합계 → 기본 통계"""
+        if total_reviews == 0:
+            return {
+                'total_reviews': 0,
+                'avg_rating': 0,
+                'rating_distribution': {},
+                'avg_review_length': 0
+            }
+        
+        return {
+            'total_reviews': total_reviews,
+            'avg_rating': round(rating_sum / total_reviews, 2),
+            'rating_distribution': {rating: count for rating, count in enumerate(rating_counts.tolist()) if count},
+            'avg_review_length': round(length_sum / total_reviews, 0)
+        }
+
+class IncrementalAnalysis:
+    """크롤러가 넘겨주는 페이지마다 통계/감정/키워드를 누적 갱신하는 스트리밍 분석기
+    
+    평점 분포, 길이 합, 감정 개수, 키워드 역색인을 페이지 단위로 갱신하므로
+    크롤링 도중 snapshot()으로 중간 결과를 볼 수 있고, 크롤링이 끝나면
+    finalize()는 누적값을 정리만 한다 (analyze_reviews와 같은 결과).
+    """
+    
+    def __init__(self, analyzer: Optional[ReviewAnalyzer] = None):
+        self.analyzer = analyzer or ReviewAnalyzer()
+        self.index = KeywordIndex()
+        self.rating_counts = np.zeros(MAX_RATING + 1, dtype=np.int64)
+        self.rating_sum = 0
+        self.length_sum = 0
+        self.positive_count = 0
+        self.negative_count = 0
+        # 받은 리뷰 열 묶음은 누적값만 갱신하고 보관하지 않는다 (리뷰 원문은 수집기 결과에 있음)
+        self._count = 0
+        # 리뷰별 극성 (용량을 두 배씩 늘려 페이지마다 배열을 다시 만들지 않음)
+        self._polarities = np.zeros(256)
+        self._labels: List[str] = []
+    
+    @property
+    def count(self) -> int:
+        return self._count
+    
+    @property
+    def polarities(self) -> np.ndarray:
+        return self._polarities[:self.count]
+    
+    def add_page(self, reviews: Reviews):
+        """한 페이지 분량의 리뷰를 점수화하고 누적값 갱신"""
+        batch = ReviewBatch.coerce(reviews)
+        if not len(batch):
+            return
+        
+        tokenizer = self.analyzer.tokenizer
+        polarities = self.analyzer.sentiment_backend.score_batch(batch.texts)
+        labels = classify_polarities(polarities)
+        
+        start = self.count
+        end = start + len(batch)
+        if end > self._polarities.size:
+            grown = np.zeros(max(end, self._polarities.size * 2))
+            grown[:start] = self._polarities[:start]
+            self._polarities = grown
+        self._polarities[start:end] = polarities
+        self._labels.extend(labels.tolist())
+        
+        self.positive_count += int(np.count_nonzero(labels == 'positive'))
+        self.negative_count += int(np.count_nonzero(labels == 'negative'))
+        
+        counts = batch.rating_counts()
+        if counts.size > self.rating_counts.size:  # 범위 밖 평점이 섞인 경우
+            counts[:self.rating_counts.size] += self.rating_counts
+            self.rating_counts = counts.astype(np.int64)
+        else:
+            self.rating_counts[:counts.size] += counts
+        self.rating_sum += int(batch.ratings.sum(dtype=np.int64))
+        self.length_sum += int(batch.lengths.sum(dtype=np.int64))
+        
+        for text in batch.texts:
+            tokens = tokenizer.tokenize(text)
+            self.index.add(tokens, tokenizer.phrases(tokens))
+        
+        self._count = end
+    
+    def statistics(self) -> Dict[str, Any]:
+        return self.analyzer.summarize_statistics(self.count, self.rating_counts, self.rating_sum, self.length_sum)
+    
+    def sentiment(self) -> Dict[str, Any]:
+        return self.analyzer.summarize_sentiment(
+            self.count, self.positive_count, self.negative_count, float(self.polarities.sum())
+        )
+    
+    def snapshot(self, top_n: int = 10) -> Dict[str, Any]:
+        """지금까지 수집한 리뷰 기준 중간 결과 (리뷰별 감정 상세 제외)"""
+        return {
+            'statistics': self.statistics(),
+            'sentiment': self.sentiment(),
+            'keywords': self.analyzer.extract_keywords(None, top_n, polarities=self.polarities, index=self.index)
+        }
+    
+    def finalize(self) -> Dict[str, Any]:
+        """누적값으로 최종 분석 결과 생성"""
+        polarities = self.polarities
+        sentiment = self.sentiment()
+        sentiment['details'] = [
+            {'sentiment': sentiment_label, 'polarity': polarity}
+            for sentiment_label, polarity in zip(self._labels, polarities.tolist())
+        ]
+        
+        return {
+            'sentiment': sentiment,
+            'keywords': self.analyzer.extract_keywords(None, polarities=polarities, index=self.index),
+            'phrases': self.analyzer.extract_phrases(None, polarities=polarities, index=self.index),
+            'statistics': self.statistics()
+        }
+
+def analyze_reviews(reviews: Reviews, product_info: Dict[str, Any]) -> Dict[str, Any]:
+    """감정/키워드/통계 분석 (CPU 작업, 분석 프로세스에서 실행)
+    
+    스트리밍 분석과 같은 누적 경로를 한 페이지로 실행한다.
+    프로세스 간에는 ReviewBatch로 넘겨 pickle 크기를 줄인다.
+    """
+    analysis = IncrementalAnalysis()
+    analysis.add_page(reviews)
+    return analysis.finalize()
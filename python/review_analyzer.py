@@ -2,37 +2,36 @@
 # /Users/hyunjucho/Documents/GitHub/coupas/python/review_analyzer.py
 
 import asyncio
+import functools
 import json
+import os
 import time
-import re
-import pandas as pd
-import numpy as np
+import uuid
+import threading
 from datetime import datetime
-from collections import Counter
-from typing import Dict, List, Optional, Any
+from collections import Counter, defaultdict
+from typing import Dict, List, Literal, Optional, Any, Set
 import logging
 
-# 웹 크롤링
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
-import requests
-
-# AI 분석
-from textblob import TextBlob
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
+# 수집/분석 백엔드(selenium, requests/bs4, numpy)는 import 비용이 커서 처음 쓸 때 불러온다
+# (browser_crawler, coupang_http, review_analysis - 사전 워밍업 prewarm_backends 참고)
+from charts import ChartCache, chart_inputs, render_chart
+from driver_pool import DriverPool
+from product_urls import extract_product_id, normalize_product_url
+from review_cache import ReviewCache
+from job_scheduler import DomainRateLimiter, JobScheduler, QueueFullError
+from job_store import JobStore
+from metrics import (
+    ANALYSES_TOTAL, FAILURES_TOTAL, REGISTRY, RETRIES_TOTAL, REVIEWS_TOTAL, StageTimer,
+)
+from progress_events import TERMINAL_STATUSES, ProgressBroker
+from result_views import compress, dumps, etag_matches, negotiate_encoding, parse_fields, project_result, result_etag
 
 # 웹 프레임워크
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
-import uvicorn
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -54,12 +53,26 @@ class AnalysisRequest(BaseModel):
     url: str
     max_reviews: int = 100
     analysis_type: str = "basic"
+    crawl_mode: str = os.getenv('CRAWL_MODE', 'auto')  # 'auto', 'http', 'browser'
+    use_cache: bool = True
+    render_charts: bool = os.getenv('RENDER_CHARTS', 'false').lower() == 'true'  # 평점/감정/워드클라우드 이미지 생성
+    chart_format: Literal['png', 'svg'] = 'png'
+
+class BatchAnalysisRequest(BaseModel):
+    urls: List[str]
+    max_reviews: int = 100
+    analysis_type: str = "basic"
+    crawl_mode: str = os.getenv('CRAWL_MODE', 'auto')
+    use_cache: bool = True
+    render_charts: bool = os.getenv('RENDER_CHARTS', 'false').lower() == 'true'
+    chart_format: Literal['png', 'svg'] = 'png'
 
 class AnalysisStatus(BaseModel):
     id: str
-    status: str  # 'crawling', 'analyzing', 'completed', 'error'
+    status: str  # 'queued', 'crawling', 'analyzing', 'completed', 'error'
     progress: int
     message: str
+    queue_position: Optional[int] = None
     estimated_time: Optional[int] = None
 
 class AnalysisResult(BaseModel):
@@ -70,498 +83,798 @@ class AnalysisResult(BaseModel):
     keywords: List[Dict[str, Any]]
     generated_at: str
 
-# 전역 변수로 분석 상태 저장
-analysis_tasks = {}
+# 분석 작업이 공유하는 Chrome 드라이버 풀
+driver_pool = DriverPool.from_env()
+
+# 분석 작업 스케줄러 (크롤링 스레드 풀 + 분석 프로세스 풀)
+scheduler = JobScheduler.from_env()
+
+# 같은 쇼핑몰로의 동시 수집 수/시작 간격 제한 (배치 분석이 한 도메인에 몰리지 않게)
+domain_limiter = DomainRateLimiter.from_env()
+
+# 배치 분석 한 번에 받을 수 있는 URL 수
+# (배치는 대기열 자리를 통째로 확인하므로 기본값은 대기열 깊이 ANALYSIS_MAX_QUEUE 기본값과 같게)
+BATCH_MAX_URLS = int(os.getenv('BATCH_MAX_URLS', '20'))
+
+# 브라우저 없이 리뷰를 받아오는 HTTP 수집기 (커넥션 풀 공유, 처음 쓸 때 생성)
+_http_fetcher = None
+_http_fetcher_lock = threading.Lock()
+
+def get_http_fetcher():
+    """공유 HTTP 수집기 (requests/bs4는 여기서 처음 import)"""
+    global _http_fetcher
+    with _http_fetcher_lock:
+        if _http_fetcher is None:
+            from coupang_http import CoupangReviewFetcher
+            _http_fetcher = CoupangReviewFetcher.from_env()
+        return _http_fetcher
+
+# 상품별 리뷰 캐시 (재분석 시 새 리뷰만 수집)
+review_cache = ReviewCache.from_env()
+
+# 진행 상황 푸시 (SSE 구독자에게 작업별 최신 상태를 합쳐서 전달)
+progress_broker = ProgressBroker.from_env()
+
+# 분석 작업 상태/결과 저장소 (메모리 LRU + 끝난 결과는 디스크)
+job_store = JobStore.from_env(on_evict=progress_broker.discard)
 
-class ReviewCrawler:
-    """리뷰 크롤러 클래스"""
+# 차트/워드클라우드 이미지 캐시 (입력 데이터 해시가 파일 이름)
+chart_cache = ChartCache.from_env()
+
+# 결과에 넣는 차트 이미지 URL 앞부분 (브라우저는 Next.js 프록시 경로로 받는다, 직접 노출 시 '/charts')
+CHART_URL_BASE = os.getenv('CHART_URL_BASE', '/api/review-analyzer/charts').rstrip('/')
+
+def crawl_product_http(url: str, max_reviews: int, progress_callback=None, known_fingerprints: Optional[Set[str]] = None, page_callback=None, timer: Optional[StageTimer] = None, stop_at_known: bool = False):
+    """브라우저 없이 HTTP로 상품 정보와 리뷰 수집 (실패 시 None)
     
-    def __init__(self, headless: bool = True):
-        self.driver = None
-        self.headless = headless
-        self.setup_driver()
+    page_callback으로 이미 넘긴 페이지가 있으면 도중에 실패해도 브라우저로 다시 수집하지 않고
+    (리뷰가 중복 전달되지 않도록) 거기까지의 결과를 반환한다.
+    """
+    timer = timer or StageTimer()
+    if progress_callback:
+        progress_callback(10, "상품 정보 수집 중...")
     
-    def setup_driver(self):
-        """Selenium 드라이버 설정"""
-        try:
-            chrome_options = Options()
-            if self.headless:
-                chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            logger.info("Chrome 드라이버 초기화 완료")
-        except Exception as e:
-            logger.error(f"Chrome 드라이버 초기화 실패: {e}")
-            self.driver = None
-    
-    def detect_platform(self, url: str) -> str:
-        """URL에서 쇼핑몰 플랫폼 감지"""
-        if 'coupang.com' in url:
-            return 'coupang'
-        elif 'aliexpress.com' in url:
-            return 'aliexpress'
-        elif 'amazon.com' in url or 'amazon.co.kr' in url:
-            return 'amazon'
-        else:
-            raise ValueError("지원되지 않는 쇼핑몰입니다.")
+    http_fetcher = get_http_fetcher()
+    with timer.stage('product_info'):
+        product_info = http_fetcher.get_product_info(url)
+    if not product_info:
+        return None
     
-    def get_product_info(self, url: str) -> Dict[str, Any]:
-        """상품 기본 정보 수집"""
-        platform = self.detect_platform(url)
-        
-        if not self.driver:
-            raise Exception("크롤러 초기화 실패")
-        
-        try:
-            self.driver.get(url)
-            time.sleep(3)
-            
-            if platform == 'coupang':
-                return self._get_coupang_product_info()
-            elif platform == 'aliexpress':
-                return self._get_aliexpress_product_info()
-            elif platform == 'amazon':
-                return self._get_amazon_product_info()
-        except Exception as e:
-            logger.error(f"상품 정보 수집 실패: {e}")
-            return {
-                'title': '상품명을 가져올 수 없습니다',
-                'rating': 0,
-                'review_count': 0,
-                'price': '가격 정보 없음',
-                'image': None
-            }
-    
-    def _get_coupang_product_info(self) -> Dict[str, Any]:
-        """쿠팡 상품 정보 수집"""
-        try:
-            # 상품명
-            title_element = self.driver.find_element(By.CSS_SELECTOR, "h1.prod-buy-header__title")
-            title = title_element.text.strip()
-            
-            # 평점
-            try:
-                rating_element = self.driver.find_element(By.CSS_SELECTOR, ".rating-star-num")
-                rating = float(rating_element.text.strip())
-            except:
-                rating = 0
-            
-            # 리뷰 수
-            try:
-                review_count_element = self.driver.find_element(By.CSS_SELECTOR, ".rating-total-review-count")
-                review_count = int(re.search(r'\d+', review_count_element.text).group())
-            except:
-                review_count = 0
-            
-            # 가격
-            try:
-                price_element = self.driver.find_element(By.CSS_SELECTOR, ".total-price strong")
-                price = price_element.text.strip()
-            except:
-                price = "가격 정보 없음"
-            
-            # 이미지
-            try:
-                image_element = self.driver.find_element(By.CSS_SELECTOR, ".prod-image__detail img")
-                image = image_element.get_attribute("src")
-            except:
-                image = None
-            
-            return {
-                'title': title,
-                'rating': rating,
-                'review_count': review_count,
-                'price': price,
-                'image': image
-            }
-        except Exception as e:
-            logger.error(f"쿠팡 상품 정보 수집 실패: {e}")
+    if progress_callback:
+        progress_callback(20, "리뷰 크롤링 시작...")
+    
+    reviews = []
+    crawl_stats = {'mode': 'http'}
+    outcome: Dict[str, Any] = {}
+    try:
+        with timer.stage('crawl_reviews'):
+            for page_reviews in http_fetcher.iter_review_pages(
+                url, max_reviews, progress_callback=progress_callback, known_fingerprints=known_fingerprints,
+                stop_at_known=stop_at_known, outcome=outcome
+            ):
+                reviews.extend(page_reviews)
+                if page_callback:
+                    page_callback(page_reviews)
+    except Exception as e:
+        if not reviews:
             raise
+        logger.warning(f"HTTP 리뷰 수집 중단, 수집한 {len(reviews)}개로 진행: {e}")
+        crawl_stats['partial'] = True
+        # 중간에 끊겼으므로 마지막 페이지까지 봤다고 할 수 없다
+        outcome['exhausted'] = False
     
-    def _get_aliexpress_product_info(self) -> Dict[str, Any]:
-        """알리익스프레스 상품 정보 수집 (기본 구조)"""
-        # 실제 구현은 알리익스프레스 페이지 구조에 맞게 조정 필요
-        return {
-            'title': 'AliExpress 상품',
-            'rating': 4.5,
-            'review_count': 100,
-            'price': '$19.99',
-            'image': None
-        }
+    if not reviews and not known_fingerprints:
+        return None
     
-    def _get_amazon_product_info(self) -> Dict[str, Any]:
-        """아마존 상품 정보 수집 (기본 구조)"""
-        # 실제 구현은 아마존 페이지 구조에 맞게 조정 필요
-        return {
-            'title': 'Amazon 상품',
-            'rating': 4.2,
-            'review_count': 200,
-            'price': '$29.99',
-            'image': None
-        }
+    crawl_stats.update(outcome)
+    return product_info, reviews, crawl_stats
+
+def crawl_product(url: str, max_reviews: int, progress_callback=None, crawl_mode: str = "auto", known_fingerprints: Optional[Set[str]] = None, page_callback=None, timer: Optional[StageTimer] = None, stop_at_known: bool = False):
+    """상품 정보와 리뷰 수집 (블로킹, 크롤링 스레드에서 실행)
     
-    def crawl_reviews(self, url: str, max_reviews: int = 100, progress_callback=None) -> List[Dict[str, Any]]:
-        """리뷰 크롤링 메인 함수"""
-        platform = self.detect_platform(url)
-        
-        if platform == 'coupang':
-            return self._crawl_coupang_reviews(url, max_reviews, progress_callback)
-        elif platform == 'aliexpress':
-            return self._crawl_aliexpress_reviews(url, max_reviews, progress_callback)
-        elif platform == 'amazon':
-            return self._crawl_amazon_reviews(url, max_reviews, progress_callback)
-    
-    def _crawl_coupang_reviews(self, url: str, max_reviews: int, progress_callback=None) -> List[Dict[str, Any]]:
-        """쿠팡 리뷰 크롤링"""
-        reviews = []
-        
+    crawl_mode: 'auto' (HTTP 우선, 실패 시 브라우저), 'http', 'browser'
+    known_fingerprints: 이미 캐시에 있는 리뷰 (건너뜀, stop_at_known이면 처음 만난 곳에서 수집 중단)
+    반환하는 crawl_stats에는 최신순 수집 결과(sort, covered, stopped_at_known, exhausted)가 들어 있다.
+    page_callback: 수집한 리뷰를 페이지 단위로 전달받을 함수
+    timer: 단계별 소요 시간 기록 (product_info, crawl_reviews, driver_checkout)
+    """
+    timer = timer or StageTimer()
+    if crawl_mode in ('auto', 'http') and 'coupang.com' in url:
         try:
-            # 리뷰 탭으로 이동
-            review_tab = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), '상품리뷰')]"))
-            )
-            review_tab.click()
-            time.sleep(2)
-            
-            page = 1
-            while len(reviews) < max_reviews:
-                if progress_callback:
-                    progress = int((len(reviews) / max_reviews) * 70)  # 크롤링은 전체의 70%
-                    progress_callback(progress, f"리뷰 수집 중... ({len(reviews)}/{max_reviews})")
-                
-                # 현재 페이지의 리뷰 수집
-                review_elements = self.driver.find_elements(By.CSS_SELECTOR, "article.sdp-review__article")
-                
-                if not review_elements:
-                    break
-                
-                for element in review_elements:
-                    if len(reviews) >= max_reviews:
-                        break
-                    
-                    try:
-                        # 평점
-                        rating_element = element.find_element(By.CSS_SELECTOR, ".sdp-review__rating__star")
-                        rating = len(rating_element.find_elements(By.CSS_SELECTOR, ".icon--star-full"))
-                        
-                        # 리뷰 텍스트
-                        review_text_element = element.find_element(By.CSS_SELECTOR, ".sdp-review__article__review")
-                        review_text = review_text_element.text.strip()
-                        
-                        # 날짜
-                        date_element = element.find_element(By.CSS_SELECTOR, ".sdp-review__article__date")
-                        review_date = date_element.text.strip()
-                        
-                        # 도움이 됨 수
-                        try:
-                            helpful_element = element.find_element(By.CSS_SELECTOR, ".sdp-review__article__helpful__count")
-                            helpful_count = int(re.search(r'\d+', helpful_element.text).group())
-                        except:
-                            helpful_count = 0
-                        
-                        reviews.append({
-                            'id': f"review_{len(reviews)}",
-                            'rating': rating,
-                            'text': review_text,
-                            'date': review_date,
-                            'helpful_count': helpful_count,
-                            'platform': 'coupang'
-                        })
-                    
-                    except Exception as e:
-                        logger.warning(f"개별 리뷰 수집 실패: {e}")
-                        continue
-                
-                # 다음 페이지로
-                try:
-                    next_button = self.driver.find_element(By.CSS_SELECTOR, ".sdp-review__article__page__next")
-                    if "disabled" in next_button.get_attribute("class"):
-                        break
-                    next_button.click()
-                    time.sleep(2)
-                    page += 1
-                except:
-                    break
-            
+            result = crawl_product_http(url, max_reviews, progress_callback, known_fingerprints, page_callback, timer, stop_at_known)
         except Exception as e:
-            logger.error(f"쿠팡 리뷰 크롤링 실패: {e}")
-        
-        return reviews
-    
-    def _crawl_aliexpress_reviews(self, url: str, max_reviews: int, progress_callback=None) -> List[Dict[str, Any]]:
-        """알리익스프레스 리뷰 크롤링 (기본 구조)"""
-        # 실제 구현 필요
-        return []
-    
-    def _crawl_amazon_reviews(self, url: str, max_reviews: int, progress_callback=None) -> List[Dict[str, Any]]:
-        """아마존 리뷰 크롤링 (기본 구조)"""
-        # 실제 구현 필요
-        return []
-    
-    def close(self):
-        """드라이버 종료"""
-        if self.driver:
-            self.driver.quit()
-
-class ReviewAnalyzer:
-    """리뷰 분석기 클래스"""
-    
-    def __init__(self):
-        # 한글 폰트 설정
-        plt.rcParams['font.family'] = 'DejaVu Sans'
-        plt.rcParams['axes.unicode_minus'] = False
-    
-    def analyze_sentiment(self, reviews: List[Dict[str, Any]], progress_callback=None) -> Dict[str, Any]:
-        """감정 분석"""
-        sentiments = []
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        total_score = 0
-        
-        for i, review in enumerate(reviews):
+            logger.warning(f"HTTP 리뷰 수집 실패: {e}")
+            result = None
+        
+        if result is not None:
+            return result
+        if crawl_mode == 'http':
+            raise Exception("HTTP 리뷰 수집에 실패했습니다.")
+        RETRIES_TOTAL.inc(reason='http_fallback')
+        logger.info("HTTP 수집 결과가 없어 브라우저 크롤링으로 전환합니다.")
+    
+    from browser_crawler import ReviewCrawler
+    
+    # 풀에서 드라이버를 빌려 크롤링만 수행하고 바로 반납
+    checkout_started = time.perf_counter()
+    with driver_pool.lease() as pooled:
+        timer.add('driver_checkout', time.perf_counter() - checkout_started)
+        crawler = ReviewCrawler(driver=pooled.driver)
+        try:
             if progress_callback:
-                progress = 70 + int((i / len(reviews)) * 20)  # 70%부터 90%까지
-                progress_callback(progress, f"AI 감정 분석 중... ({i+1}/{len(reviews)})")
+                progress_callback(10, "상품 정보 수집 중...")
             
-            text = review['text']
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity
+            # 상품 정보 수집
+            with timer.stage('product_info'):
+                product_info = crawler.get_product_info(url)
             
-            if polarity > 0.1:
-                sentiment = 'positive'
-                positive_count += 1
-            elif polarity < -0.1:
-                sentiment = 'negative'
-                negative_count += 1
-            else:
-                sentiment = 'neutral'
-                neutral_count += 1
+            if progress_callback:
+                progress_callback(20, "리뷰 크롤링 시작...")
             
-            sentiments.append({
-                'sentiment': sentiment,
-                'polarity': polarity
-            })
-            total_score += polarity
-        
-        total_reviews = len(reviews)
-        avg_score = total_score / total_reviews if total_reviews > 0 else 0
-        
-        return {
-            'positive': round((positive_count / total_reviews) * 100, 1) if total_reviews > 0 else 0,
-            'negative': round((negative_count / total_reviews) * 100, 1) if total_reviews > 0 else 0,
-            'neutral': round((neutral_count / total_reviews) * 100, 1) if total_reviews > 0 else 0,
-            'score': round(avg_score, 3),
-            'details': sentiments
+            # 리뷰 크롤링
+            outcome: Dict[str, Any] = {}
+            with timer.stage('crawl_reviews'):
+                reviews = crawler.crawl_reviews(
+                    url, max_reviews, progress_callback=progress_callback,
+                    known_fingerprints=known_fingerprints, page_callback=page_callback,
+                    stop_at_known=stop_at_known, outcome=outcome
+                )
+        finally:
+            pooled.mark_page_load(crawler.page_loads)
+    
+    extraction_seconds = sum(timing['seconds'] for timing in crawler.extraction_timings)
+    crawl_stats = {
+        'mode': 'browser',
+        **outcome,
+        'page_loads': crawler.page_loads,
+        'waits': crawler.waiter.summary(),
+        'extraction': {
+            'pages': len(crawler.extraction_timings),
+            'total': round(extraction_seconds, 4),
+            'per_page': crawler.extraction_timings
         }
+    }
+    logger.info(f"브라우저 크롤링 대기 시간: {crawl_stats['waits']}")
+    return product_info, reviews, crawl_stats
+
+def crawl_product_cached(url: str, max_reviews: int, progress_callback=None, crawl_mode: str = "auto", use_cache: bool = True, page_callback=None, timer: Optional[StageTimer] = None):
+    """리뷰 캐시를 거쳐 수집 (신선하면 캐시만, 오래됐으면 새 리뷰만 수집 후 병합)
     
-    def extract_keywords(self, reviews: List[Dict[str, Any]], top_n: int = 20) -> List[Dict[str, Any]]:
-        """키워드 추출 및 분석"""
-        # 모든 리뷰 텍스트 합치기
-        all_text = ' '.join([review['text'] for review in reviews])
-        
-        # 한글만 추출 (간단한 전처리)
-        korean_text = re.sub(r'[^가-힣\s]', ' ', all_text)
-        
-        # 단어 분리
-        words = korean_text.split()
-        
-        # 1글자 단어 및 불용어 제거
-        stopwords = ['이', '그', '저', '것', '수', '때', '곳', '더', '잘', '좀', '진짜', '정말']
-        words = [word for word in words if len(word) > 1 and word not in stopwords]
-        
-        # 빈도 계산
-        word_freq = Counter(words)
-        top_keywords = word_freq.most_common(top_n)
-        
-        # 키워드별 감정 분석
-        keyword_sentiments = []
-        for word, count in top_keywords:
-            # 해당 키워드가 포함된 리뷰들의 감정 분석
-            related_reviews = [r['text'] for r in reviews if word in r['text']]
-            if related_reviews:
-                sentiments = [TextBlob(text).sentiment.polarity for text in related_reviews]
-                avg_sentiment = sum(sentiments) / len(sentiments)
-                
-                if avg_sentiment > 0.1:
-                    sentiment = 'positive'
-                elif avg_sentiment < -0.1:
-                    sentiment = 'negative'
-                else:
-                    sentiment = 'neutral'
-            else:
-                sentiment = 'neutral'
-            
-            keyword_sentiments.append({
-                'word': word,
-                'count': count,
-                'sentiment': sentiment
-            })
-        
-        return keyword_sentiments
+    page_callback에는 반환되는 리뷰 목록이 순서대로 빠짐없이 한 번씩 전달된다
+    (새로 수집한 페이지들, 이어서 캐시에서 합친 리뷰).
+    """
+    timer = timer or StageTimer()
+    product_id = extract_product_id(url) if 'coupang.com' in url else None
+    if not (use_cache and review_cache.enabled and product_id):
+        limit_started = time.perf_counter()
+        with domain_limiter.limit(url):
+            timer.add('rate_limit_wait', time.perf_counter() - limit_started)
+            return crawl_product(url, max_reviews, progress_callback, crawl_mode, page_callback=page_callback, timer=timer)
     
-    def generate_statistics(self, reviews: List[Dict[str, Any]], product_info: Dict[str, Any]) -> Dict[str, Any]:
-        """기본 통계 생성"""
-        if not reviews:
-            return {
-                'total_reviews': 0,
-                'avg_rating': 0,
-                'rating_distribution': {},
-                'avg_review_length': 0
-            }
-        
-        ratings = [review['rating'] for review in reviews]
-        review_lengths = [len(review['text']) for review in reviews]
-        
-        rating_dist = Counter(ratings)
-        
-        return {
-            'total_reviews': len(reviews),
-            'avg_rating': round(sum(ratings) / len(ratings), 2) if ratings else 0,
-            'rating_distribution': dict(rating_dist),
-            'avg_review_length': round(sum(review_lengths) / len(review_lengths), 0) if review_lengths else 0
-        }
+    with timer.stage('cache_lookup'):
+        cached = review_cache.lookup(product_id)
+        if cached and cached['fresh']:
+            # 최신순 앞부분이 요청 수만큼 있거나 마지막 리뷰까지 수집해 둔 경우만 캐시로 끝낸다
+            if cached['prefix_count'] >= max_reviews or cached['exhausted']:
+                cached_reviews = review_cache.load_reviews(product_id, limit=max_reviews)
+                review_cache.record('hit')
+                if page_callback:
+                    page_callback(cached_reviews)
+                return cached['product_info'], cached_reviews, {'mode': 'cache', 'cache': 'hit', 'new_reviews': 0}
+        
+        known = review_cache.known_fingerprints(product_id) if cached else set()
+        # 캐시가 최신순 앞부분을 요청 수만큼(또는 마지막 리뷰까지) 갖고 있을 때만 아는 리뷰에서 멈춘다.
+        # 아니면 아는 리뷰는 건너뛰며 max_reviews까지 계속 넘긴다 (더 오래된 리뷰를 원하는 요청 등).
+        prefix_count = cached['prefix_count'] if cached else 0
+        stop_at_known = bool(known) and prefix_count > 0 and (
+            prefix_count >= max_reviews or cached['exhausted']
+        )
+    
+    limit_started = time.perf_counter()
+    with domain_limiter.limit(url):
+        timer.add('rate_limit_wait', time.perf_counter() - limit_started)
+        product_info, new_reviews, crawl_stats = crawl_product(
+            url, max_reviews, progress_callback, crawl_mode,
+            known_fingerprints=known or None, page_callback=page_callback, timer=timer,
+            stop_at_known=stop_at_known
+        )
+    
+    # 이번 수집 뒤 캐시가 갖게 되는 최신순 앞부분
+    if crawl_stats.get('sort') != 'DATE_DESC':
+        new_prefix, exhausted = 0, False
+    elif crawl_stats.get('stopped_at_known'):
+        # 새 리뷰 바로 뒤에 예전 앞부분이 이어진다
+        new_prefix, exhausted = crawl_stats['covered'] + prefix_count, cached['exhausted']
+    else:
+        new_prefix, exhausted = crawl_stats.get('covered', 0), crawl_stats.get('exhausted', False)
+    
+    # 새로 수집한 리뷰를 저장하고 캐시의 나머지 리뷰와 병합
+    with timer.stage('cache_store'):
+        review_cache.store(product_id, product_info, new_reviews, prefix_count=new_prefix, exhausted=exhausted)
+        review_cache.record('incremental' if known else 'miss')
+        
+        reviews = list(new_reviews)
+        if known and len(reviews) < max_reviews:
+            seen = {review['id'] for review in reviews}
+            for review in review_cache.load_reviews(product_id):
+                if len(reviews) >= max_reviews:
+                    break
+                if review['id'] not in seen:
+                    reviews.append(review)
+    
+    # 캐시에서 합친 리뷰는 마지막 페이지로 전달
+    if page_callback and len(reviews) > len(new_reviews):
+        page_callback(reviews[len(new_reviews):])
+    
+    crawl_stats.update({
+        'cache': 'incremental' if known else 'miss',
+        'new_reviews': len(new_reviews)
+    })
+    return product_info, reviews, crawl_stats
 
 # API 엔드포인트
-@app.post("/analyze")
-async def start_analysis(request: AnalysisRequest, background_tasks: BackgroundTasks):
-    """분석 시작"""
-    analysis_id = f"analysis_{int(time.time())}"
+def submit_analysis(request: AnalysisRequest) -> Dict[str, Any]:
+    """분석 작업 등록 (같은 상품/조건의 진행 중이거나 최근 완료된 분석이 있으면 그 작업을 돌려줌)
+    
+    대기열이 가득 차면 QueueFullError
+    """
+    dedup_key = f"{normalize_product_url(request.url)}|{request.max_reviews}|{request.analysis_type}"
+    if request.render_charts:
+        dedup_key += f"|charts:{request.chart_format}"
+    
+    # use_cache=False는 새 수집을 원하는 요청이므로 진행 중인 작업에만 합친다
+    existing_id = job_store.find_duplicate(dedup_key, include_completed=request.use_cache)
+    if existing_id is not None:
+        queue_position = scheduler.queue_position(existing_id)
+        return {
+            'success': True,
+            'analysis_id': existing_id,
+            'queue_position': queue_position or 0,
+            'deduplicated': True,
+            'message': '같은 상품의 분석이 이미 진행 중이거나 최근에 완료되었습니다.'
+        }
+    
+    analysis_id = f"analysis_{uuid.uuid4().hex}"
     
     # 분석 태스크 등록
-    analysis_tasks[analysis_id] = {
-        'status': 'starting',
+    job_store.create(analysis_id, {
+        'status': 'queued',
         'progress': 0,
         'message': '분석 준비 중...',
         'created_at': datetime.now().isoformat()
+    }, dedup_key=dedup_key)
+    
+    # 스케줄러 대기열에 등록 (실행 슬롯이 나면 시작)
+    try:
+        submitted_at = time.perf_counter()
+        queue_position = scheduler.submit(analysis_id, lambda: run_analysis(analysis_id, request, submitted_at))
+    except QueueFullError:
+        job_store.delete(analysis_id)
+        raise
+    
+    return {
+        'success': True,
+        'analysis_id': analysis_id,
+        'queue_position': queue_position,
+        'deduplicated': False,
+        'message': '분석이 시작되었습니다.' if queue_position == 0 else f'분석이 대기열에 등록되었습니다. ({queue_position}번째)'
     }
+
+@app.post("/analyze")
+async def start_analysis(request: AnalysisRequest):
+    """분석 시작"""
+    try:
+        return submit_analysis(request)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+@app.post("/analyze/batch")
+async def start_batch_analysis(request: BatchAnalysisRequest):
+    """여러 상품 URL을 한 번에 분석
+    
+    URL마다 일반 분석 작업을 등록하고 (중복 URL은 하나의 작업으로 합쳐짐) 배치 ID를 돌려준다.
+    실행은 공용 스케줄러 슬롯과 도메인별 수집 제한을 따른다.
+    """
+    urls = list(dict.fromkeys(url.strip() for url in request.urls if url.strip()))
+    if not urls:
+        raise HTTPException(status_code=400, detail="분석할 URL이 없습니다.")
+    if len(urls) > BATCH_MAX_URLS:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {BATCH_MAX_URLS}개 URL까지 분석할 수 있습니다.")
+    
+    # 배치 전체가 대기열에 들어갈 자리가 있을 때만 등록한다 (일부만 등록된 배치를 만들지 않음)
+    try:
+        scheduler.ensure_capacity(len(urls))
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     
-    # 백그라운드에서 분석 실행
-    background_tasks.add_task(run_analysis, analysis_id, request)
+    analysis_ids = []
+    for url in urls:
+        item = AnalysisRequest(
+            url=url,
+            max_reviews=request.max_reviews,
+            analysis_type=request.analysis_type,
+            crawl_mode=request.crawl_mode,
+            use_cache=request.use_cache,
+            render_charts=request.render_charts,
+            chart_format=request.chart_format
+        )
+        # 위에서 자리를 확인했고 그 사이에 다른 요청이 끼어들 await가 없다
+        analysis_ids.append(submit_analysis(item)['analysis_id'])
+    
+    batch_id = f"batch_{uuid.uuid4().hex}"
+    job_store.create(batch_id, {
+        'kind': 'batch',
+        'status': 'analyzing',
+        'progress': 0,
+        'message': f'{len(urls)}개 상품 분석 중...',
+        'created_at': datetime.now().isoformat(),
+        'urls': urls,
+        'analysis_ids': analysis_ids
+    })
+    with _batch_lock:
+        for analysis_id in analysis_ids:
+            _batch_parents[analysis_id].add(batch_id)
+    # 등록 전에 이미 끝난 (중복으로 합쳐진 완료 작업 등) 상품만 있으면 바로 완료
+    await asyncio.get_running_loop().run_in_executor(None, complete_batch_if_done, batch_id)
     
     return {
         'success': True,
+        'batch_id': batch_id,
+        'analysis_ids': analysis_ids,
+        'message': f'{len(urls)}개 상품의 분석이 등록되었습니다.'
+    }
+
+def comparison_row(url: str, analysis_id: str, task: Optional[Dict[str, Any]], result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """배치 비교표 한 줄 (평점, 감정, 상위 키워드)"""
+    row = {
+        'url': url,
         'analysis_id': analysis_id,
-        'message': '분석이 시작되었습니다.'
+        'status': task['status'] if task else 'error'
     }
+    if result is None:
+        return row
+    
+    product_info = result['product_info']
+    statistics = result['statistics']
+    sentiment = result['sentiment']
+    row.update({
+        'title': product_info.get('title'),
+        'price': product_info.get('price'),
+        'product_rating': product_info.get('rating'),
+        'avg_rating': statistics['avg_rating'],
+        'total_reviews': statistics['total_reviews'],
+        'positive': sentiment['positive'],
+        'negative': sentiment['negative'],
+        'neutral': sentiment['neutral'],
+        'sentiment_score': sentiment['score'],
+        'top_keywords': [keyword['word'] for keyword in result['keywords'][:5]]
+    })
+    return row
 
-@app.get("/status/{analysis_id}")
-async def get_analysis_status(analysis_id: str):
-    """분석 상태 확인"""
-    if analysis_id not in analysis_tasks:
-        raise HTTPException(status_code=404, detail="분석을 찾을 수 없습니다.")
+def batch_comparison(batch: Dict[str, Any]) -> Dict[str, Any]:
+    """배치의 작업 상태를 모아 전체 진행률과 비교표 생성 (블로킹, 결과를 디스크에서 읽을 수 있음)"""
+    rows = []
+    progress_sum = 0
+    counts = Counter()
+    for url, analysis_id in zip(batch['urls'], batch['analysis_ids']):
+        task = job_store.get(analysis_id)
+        status = task['status'] if task else 'error'
+        counts[status] += 1
+        progress_sum += 100 if status in ('completed', 'error') else task['progress']
+        result = job_store.get_result(analysis_id) if status == 'completed' else None
+        rows.append(comparison_row(url, analysis_id, task, result))
     
-    task = analysis_tasks[analysis_id]
+    total = len(rows)
+    return {
+        'progress': int(progress_sum / total) if total else 100,
+        'done': counts['completed'] + counts['error'] == total,
+        'counts': dict(counts),
+        'comparison': rows
+    }
+
+# 작업 ID -> 그 작업을 포함한 진행 중인 배치 ID들 (마지막 상품이 끝날 때 배치를 완료 처리)
+_batch_parents: Dict[str, Set[str]] = defaultdict(set)
+_batch_lock = threading.Lock()
+
+def complete_batch_if_done(batch_id: str, summary: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """모든 상품이 끝난 배치를 비교표와 함께 완료 처리 (블로킹), 갱신된 배치 상태 반환"""
+    with _batch_lock:
+        batch = job_store.get(batch_id)
+        if batch is None or batch['status'] in TERMINAL_STATUSES:
+            return batch
+        summary = summary or batch_comparison(batch)
+        if not summary['done']:
+            return None
+        for analysis_id in batch['analysis_ids']:
+            parents = _batch_parents.get(analysis_id)
+            if parents is not None:
+                parents.discard(batch_id)
+                if not parents:
+                    del _batch_parents[analysis_id]
+        return job_store.update(
+            batch_id,
+            status='completed',
+            progress=100,
+            message='배치 분석 완료!',
+            result=summary
+        )
+
+def complete_parent_batches(analysis_id: str):
+    """끝난 작업이 속한 배치 중 모든 상품이 끝난 배치를 완료 처리 (블로킹)"""
+    with _batch_lock:
+        batch_ids = list(_batch_parents.get(analysis_id, ()))
+    for batch_id in batch_ids:
+        complete_batch_if_done(batch_id)
+
+@app.get("/batch/{batch_id}")
+async def get_batch_status(batch_id: str):
+    """배치 분석 전체 진행률과 상품 비교표 (완료된 상품부터 채워짐)"""
+    batch = await get_task_or_404(batch_id)
+    if batch.get('kind') != 'batch':
+        raise HTTPException(status_code=404, detail="배치 분석을 찾을 수 없습니다.")
+    
+    loop = asyncio.get_running_loop()
+    if batch['status'] == 'completed':
+        summary = await loop.run_in_executor(None, job_store.get_result, batch_id)
+    else:
+        summary = await loop.run_in_executor(None, batch_comparison, batch)
+        if summary['done']:
+            # 마지막 상품이 끝날 때 완료 처리되지만, 그 사이 조회면 여기서 마무리
+            batch = await loop.run_in_executor(None, complete_batch_if_done, batch_id, summary) or batch
+        else:
+            batch = job_store.update(batch_id, progress=summary['progress']) or batch
+    
+    if summary is None:
+        raise HTTPException(status_code=404, detail="배치 분석 결과가 만료되었습니다.")
+    
+    return {
+        'id': batch_id,
+        'status': batch['status'],
+        'progress': summary['progress'],
+        'message': batch['message'],
+        'counts': summary['counts'],
+        'comparison': summary['comparison']
+    }
+
+def task_status(analysis_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+    """/status 응답과 진행 이벤트에 쓰는 작업 상태"""
+    queue_position = scheduler.queue_position(analysis_id)
     return {
         'id': analysis_id,
         'status': task['status'],
         'progress': task['progress'],
-        'message': task['message'],
-        'estimated_time': task.get('estimated_time')
+        'message': f"분석 대기 중... ({queue_position}번째)" if queue_position else task['message'],
+        'queue_position': queue_position,
+        'estimated_time': task.get('estimated_time'),
+        # 크롤링 중에는 지금까지 수집한 리뷰 기준 중간 결과
+        'partial_result': task.get('partial_result') if task['status'] != 'completed' else None
     }
 
-@app.get("/results/{analysis_id}")
-async def get_analysis_results(analysis_id: str):
-    """분석 결과 조회"""
-    if analysis_id not in analysis_tasks:
+def update_task(analysis_id: str, **fields):
+    """작업 상태 갱신 후 구독자에게 발행 (크롤링 스레드에서도 호출)
+    
+    종료 상태로 바꾸면 결과 직렬화/디스크 저장과 배치 완료 처리까지 하므로 이벤트 루프에서는
+    finish_task로 호출한다.
+    """
+    task = job_store.update(analysis_id, **fields)
+    if task is not None:
+        progress_broker.publish(analysis_id, task_status(analysis_id, task))
+        if task['status'] in TERMINAL_STATUSES:
+            complete_parent_batches(analysis_id)
+
+async def finish_task(analysis_id: str, **fields):
+    """종료 상태 갱신을 스레드 풀에서 (이벤트 루프를 막지 않게)"""
+    await asyncio.get_running_loop().run_in_executor(None, functools.partial(update_task, analysis_id, **fields))
+
+async def get_task_or_404(analysis_id: str) -> Dict[str, Any]:
+    """작업 상태 (메모리에 없으면 디스크 조회를 스레드 풀에서)"""
+    task = await asyncio.get_running_loop().run_in_executor(None, job_store.get, analysis_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="분석을 찾을 수 없습니다.")
+    return task
+
+@app.get("/status/{analysis_id}")
+async def get_analysis_status(analysis_id: str):
+    """분석 상태 확인"""
+    return task_status(analysis_id, await get_task_or_404(analysis_id))
+
+@app.get("/events/{analysis_id}")
+async def stream_analysis_events(analysis_id: str):
+    """분석 진행 상황 SSE 스트림 (/status 폴링 대체)
     
-    task = analysis_tasks[analysis_id]
+    상태가 바뀌면 /status와 같은 형식의 progress 이벤트를 보내고 (짧은 간격의 갱신은
+    마지막 것만), 완료/오류 이벤트를 보낸 뒤 스트림을 닫는다.
+    """
+    task = await get_task_or_404(analysis_id)
+    
+    if progress_broker.latest(analysis_id) is None:
+        progress_broker.publish(analysis_id, task_status(analysis_id, task))
+    
+    async def event_stream():
+        async for event in progress_broker.subscribe(analysis_id):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.get("/results/{analysis_id}")
+async def get_analysis_results(
+    analysis_id: str,
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 결과 필드 (예: product_info,statistics,sentiment)"),
+    cursor: int = Query(0, ge=0, description="리뷰 목록/리뷰별 감정의 시작 위치 (이전 응답의 page.next_cursor)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="리뷰 목록/리뷰별 감정 페이지 크기 (없으면 전체)"),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+):
+    """분석 결과 조회
+    
+    완료된 결과는 바뀌지 않으므로 ETag가 같으면 본문 없이 304를 돌려준다.
+    """
+    task = await get_task_or_404(analysis_id)
     
     if task['status'] != 'completed':
         raise HTTPException(status_code=400, detail="분석이 아직 완료되지 않았습니다.")
     
-    return {
-        'success': True,
-        'analysis': task['result']
-    }
+    selected_fields = parse_fields(fields)
+    encoding = negotiate_encoding(accept_encoding)
+    etag = result_etag(analysis_id, task.get('finished_at'), selected_fields, cursor, limit, encoding=encoding)
+    headers = {'ETag': etag, 'Cache-Control': 'private, max-age=0, must-revalidate', 'Vary': 'Accept-Encoding'}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    def render() -> tuple:
+        # 메모리에서 밀려난 결과는 디스크에서 다시 읽는다
+        result = job_store.get_result(analysis_id)
+        if result is None:
+            return None, None
+        body = dumps({
+            'success': True,
+            'analysis': project_result(result, selected_fields, cursor, limit)
+        })
+        return compress(body, encoding)
+    
+    body, content_encoding = await asyncio.get_running_loop().run_in_executor(None, render)
+    if body is None:
+        raise HTTPException(status_code=404, detail="분석 결과가 만료되었습니다.")
+    
+    if content_encoding:
+        headers['Content-Encoding'] = content_encoding
+    return Response(content=body, media_type="application/json", headers=headers)
 
-async def run_analysis(analysis_id: str, request: AnalysisRequest):
-    """실제 분석 실행 함수"""
+async def render_result_charts(result: Dict[str, Any], fmt: str) -> Dict[str, Any]:
+    """분석 결과의 차트 이미지를 분석 프로세스 풀에서 렌더링 (같은 입력은 캐시 파일 재사용)
+    
+    렌더링 실패는 분석 실패로 보지 않고 해당 차트만 빠진다.
+    """
+    charts = {}
+    pending = []
+    for kind, data in chart_inputs(result).items():
+        digest = chart_cache.key(kind, data, fmt)
+        charts[kind] = {'format': fmt, 'hash': digest, 'url': f"{CHART_URL_BASE}/{digest}.{fmt}"}
+        if not chart_cache.contains(digest, fmt):
+            pending.append((kind, data, digest))
+    
+    rendered = await asyncio.gather(
+        *(scheduler.run_in_process(render_chart, kind, data, fmt, chart_cache.font_path) for kind, data, _ in pending),
+        return_exceptions=True
+    )
+    for (kind, _, digest), body in zip(pending, rendered):
+        if isinstance(body, Exception):
+            logger.warning(f"차트 렌더링 실패 ({kind}): {body}")
+            FAILURES_TOTAL.inc(stage='render_charts')
+            del charts[kind]
+            continue
+        await asyncio.get_running_loop().run_in_executor(None, chart_cache.store, digest, fmt, body)
+    return charts
+
+async def run_analysis(analysis_id: str, request: AnalysisRequest, submitted_at: Optional[float] = None):
+    """실제 분석 실행 함수 (단계별 소요 시간은 결과의 timings와 /metrics에 기록)"""
+    timer = StageTimer()
+    if submitted_at is not None:
+        timer.add('queue_wait', time.perf_counter() - submitted_at)
+    
     def update_progress(progress: int, message: str):
-        analysis_tasks[analysis_id].update({
-            'progress': progress,
-            'message': message,
-            'status': 'analyzing' if progress < 100 else 'completed'
-        })
+        # 크롤링 스레드에서도 호출되므로 완료 처리는 결과 저장과 함께 한다
+        update_task(analysis_id, progress=progress, message=message, status='analyzing')
+    
+    # 페이지가 도착할 때마다 누적 분석하고 중간 결과를 상태에 노출
+    from review_analysis import IncrementalAnalysis, ReviewBatch, analyze_reviews
+    stream = IncrementalAnalysis()
+    
+    def analyze_page(page_reviews: List[Dict[str, Any]]):
+        # 크롤링 단계 안에서 호출되며, 이 시간은 crawl_reviews에서 빠진다
+        with timer.stage('analysis_incremental'):
+            stream.add_page(page_reviews)
+            update_task(analysis_id, partial_result=stream.snapshot())
+    
+    def finalize_stream() -> Dict[str, Any]:
+        with timer.stage('analysis_finalize'):
+            return stream.finalize()
     
     try:
-        update_progress(5, "크롤러 초기화 중...")
-        
-        # 크롤러 초기화
-        crawler = ReviewCrawler(headless=True)
-        analyzer = ReviewAnalyzer()
-        
-        update_progress(10, "상품 정보 수집 중...")
-        
-        # 상품 정보 수집
-        product_info = crawler.get_product_info(request.url)
-        
-        update_progress(20, "리뷰 크롤링 시작...")
-        
-        # 리뷰 크롤링
-        reviews = crawler.crawl_reviews(
-            request.url, 
-            request.max_reviews, 
-            progress_callback=update_progress
+        update_progress(5, "크롤러 준비 중...")
+        
+        # 블로킹 크롤링 + 페이지별 분석은 스레드 풀에서
+        product_info, reviews, crawl_stats = await scheduler.run_in_thread(
+            crawl_product_cached,
+            request.url,
+            request.max_reviews,
+            progress_callback=update_progress,
+            crawl_mode=request.crawl_mode,
+            use_cache=request.use_cache,
+            page_callback=analyze_page,
+            timer=timer
         )
         
         if not reviews:
             raise Exception("리뷰를 수집할 수 없습니다.")
+        REVIEWS_TOTAL.inc(len(reviews), mode=crawl_stats['mode'])
         
-        update_progress(75, "AI 분석 중...")
-        
-        # 감정 분석
-        sentiment_result = analyzer.analyze_sentiment(reviews, update_progress)
-        
-        update_progress(90, "키워드 분석 중...")
-        
-        # 키워드 분석
-        keywords = analyzer.extract_keywords(reviews)
-        
-        update_progress(95, "통계 생성 중...")
+        update_progress(90, "분석 결과 정리 중...")
         
-        # 기본 통계
-        statistics = analyzer.generate_statistics(reviews, product_info)
-        
-        update_progress(100, "분석 완료!")
+        if stream.count == len(reviews):
+            analysis = await scheduler.run_in_thread(finalize_stream)
+        else:
+            # 페이지 전달이 누락된 경로면 전체 리뷰로 다시 분석 (프로세스 풀)
+            logger.warning(f"스트리밍 분석 리뷰 수 불일치 ({stream.count}/{len(reviews)}), 전체 재분석")
+            analysis_started = time.perf_counter()
+            analysis = await scheduler.run_in_process(analyze_reviews, ReviewBatch.from_records(reviews), product_info)
+            timer.add('analysis_full', time.perf_counter() - analysis_started)
         
         # 결과 저장
         result = {
             'id': analysis_id,
             'product_info': product_info,
-            'statistics': statistics,
-            'sentiment': sentiment_result,
-            'keywords': keywords,
+            'statistics': analysis['statistics'],
+            'sentiment': analysis['sentiment'],
+            'keywords': analysis['keywords'],
+            'phrases': analysis['phrases'],
             'raw_reviews': reviews,
+            'crawl_stats': crawl_stats,
             'generated_at': datetime.now().isoformat()
         }
         
-        analysis_tasks[analysis_id].update({
-            'status': 'completed',
-            'result': result
-        })
-        
-        # 크롤러 정리
-        crawler.close()
+        if request.render_charts:
+            update_progress(95, "차트 이미지 생성 중...")
+            with timer.stage('render_charts'):
+                result['charts'] = await render_result_charts(result, request.chart_format)
+        result['timings'] = timer.breakdown()
+        logger.info(f"분석 단계별 소요 시간 ({analysis_id}): {result['timings']}")
+        
+        await finish_task(
+            analysis_id,
+            status='completed',
+            progress=100,
+            message="분석 완료!",
+            result=result,
+            partial_result=None
+        )
+        ANALYSES_TOTAL.inc(status='completed')
         
     except Exception as e:
         logger.error(f"분석 실패: {e}")
-        analysis_tasks[analysis_id].update({
-            'status': 'error',
-            'message': f"분석 중 오류가 발생했습니다: {str(e)}",
-            'progress': 0
-        })
+        FAILURES_TOTAL.inc(stage='analysis')
+        ANALYSES_TOTAL.inc(status='error')
+        await finish_task(
+            analysis_id,
+            status='error',
+            message=f"분석 중 오류가 발생했습니다: {str(e)}",
+            progress=0,
+            timings=timer.breakdown()
+        )
+    finally:
+        timer.publish()
+
+# 서버 시작 후 백그라운드에서 무거운 백엔드를 미리 불러와 첫 분석 요청의 지연을 없앤다
+PREWARM_ENABLED = os.getenv('ANALYZER_PREWARM', 'true').lower() != 'false'
+prewarm_state: Dict[str, Any] = {'status': 'pending' if PREWARM_ENABLED else 'disabled'}
+_background_tasks: Set[asyncio.Task] = set()
+
+def prewarm_backends():
+    """분석/수집 모듈 import, 감정 사전·토크나이저 준비, HTTP 수집기 생성, 드라이버 풀 워밍업"""
+    started = time.perf_counter()
+    prewarm_state['status'] = 'running'
+    try:
+        from review_analysis import ReviewAnalyzer
+        analyzer = ReviewAnalyzer()
+        analyzer.sentiment_backend.score_batch(["워밍업"])
+        get_http_fetcher()
+        if driver_pool.size > 0:
+            import browser_crawler  # noqa: F401
+            driver_pool.warm_up()
+        prewarm_state['status'] = 'done'
+    except Exception as e:
+        logger.warning(f"사전 워밍업 실패 (첫 요청 때 다시 불러옴): {e}")
+        prewarm_state.update(status='failed', error=str(e))
+    finally:
+        prewarm_state['seconds'] = round(time.perf_counter() - started, 3)
+        logger.info(f"사전 워밍업 {prewarm_state['status']} ({prewarm_state['seconds']}초)")
+
+@app.on_event("startup")
+async def start_prewarm():
+    """서버 시작 시 요청을 막지 않고 백엔드 사전 워밍업 시작"""
+    if not PREWARM_ENABLED:
+        return
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(loop.run_in_executor(None, prewarm_backends))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+@app.on_event("shutdown")
+async def close_driver_pool():
+    """서버 종료 시 작업 취소 및 드라이버 정리"""
+    scheduler.shutdown()
+    driver_pool.close()
+    if _http_fetcher is not None:
+        _http_fetcher.close()
+    review_cache.close()
+    job_store.close()
+
+def _driver_gauge() -> Dict[tuple, float]:
+    stats = driver_pool.stats()
+    return {('idle',): stats['idle'], ('in_use',): stats['in_use']}
+
+def _driver_events_gauge() -> Dict[tuple, float]:
+    stats = driver_pool.stats()
+    return {(event,): stats[event] for event in ('created', 'recycled', 'unhealthy')}
+
+# 스크레이프 시점에 읽는 게이지
+REGISTRY.gauge('review_analyzer_queue_depth', "Analyses waiting for a scheduler slot", lambda: scheduler.stats()['queued'])
+REGISTRY.gauge('review_analyzer_running_jobs', "Analyses currently running", lambda: scheduler.stats()['running'])
+REGISTRY.gauge('review_analyzer_drivers', "Pooled Chrome drivers by state", _driver_gauge, ('state',))
+REGISTRY.gauge('review_analyzer_driver_events', "Chrome driver lifecycle events since start", _driver_events_gauge, ('event',))
+REGISTRY.gauge('review_analyzer_jobs_in_memory', "Job entries held in memory", lambda: job_store.tasks_in_memory)
+REGISTRY.gauge('review_analyzer_result_bytes_in_memory', "Serialized size of results held in memory", lambda: job_store.result_bytes_in_memory)
+REGISTRY.gauge('review_analyzer_event_subscribers', "Open progress event streams", lambda: progress_broker.stats()['subscribers'])
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return PlainTextResponse(REGISTRY.render(), media_type=REGISTRY.content_type)
+
+@app.get("/charts/{filename}")
+async def get_chart(filename: str):
+    """렌더링된 차트 이미지 (파일 이름이 내용 해시라 영구 캐시 가능)"""
+    body = await asyncio.get_running_loop().run_in_executor(None, chart_cache.load, filename)
+    if body is None:
+        raise HTTPException(status_code=404, detail="차트 이미지를 찾을 수 없습니다.")
+    return Response(
+        content=body,
+        media_type=chart_cache.media_type(filename),
+        headers={'Cache-Control': 'public, max-age=31536000, immutable', 'ETag': f'"{filename}"'}
+    )
+
+# 디스크를 읽는 통계 엔드포인트는 동기 함수로 두어 FastAPI가 스레드 풀에서 실행한다
+@app.get("/jobs/stats")
+def get_job_store_stats():
+    """작업 저장소 메모리 적재 현황 및 디스크 규모"""
+    return job_store.stats()
+
+@app.get("/cache/stats")
+def get_cache_stats():
+    """리뷰 캐시 적중률 및 설정"""
+    return review_cache.stats()
 
 @app.get("/")
-async def root():
-    return {"message": "VIBE Review Analyzer API", "status": "running"}
+def root():
+    return {
+        "message": "VIBE Review Analyzer API",
+        "status": "running",
+        "prewarm": prewarm_state,
+        "driver_pool": driver_pool.stats(),
+        "scheduler": scheduler.stats(),
+        "domain_limiter": domain_limiter.stats(),
+        "progress_events": progress_broker.stats(),
+        "charts": chart_cache.stats(),
+        "jobs": job_store.stats()
+    }
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
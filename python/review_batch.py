@@ -0,0 +1,89 @@
+# VIBE 리뷰 분석기 - 열 단위 리뷰 묶음
+# 수집기가 넘겨주는 리뷰 사전 목록(List[Dict])을 열 단위로 바꿔 분석기에 넘긴다.
+# 평점/도움됨 수/길이는 NumPy 배열이라 통계가 벡터 연산이 되고,
+# 행마다 반복되던 키와 'platform' 문자열이 사라져 리뷰당 메모리와 프로세스 간 전송량이 줄어든다.
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# 쿠팡 평점은 1~5 (0은 평점을 읽지 못한 리뷰)
+MAX_RATING = 5
+
+
+class ReviewBatch:
+    """리뷰 열 묶음 (텍스트/날짜/ID는 리스트, 수치 열은 NumPy 배열, 플랫폼은 코드표)"""
+
+    __slots__ = ('ids', 'texts', 'dates', 'ratings', 'helpful_counts', 'lengths', 'platform_codes', 'platforms')
+
+    def __init__(
+        self,
+        ids: List[str],
+        texts: List[str],
+        dates: List[str],
+        ratings: np.ndarray,
+        helpful_counts: np.ndarray,
+        lengths: np.ndarray,
+        platform_codes: np.ndarray,
+        platforms: Tuple[str, ...],
+    ):
+        self.ids = ids
+        self.texts = texts
+        self.dates = dates
+        self.ratings = ratings
+        self.helpful_counts = helpful_counts
+        self.lengths = lengths
+        self.platform_codes = platform_codes
+        self.platforms = platforms
+
+    @classmethod
+    def empty(cls) -> "ReviewBatch":
+        return cls.from_records([])
+
+    @classmethod
+    def from_records(cls, reviews: Sequence[Dict[str, Any]]) -> "ReviewBatch":
+        """수집기 리뷰 사전 목록 → 열 묶음"""
+        texts = [review['text'] for review in reviews]
+        platforms: Dict[str, int] = {}
+        codes = [platforms.setdefault(review.get('platform') or '', len(platforms)) for review in reviews]
+        return cls(
+            ids=[review.get('id') or '' for review in reviews],
+            texts=texts,
+            dates=[review.get('date') or '' for review in reviews],
+            ratings=np.fromiter((review['rating'] for review in reviews), dtype=np.int8, count=len(reviews)),
+            helpful_counts=np.fromiter(
+                (review.get('helpful_count') or 0 for review in reviews), dtype=np.int32, count=len(reviews)
+            ),
+            lengths=np.fromiter((len(text) for text in texts), dtype=np.int32, count=len(texts)),
+            platform_codes=np.asarray(codes, dtype=np.uint8),
+            platforms=tuple(platforms),
+        )
+
+    @classmethod
+    def coerce(cls, reviews) -> "ReviewBatch":
+        """ReviewBatch는 그대로, 리뷰 사전 목록은 변환"""
+        return reviews if isinstance(reviews, cls) else cls.from_records(reviews)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """API 응답/캐시용 리뷰 사전 목록으로 되돌림"""
+        return [
+            {
+                'id': review_id,
+                'rating': int(rating),
+                'text': text,
+                'date': date,
+                'helpful_count': int(helpful),
+                'platform': self.platforms[code],
+            }
+            for review_id, rating, text, date, helpful, code in zip(
+                self.ids, self.ratings.tolist(), self.texts, self.dates,
+                self.helpful_counts.tolist(), self.platform_codes.tolist()
+            )
+        ]
+
+    def rating_counts(self) -> np.ndarray:
+        """평점별 리뷰 수 (인덱스 = 평점, 0~MAX_RATING)"""
+        return np.bincount(self.ratings, minlength=MAX_RATING + 1)
@@ -0,0 +1,218 @@
+# VIBE 리뷰 분석기 - 리뷰 캐시 (SQLite)
+# 상품 ID + 리뷰 지문으로 수집한 리뷰를 저장해 같은 상품을 다시 분석할 때
+# 이미 아는 리뷰가 나올 때까지만 새로 수집하고 나머지는 캐시에서 합친다.
+# 리뷰는 항상 최신순(DATE_DESC)으로 수집하고, 캐시가 최신순으로 끊김 없이 채운 앞부분(prefix)의
+# 길이를 함께 저장한다. 그 앞부분이 요청 수를 덮을 때만 아는 리뷰에서 멈출 수 있다.
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'reviews.sqlite3')
+
+# 지문 계산 방식이나 저장 구조가 바뀌면 올린다 (예전 캐시는 버리고 새로 수집)
+SCHEMA_VERSION = 2
+
+
+def normalize_review_text(text: Any) -> str:
+    """연속 공백/줄바꿈을 공백 하나로 (HTTP 파서와 브라우저 추출이 같은 본문을 내도록)"""
+    return ' '.join(str(text or '').split())
+
+
+def review_fingerprint(review: Dict[str, Any]) -> str:
+    """안정적인 리뷰 식별자 (페이지 위치와 무관)
+
+    쿠팡 리뷰 ID가 있으면 그것으로, 없으면 작성자/작성일/평점/본문으로 만든다.
+    본문은 공백을 모두 빼고 비교해 innerText와 get_text의 줄바꿈 차이가 지문에 영향을 주지 않는다.
+    """
+    review_id = review.get('review_id')
+    if review_id:
+        key = f"id\x1f{review_id}"
+    else:
+        text = ''.join(str(review.get('text', '')).split())
+        key = f"{review.get('reviewer', '')}\x1f{review.get('date', '')}\x1f{review.get('rating', '')}\x1f{text}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+class ReviewCache:
+    """상품별 리뷰 저장소
+
+    - TTL 안에 수집된 상품은 캐시만으로 응답 (hit)
+    - TTL이 지났으면 아는 리뷰가 나올 때까지만 수집 후 병합 (incremental)
+    - 캐시가 없으면 전체 수집 (miss)
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl_seconds: float = 6 * 3600, enabled: bool = True):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.incremental = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ReviewCache":
+        """환경 변수로 캐시 설정"""
+        return cls(
+            path=os.getenv('REVIEW_CACHE_PATH', DEFAULT_CACHE_PATH),
+            ttl_seconds=float(os.getenv('REVIEW_CACHE_TTL', str(6 * 3600))),
+            enabled=os.getenv('REVIEW_CACHE_ENABLED', 'true').lower() != 'false',
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                # 지문이 달라진 예전 캐시와 섞이면 같은 리뷰가 두 번 저장되므로 비운다
+                self._conn.executescript("DROP TABLE IF EXISTS products; DROP TABLE IF EXISTS reviews;")
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS products (
+                    product_id TEXT PRIMARY KEY,
+                    product_info TEXT NOT NULL,
+                    crawled_at REAL NOT NULL,
+                    prefix_count INTEGER NOT NULL DEFAULT 0,
+                    exhausted INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS reviews (
+                    product_id TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    rating INTEGER,
+                    text TEXT,
+                    date TEXT,
+                    helpful_count INTEGER,
+                    platform TEXT,
+                    first_seen REAL NOT NULL,
+                    PRIMARY KEY (product_id, fingerprint)
+                );
+            """)
+        return self._conn
+
+    def lookup(self, product_id: str) -> Optional[Dict[str, Any]]:
+        """캐시된 상품 정보, 수집 시각, 신선도, 최신순 앞부분 길이/마지막 페이지 도달 여부 (없으면 None)"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT product_info, crawled_at, prefix_count, exhausted FROM products WHERE product_id = ?",
+                (product_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        crawled_at = row[1]
+        return {
+            'product_info': json.loads(row[0]),
+            'crawled_at': crawled_at,
+            'fresh': time.time() - crawled_at < self.ttl_seconds,
+            'prefix_count': row[2],
+            'exhausted': bool(row[3])
+        }
+
+    def known_fingerprints(self, product_id: str) -> Set[str]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT fingerprint FROM reviews WHERE product_id = ?", (product_id,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def load_reviews(self, product_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """최신순으로 리뷰 로드 (작성일 'YYYY.MM.DD'는 문자열 순서가 날짜 순서, 같은 날은 먼저 수집한 순)"""
+        query = ("SELECT fingerprint, rating, text, date, helpful_count, platform "
+                 "FROM reviews WHERE product_id = ? ORDER BY date DESC, rowid")
+        params: tuple = (product_id,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+
+        with self._lock:
+            rows = self._connect().execute(query, params).fetchall()
+        return [
+            {
+                'id': fingerprint,
+                'rating': rating,
+                'text': text,
+                'date': date,
+                'helpful_count': helpful_count,
+                'platform': platform
+            }
+            for fingerprint, rating, text, date, helpful_count, platform in rows
+        ]
+
+    def store(
+        self,
+        product_id: str,
+        product_info: Dict[str, Any],
+        reviews: List[Dict[str, Any]],
+        prefix_count: int = 0,
+        exhausted: bool = False,
+    ):
+        """상품 정보 갱신 + 리뷰 upsert (이미 있는 리뷰는 도움됨 수만 갱신)
+
+        prefix_count: 최신순 첫 페이지부터 끊김 없이 캐시에 있는 리뷰 수
+        exhausted: 그 앞부분이 마지막 리뷰까지 이어지는지
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    """INSERT OR REPLACE INTO products (product_id, product_info, crawled_at, prefix_count, exhausted)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (product_id, json.dumps(product_info, ensure_ascii=False), now, prefix_count, int(exhausted))
+                )
+                conn.executemany(
+                    """INSERT INTO reviews
+                       (product_id, fingerprint, rating, text, date, helpful_count, platform, first_seen)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (product_id, fingerprint) DO UPDATE SET helpful_count = excluded.helpful_count""",
+                    [
+                        (product_id, review['id'], review['rating'], review['text'], review['date'],
+                         review['helpful_count'], review.get('platform'), now)
+                        for review in reviews
+                    ]
+                )
+
+    def record(self, outcome: str):
+        """조회 결과 집계 ('hit', 'incremental', 'miss')"""
+        if outcome == 'hit':
+            self.hits += 1
+        elif outcome == 'incremental':
+            self.incremental += 1
+        else:
+            self.misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률과 저장 규모"""
+        lookups = self.hits + self.incremental + self.misses
+        with self._lock:
+            conn = self._connect()
+            products = conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+            reviews = conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+        return {
+            'enabled': self.enabled,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'incremental': self.incremental,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0,
+            'products': products,
+            'reviews': reviews
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,121 @@
+# VIBE 리뷰 분석기 - 감정 분석 백엔드
+# 리뷰 목록 전체를 한 번에 점수화하는 백엔드 인터페이스와
+# 한국어 극성 사전을 정규식 하나로 미리 컴파일한 배치 사전 점수기를 제공한다.
+
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEXICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lexicons', 'ko_sentiment.tsv')
+
+# 극성이 이 값을 넘으면 긍정, -이 값보다 작으면 부정
+POLARITY_THRESHOLD = 0.1
+
+
+class SentimentBackend:
+    """감정 점수 백엔드 인터페이스 (텍스트 목록 → -1.0 ~ 1.0 극성 배열)"""
+
+    name = 'base'
+
+    def score_batch(self, texts: Sequence[str]) -> np.ndarray:
+        raise NotImplementedError
+
+
+class TextBlobBackend(SentimentBackend):
+    """기존 TextBlob 점수기 (영어 전용, 리뷰마다 TextBlob 생성)"""
+
+    name = 'textblob'
+
+    def score_batch(self, texts: Sequence[str]) -> np.ndarray:
+        from textblob import TextBlob
+
+        return np.fromiter((TextBlob(text).sentiment.polarity for text in texts), dtype=np.float64, count=len(texts))
+
+
+class KoreanLexiconBackend(SentimentBackend):
+    """한국어 극성 사전 기반 배치 점수기
+
+    사전의 모든 표현을 긴 것 우선의 정규식 하나로 컴파일해 두고, 전체 리뷰를 이어 붙인
+    문자열을 한 번 훑은 뒤 매칭 위치를 리뷰 번호로 바꿔 np.bincount로 리뷰별 합산한다.
+    극성 = 매칭 극성 합 / (매칭 수 + smoothing), -1 ~ 1로 자른다.
+    """
+
+    name = 'lexicon'
+
+    def __init__(self, lexicon_path: str = DEFAULT_LEXICON_PATH, smoothing: float = 1.0):
+        self.lexicon_path = lexicon_path
+        self.smoothing = smoothing
+        self.lexicon = self.load_lexicon(lexicon_path)
+
+        # 같은 위치에서 긴 표현("안 좋")이 짧은 표현("좋")보다 먼저 매칭되도록 정렬
+        terms = sorted(self.lexicon, key=len, reverse=True)
+        self.pattern = re.compile('|'.join(re.escape(term) for term in terms))
+
+    @staticmethod
+    def load_lexicon(path: str) -> Dict[str, float]:
+        """탭 구분 사전 파일 로드 (# 주석, 빈 줄 무시)"""
+        lexicon: Dict[str, float] = {}
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if not line.strip() or line.startswith('#'):
+                    continue
+                term, polarity = line.split('\t')
+                lexicon[term] = float(polarity)
+        return lexicon
+
+    def score_batch(self, texts: Sequence[str]) -> np.ndarray:
+        count = len(texts)
+        if count == 0:
+            return np.zeros(0)
+
+        # 리뷰 i는 joined[offsets[i]:offsets[i] + len(texts[i])]
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=count)
+        offsets = np.zeros(count, dtype=np.int64)
+        np.cumsum(lengths[:-1] + 1, out=offsets[1:])
+        joined = '\n'.join(texts)
+
+        lexicon = self.lexicon
+        starts = []
+        polarities = []
+        for match in self.pattern.finditer(joined):
+            starts.append(match.start())
+            polarities.append(lexicon[match.group()])
+
+        if not starts:
+            return np.zeros(count)
+
+        review_index = np.searchsorted(offsets, np.asarray(starts), side='right') - 1
+        sums = np.bincount(review_index, weights=np.asarray(polarities), minlength=count)
+        hits = np.bincount(review_index, minlength=count)
+        return np.clip(sums / (hits + self.smoothing), -1.0, 1.0)
+
+
+_BACKENDS = {
+    KoreanLexiconBackend.name: KoreanLexiconBackend,
+    TextBlobBackend.name: TextBlobBackend,
+}
+
+
+@lru_cache(maxsize=None)
+def get_sentiment_backend(name: Optional[str] = None) -> SentimentBackend:
+    """이름으로 백엔드 생성 (프로세스마다 한 번만 사전을 컴파일, 기본값은 SENTIMENT_BACKEND)"""
+    name = name or os.getenv('SENTIMENT_BACKEND', KoreanLexiconBackend.name)
+    if name not in _BACKENDS:
+        raise ValueError(f"지원되지 않는 감정 분석 백엔드입니다: {name}")
+    return _BACKENDS[name]()
+
+
+def classify_polarities(polarities: np.ndarray) -> np.ndarray:
+    """극성 배열 → 'positive' / 'negative' / 'neutral' 라벨 배열"""
+    return np.where(
+        polarities > POLARITY_THRESHOLD,
+        'positive',
+        np.where(polarities < -POLARITY_THRESHOLD, 'negative', 'neutral')
+    )
@@ -0,0 +1,169 @@
+# VIBE 리뷰 분석기 - 쿠팡 로컬 스텁 서버
+# 저장해 둔 상품/리뷰 페이지(fixtures/coupang)를 쿠팡과 같은 경로로 내려준다.
+#
+#   python stub_server.py --port 8765
+#   COUPANG_BASE_URL=http://127.0.0.1:8765 python review_analyzer.py
+#
+# 리뷰 목록은 저장된 모든 페이지의 리뷰를 sortBy(DATE_DESC: 최신순, 그 외: 도움순)로 정렬해 size개씩 나눠 준다.
+# --replay-pages N을 주면 저장된 (꽉 찬) 리뷰 페이지를 돌려 가며 N페이지까지 내려준다 (벤치마크용).
+
+import argparse
+import glob
+import logging
+import os
+import re
+import threading
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'coupang')
+
+# 쿠팡 리뷰 목록의 정렬 (sortBy 파라미터가 없으면 쿠팡처럼 베스트순)
+SORT_NEWEST = 'DATE_DESC'
+SORT_DEFAULT = 'ORDER_SCORE_ASC'
+DEFAULT_PAGE_SIZE = 5
+
+ARTICLE_RE = re.compile(r'<article\b.*?</article>\s*', re.S)
+DATE_RE = re.compile(r'sdp-review__article__date">([^<]*)<')
+HELPFUL_RE = re.compile(r'sdp-review__article__helpful__count">\D*(\d+)')
+
+
+@lru_cache(maxsize=None)
+def _load_fixture(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _full_review_pages(fixture_dir: str) -> List[str]:
+    """리뷰 수가 가장 많은 (마지막 페이지가 아닌) 저장 페이지 본문 목록"""
+    pages = [_load_fixture(path) for path in sorted(glob.glob(os.path.join(fixture_dir, 'reviews_page_*.html')))]
+    if not pages:
+        return []
+    most = max(page.count('<article') for page in pages)
+    return [page for page in pages if page.count('<article') == most]
+
+
+@lru_cache(maxsize=None)
+def _sorted_articles(fixture_dir: str, sort_by: str) -> Tuple[str, ...]:
+    """저장된 모든 리뷰 페이지의 <article> 조각을 sort_by 순서로"""
+    articles = [
+        article
+        for path in sorted(glob.glob(os.path.join(fixture_dir, 'reviews_page_*.html')),
+                           key=lambda path: int(re.search(r'(\d+)\.html$', path).group(1)))
+        for article in ARTICLE_RE.findall(_load_fixture(path) or '')
+    ]
+
+    def date_of(article: str) -> str:
+        match = DATE_RE.search(article)
+        return match.group(1).strip() if match else ''
+
+    def helpful_of(article: str) -> int:
+        match = HELPFUL_RE.search(article)
+        return int(match.group(1)) if match else 0
+
+    if sort_by == SORT_NEWEST:
+        articles.sort(key=date_of, reverse=True)
+    else:
+        # 베스트순은 도움 수가 많은 순 (같으면 최신순)
+        articles.sort(key=lambda article: (helpful_of(article), date_of(article)), reverse=True)
+    return tuple(articles)
+
+
+class CoupangStubHandler(BaseHTTPRequestHandler):
+    """/vp/products/{id} → product.html, /vp/product/reviews?page=N&size=M&sortBy=S → 정렬한 리뷰의 N번째 페이지
+
+    replay_pages > 0이면 N번째 페이지 요청에 저장된 꽉 찬 페이지를 순환해서 내려준다.
+    """
+
+    fixture_dir = FIXTURE_DIR
+    replay_pages = 0
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+
+        if parsed.path.startswith('/vp/products/'):
+            body = self._read_fixture('product.html')
+        elif parsed.path == '/vp/product/reviews':
+            page = int(query.get('page', ['1'])[0])
+            if self.replay_pages:
+                body = self._replay_page(page)
+            else:
+                size = int(query.get('size', [str(DEFAULT_PAGE_SIZE)])[0])
+                body = self._review_page(page, size, query.get('sortBy', [SORT_DEFAULT])[0])
+        else:
+            body = None
+
+        if body is None:
+            self.send_error(404)
+            return
+
+        payload = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_fixture(self, name: str) -> Optional[str]:
+        return _load_fixture(os.path.join(self.fixture_dir, name))
+
+    def _review_page(self, page: int, size: int, sort_by: str) -> str:
+        # 준비된 리뷰를 넘어서면 빈 목록 (마지막 페이지 이후)
+        articles = _sorted_articles(self.fixture_dir, sort_by)[(page - 1) * size:page * size]
+        if page < 1 or not articles:
+            return ''
+        return '<div class="sdp-review__article__list">\n' + ''.join(articles) + '</div>\n'
+
+    def _replay_page(self, page: int) -> str:
+        pages = _full_review_pages(self.fixture_dir)
+        if not pages or page < 1 or page > self.replay_pages:
+            return ''
+        return pages[(page - 1) % len(pages)]
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def start_stub_server(
+    host: str = '127.0.0.1',
+    port: int = 0,
+    fixture_dir: Optional[str] = None,
+    replay_pages: int = 0,
+) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 스텁 서버 시작 (port=0이면 빈 포트 자동 선택)"""
+    handler = CoupangStubHandler
+    if fixture_dir or replay_pages:
+        handler = type('CoupangStubHandler', (CoupangStubHandler,), {
+            'fixture_dir': fixture_dir or FIXTURE_DIR,
+            'replay_pages': replay_pages,
+        })
+
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="쿠팡 로컬 스텁 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--fixtures', default=FIXTURE_DIR)
+    parser.add_argument('--replay-pages', type=int, default=0, help="저장된 리뷰 페이지를 순환해 이 페이지 수까지 제공")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = start_stub_server(args.host, args.port, args.fixtures, args.replay_pages)
+    print(f"스텁 서버 실행 중: http://{args.host}:{server.server_address[1]} ({args.fixtures})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,27 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PYTHON_DIR not in sys.path:
+    sys.path.insert(0, PYTHON_DIR)
+
+from stub_server import FIXTURE_DIR, start_stub_server  # noqa: E402
+
+
+@pytest.fixture
+def fixture_dir(tmp_path):
+    """저장된 쿠팡 페이지 사본 (테스트에서 리뷰를 추가해도 원본은 그대로)"""
+    target = tmp_path / 'coupang'
+    shutil.copytree(FIXTURE_DIR, target)
+    return target
+
+
+@pytest.fixture
+def stub_url(fixture_dir):
+    server = start_stub_server(fixture_dir=str(fixture_dir))
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,140 @@
+import os
+
+import pytest
+
+from coupang_http import CoupangReviewFetcher, parse_product_page, parse_review_articles
+from review_cache import review_fingerprint
+from stub_server import FIXTURE_DIR, _load_fixture, _sorted_articles
+
+PRODUCT_URL = 'https://www.coupang.com/vp/products/12345'
+
+NEW_ARTICLE = """<article class="sdp-review__article" data-review-id="990001">
+  <span class="sdp-review__article__user">신*규</span>
+  <div class="sdp-review__rating__star" data-rating="1"></div>
+  <div class="sdp-review__article__date">2025.05.03</div>
+  <div class="sdp-review__article__review">새로 올라온
+     리뷰입니다</div>
+</article>
+"""
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def add_newest_review(fixture_dir):
+    path = fixture_dir / 'reviews_page_1.html'
+    html = path.read_text(encoding='utf-8')
+    path.write_text(html.replace('<article', NEW_ARTICLE + '<article', 1), encoding='utf-8')
+    # 스텁은 읽은 페이지를 캐시하므로 바뀐 내용을 다시 읽게 한다
+    _load_fixture.cache_clear()
+    _sorted_articles.cache_clear()
+
+
+@pytest.fixture
+def fetcher(stub_url):
+    fetcher = CoupangReviewFetcher(base_url=stub_url, concurrency=2)
+    yield fetcher
+    fetcher.close()
+
+
+def test_parse_review_articles():
+    reviews = parse_review_articles(read_fixture('reviews_page_1.html'))
+
+    assert len(reviews) == 5
+    assert reviews[0] == {
+        'rating': 5,
+        'text': '배송이 빨라서 좋았어요. 포장도 꼼꼼하고 제품 상태도 만족합니다.',
+        'date': '2025.05.02',
+        'helpful_count': 12,
+        'platform': 'coupang',
+        'review_id': '880001',
+        'reviewer': '김*수',
+    }
+    assert [review['rating'] for review in reviews] == [5, 4, 5, 2, 3]
+
+
+def test_parse_review_articles_normalizes_whitespace_and_falls_back_to_data_rating():
+    reviews = parse_review_articles(NEW_ARTICLE)
+
+    assert reviews[0]['rating'] == 1
+    assert reviews[0]['text'] == '새로 올라온 리뷰입니다'
+    assert reviews[0]['helpful_count'] == 0
+
+
+def test_parse_product_page():
+    info = parse_product_page(read_fixture('product.html'))
+
+    assert info['title'] == '무선 미니 선풍기 휴대용 저소음'
+    assert info['rating'] == 4.1
+    assert info['review_count'] == 12
+    assert info['price'] == '19,900원'
+    assert parse_product_page('<html><body>차단됨</body></html>') is None
+
+
+def test_review_fingerprint_ignores_whitespace_and_prefers_review_id():
+    review = {'reviewer': '김*수', 'date': '2025.05.02', 'rating': 5, 'text': '좋아요 정말\n좋아요'}
+
+    assert review_fingerprint(review) == review_fingerprint(dict(review, text='좋아요  정말 좋아요'))
+    assert review_fingerprint(review) != review_fingerprint(dict(review, reviewer='이*영'))
+    assert review_fingerprint(dict(review, review_id='1')) == review_fingerprint({'review_id': '1'})
+
+
+def test_stub_honors_sort_by(fetcher):
+    newest = fetcher.fetch_review_page('12345', 1, sort_by='DATE_DESC')
+    best = fetcher.fetch_review_page('12345', 1, sort_by='ORDER_SCORE_ASC')
+
+    dates = [review['date'] for review in newest]
+    assert dates == sorted(dates, reverse=True)
+    assert dates[0] == '2025.05.02'
+    helpful = [review['helpful_count'] for review in best]
+    assert helpful == sorted(helpful, reverse=True)
+    assert helpful != [review['helpful_count'] for review in newest]
+
+
+def test_iter_review_pages_reads_all_pages_newest_first(fetcher):
+    outcome = {}
+    pages = list(fetcher.iter_review_pages(PRODUCT_URL, max_reviews=100, outcome=outcome))
+
+    assert [len(page) for page in pages] == [5, 5, 2]
+    dates = [review['date'] for page in pages for review in page]
+    assert dates == sorted(dates, reverse=True)
+    assert outcome == {'sort': 'DATE_DESC', 'covered': 12, 'stopped_at_known': False, 'exhausted': True}
+
+
+def test_iter_review_pages_stops_at_max_reviews(fetcher):
+    outcome = {}
+    reviews = fetcher.crawl_reviews(PRODUCT_URL, max_reviews=7, outcome=outcome)
+
+    assert len(reviews) == 7
+    assert outcome['covered'] == 7
+    assert outcome['exhausted'] is False
+
+
+def test_stop_at_known_review(fetcher, fixture_dir):
+    known = {review['id'] for review in fetcher.crawl_reviews(PRODUCT_URL, max_reviews=10)}
+    add_newest_review(fixture_dir)
+
+    outcome = {}
+    reviews = fetcher.crawl_reviews(
+        PRODUCT_URL, max_reviews=10, known_fingerprints=known, stop_at_known=True, outcome=outcome
+    )
+
+    assert [review['review_id'] for review in reviews] == ['990001']
+    assert outcome['stopped_at_known'] is True
+    assert outcome['covered'] == 1
+
+
+def test_known_reviews_are_skipped_without_stopping(fetcher, fixture_dir):
+    known = {review['id'] for review in fetcher.crawl_reviews(PRODUCT_URL, max_reviews=5)}
+    add_newest_review(fixture_dir)
+
+    outcome = {}
+    reviews = fetcher.crawl_reviews(PRODUCT_URL, max_reviews=100, known_fingerprints=known, outcome=outcome)
+
+    # 새 리뷰 1개 + 캐시에 없던 예전 리뷰 7개, 아는 리뷰 5개는 건너뜀
+    assert len(reviews) == 8
+    assert reviews[0]['review_id'] == '990001'
+    assert not known & {review['id'] for review in reviews}
+    assert outcome == {'sort': 'DATE_DESC', 'covered': 13, 'stopped_at_known': False, 'exhausted': True}
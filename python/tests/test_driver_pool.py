@@ -0,0 +1,150 @@
+import threading
+import time
+
+import pytest
+
+from driver_pool import DriverPool, DriverPoolExhausted
+
+
+class FakeDriver:
+    def __init__(self, factory):
+        self.factory = factory
+        self.healthy = True
+        self.quit_called = False
+        self.urls = []
+
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError('chrome not reachable')
+        return 1
+
+    def get(self, url):
+        if not self.healthy:
+            raise RuntimeError('chrome not reachable')
+        self.urls.append(url)
+
+    def quit(self):
+        self.quit_called = True
+        self.factory.quit_one()
+
+
+class FakeFactory:
+    """느린 Chrome 생성을 흉내 내며 동시에 살아 있는 드라이버 수의 최대치를 기록"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.drivers = []
+        self.alive = 0
+        self.peak_alive = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, headless):
+        with self._lock:
+            self.alive += 1
+            self.peak_alive = max(self.peak_alive, self.alive)
+        time.sleep(self.delay)
+        driver = FakeDriver(self)
+        self.drivers.append(driver)
+        return driver
+
+    def quit_one(self):
+        with self._lock:
+            self.alive -= 1
+
+
+def test_concurrent_leases_during_warm_up_stay_within_size():
+    factory = FakeFactory(delay=0.05)
+    pool = DriverPool(size=2, driver_factory=factory, checkout_timeout=5)
+    errors = []
+
+    def use_driver():
+        try:
+            with pool.lease() as pooled:
+                pooled.mark_page_load()
+                time.sleep(0.02)
+        except Exception as e:  # pragma: no cover - 실패 시 원인 출력용
+            errors.append(e)
+
+    threads = [threading.Thread(target=pool.warm_up)]
+    threads += [threading.Thread(target=use_driver) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert factory.peak_alive <= 2
+    assert pool.stats()['live'] <= 2
+    pool.close()
+
+
+def test_driver_is_recycled_after_max_page_loads():
+    factory = FakeFactory()
+    pool = DriverPool(size=1, max_page_loads=3, driver_factory=factory)
+
+    with pool.lease() as pooled:
+        pooled.mark_page_load(2)
+    with pool.lease() as reused:
+        assert reused is pooled
+        reused.mark_page_load()
+
+    assert pooled.driver.quit_called
+    assert pool.stats()['recycled'] == 1
+    with pool.lease() as fresh:
+        assert fresh is not pooled
+    assert pool.stats()['created'] == 2
+
+
+def test_unhealthy_idle_driver_is_replaced_on_checkout():
+    factory = FakeFactory()
+    pool = DriverPool(size=1, driver_factory=factory)
+    pool.warm_up()
+    stale = factory.drivers[0]
+    stale.healthy = False
+
+    pooled = pool.checkout()
+    assert pooled.driver is not stale
+    assert stale.quit_called
+    assert pool.stats()['unhealthy'] == 1
+    pool.checkin(pooled)
+    assert pool.stats()['live'] == 1
+
+
+def test_driver_broken_inside_lease_is_discarded():
+    factory = FakeFactory()
+    pool = DriverPool(size=1, driver_factory=factory)
+
+    with pytest.raises(RuntimeError):
+        with pool.lease() as pooled:
+            pooled.driver.healthy = False
+            raise RuntimeError('page crashed')
+
+    assert pooled.driver.quit_called
+    assert pool.stats()['live'] == 0
+    with pool.lease() as replacement:
+        assert replacement is not pooled
+
+
+def test_checkout_times_out_when_every_driver_is_leased():
+    pool = DriverPool(size=1, driver_factory=FakeFactory())
+    with pool.lease():
+        started = time.monotonic()
+        with pytest.raises(DriverPoolExhausted):
+            pool.checkout(timeout=0.1)
+        assert time.monotonic() - started < 2
+    # 반납 뒤에는 다시 빌릴 수 있다
+    with pool.lease():
+        pass
+
+
+def test_healthy_driver_survives_an_error_inside_lease():
+    pool = DriverPool(size=1, driver_factory=FakeFactory())
+
+    with pytest.raises(ValueError):
+        with pool.lease() as pooled:
+            raise ValueError('parse error')
+
+    assert not pooled.driver.quit_called
+    assert pooled.driver.urls == ['about:blank']
+    with pool.lease() as reused:
+        assert reused is pooled
@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import review_analyzer
+from job_scheduler import DomainRateLimiter, JobScheduler, QueueFullError
+from job_store import JobStore
+
+
+def test_coupang_hosts_share_one_domain():
+    assert DomainRateLimiter.domain_of('https://www.coupang.com/vp/products/1') == 'coupang.com'
+    assert DomainRateLimiter.domain_of('https://m.coupang.com/vm/products/1') == 'coupang.com'
+    assert DomainRateLimiter.domain_of('https://COUPANG.com/vp/products/1') == 'coupang.com'
+
+
+def test_co_kr_sites_are_not_merged():
+    first = DomainRateLimiter.domain_of('https://www.11st.co.kr/products/1')
+    second = DomainRateLimiter.domain_of('https://www.gmarket.co.kr/item?goodscode=1')
+    assert first == 'www.11st.co.kr'
+    assert second == 'www.gmarket.co.kr'
+    assert first != second
+
+
+def test_limit_tracks_active_per_domain():
+    limiter = DomainRateLimiter(max_concurrent=2, min_interval=0)
+    with limiter.limit('https://www.coupang.com/vp/products/1'):
+        with limiter.limit('https://shop.example.co.kr/item/1'):
+            assert limiter.stats()['active'] == {'coupang.com': 1, 'shop.example.co.kr': 1}
+    assert limiter.stats()['active'] == {}
+
+
+@pytest.fixture
+def analyzer_client(tmp_path, monkeypatch):
+    """실행 슬롯이 없어(max_concurrent_jobs=0) 등록된 분석이 대기열에만 쌓이는 API 클라이언트"""
+    monkeypatch.setattr(review_analyzer, 'scheduler', JobScheduler(max_concurrent_jobs=0, max_queue_depth=3))
+    store = JobStore(path=str(tmp_path / 'jobs.sqlite3'))
+    monkeypatch.setattr(review_analyzer, 'job_store', store)
+    yield TestClient(review_analyzer.app)
+    store.close()
+
+
+def product_url(number):
+    return f'https://www.coupang.com/vp/products/{number}'
+
+
+def test_batch_is_rejected_whole_when_it_would_overflow_the_queue(analyzer_client):
+    accepted = analyzer_client.post('/analyze/batch', json={'urls': [product_url(1), product_url(2)]})
+    assert accepted.status_code == 200
+    assert len(accepted.json()['analysis_ids']) == 2
+
+    rejected = analyzer_client.post('/analyze/batch', json={'urls': [product_url(3), product_url(4)]})
+    assert rejected.status_code == 503
+    # 일부만 등록되지 않는다
+    assert len(review_analyzer.scheduler._pending) == 2
+    assert review_analyzer.job_store.tasks_in_memory == 3  # 분석 2개 + 배치 1개
+
+    assert analyzer_client.post('/analyze', json={'url': product_url(5)}).status_code == 200
+    assert analyzer_client.post('/analyze', json={'url': product_url(6)}).status_code == 503
+
+
+def test_capacity_counts_free_run_slots():
+    scheduler = JobScheduler(max_concurrent_jobs=2, max_queue_depth=1)
+    scheduler.ensure_capacity(3)
+    with pytest.raises(QueueFullError):
+        scheduler.ensure_capacity(4)
@@ -0,0 +1,136 @@
+import time
+
+import pytest
+
+from job_store import JobStore
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    stores = []
+
+    def make(**kwargs):
+        kwargs.setdefault('path', str(tmp_path / 'jobs.sqlite3'))
+        store = JobStore(**kwargs)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def finish(store, job_id, result=None, finished_at=None, dedup_key=None):
+    store.create(job_id, {'id': job_id, 'status': 'pending'}, dedup_key=dedup_key)
+    fields = {'status': 'completed'}
+    if finished_at is not None:
+        fields['finished_at'] = finished_at
+    if result is not None:
+        fields['result'] = result
+    return store.update(job_id, **fields)
+
+
+def test_finished_tasks_are_evicted_lru_but_running_tasks_stay(make_store):
+    evicted = []
+    store = make_store(max_tasks=2, on_evict=evicted.append)
+    store.create('running', {'status': 'crawling'})
+    finish(store, 'old')
+    finish(store, 'new')
+
+    assert store.tasks_in_memory == 2
+    assert evicted == ['old']
+    assert store.get('running')['status'] == 'crawling'
+    # 메모리에서 빠진 작업 상태는 디스크에서 다시 읽는다
+    assert store.get('old')['status'] == 'completed'
+
+
+def test_finished_tasks_expire_after_ttl(make_store):
+    store = make_store(ttl_seconds=60)
+    finish(store, 'stale', finished_at=time.time() - 120)
+    store.create('fresh', {'status': 'pending'})
+
+    assert store.stats()['task_evictions'] == 1
+    assert store.tasks_in_memory == 1
+
+
+def test_results_are_reloaded_lazily_from_disk(make_store):
+    store = make_store(max_results=1)
+    finish(store, 'first', result={'id': 'first', 'raw_reviews': [{'text': '좋아요'}]})
+    finish(store, 'second', result={'id': 'second'})
+
+    stats = store.stats()
+    assert stats['results_in_memory'] == 1
+    assert stats['result_evictions'] == 1
+
+    assert store.get_result('first') == {'id': 'first', 'raw_reviews': [{'text': '좋아요'}]}
+    assert store.result_loads == 1
+    assert store.get_result('first')['id'] == 'first'
+    assert store.result_hits == 1
+    assert store.get_result('missing') is None
+
+
+def test_results_survive_a_restart(make_store):
+    finish(make_store(), 'job', result={'id': 'job'})
+    assert make_store().get_result('job') == {'id': 'job'}
+
+
+def test_dedup_key_expires_after_dedup_ttl(make_store):
+    store = make_store(dedup_ttl=60)
+    store.create('running', {'status': 'crawling'}, dedup_key='url-a')
+    assert store.find_duplicate('url-a') == 'running'
+
+    finish(store, 'recent', dedup_key='url-b')
+    assert store.find_duplicate('url-b') == 'recent'
+    assert store.find_duplicate('url-b', include_completed=False) is None
+
+    finish(store, 'expired', finished_at=time.time() - 120, dedup_key='url-c')
+    assert store.find_duplicate('url-c') is None
+    assert store.stats()['deduplicated'] == 2
+
+
+def test_disk_keeps_only_the_newest_jobs(make_store):
+    store = make_store(disk_max_jobs=2)
+    now = time.time()
+    for number in range(4):
+        finish(store, f'job{number}', result={'id': number}, finished_at=now - 10 + number)
+
+    stats = store.stats()
+    assert stats['jobs_on_disk'] == 2
+    assert stats['disk_evictions'] == 2
+    store._results.clear()
+    assert store.get_result('job0') is None
+    assert store.get_result('job3') == {'id': 3}
+
+
+def test_disk_drops_jobs_past_disk_ttl(make_store):
+    store = make_store(disk_ttl_seconds=3600, disk_max_jobs=0)
+    finish(store, 'ancient', result={'id': 'ancient'}, finished_at=time.time() - 7200)
+    finish(store, 'recent', result={'id': 'recent'})
+
+    assert store.stats()['jobs_on_disk'] == 1
+    assert store.stats()['disk_evictions'] == 1
+
+
+def test_stats_report_memory_and_disk(make_store):
+    store = make_store()
+    store.create('running', {'status': 'crawling'})
+    finish(store, 'done', result={'id': 'done', 'text': '가' * 100})
+
+    stats = store.stats()
+    assert stats['tasks_in_memory'] == 2
+    assert stats['running_tasks'] == 1
+    assert stats['results_in_memory'] == 1
+    assert stats['result_bytes_in_memory'] == store.result_bytes_in_memory > 0
+    assert stats['jobs_on_disk'] == 1
+    assert 0 < stats['disk_bytes'] < stats['disk_raw_bytes']
+    assert stats['persist'] is True
+
+
+def test_memory_only_store_skips_disk(make_store, tmp_path):
+    store = make_store(persist=False, max_results=1)
+    finish(store, 'first', result={'id': 'first'})
+    finish(store, 'second', result={'id': 'second'})
+
+    assert store.get_result('first') is None
+    assert 'jobs_on_disk' not in store.stats()
+    assert not (tmp_path / 'jobs.sqlite3').exists()
@@ -0,0 +1,42 @@
+from selenium.common.exceptions import WebDriverException
+
+from page_waits import _INSTALL_REQUEST_COUNTER, AdaptiveWaiter, LatencyHistory
+
+
+class FakeDriver:
+    """요청 카운터 설치 스크립트는 기록만 하고, 상태 스크립트에는 정해진
+    [마지막으로 끝난 요청 이후 ms, 진행 중인 fetch/XHR 수]를 차례로 돌려주는 드라이버"""
+
+    def __init__(self, states, fail_install=False):
+        self.states = list(states)
+        self.fail_install = fail_install
+        self.installs = 0
+
+    def execute_script(self, script):
+        if script == _INSTALL_REQUEST_COUNTER:
+            if self.fail_install:
+                raise WebDriverException('javascript disabled')
+            self.installs += 1
+            return None
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def test_network_idle_waits_for_in_flight_requests():
+    driver = FakeDriver([[900, 2], [100, 0], [400, 0]])
+    waiter = AdaptiveWaiter(driver, latencies=LatencyHistory(), poll_frequency=0.01)
+    assert waiter.wait_for_network_idle('idle', idle_ms=300)
+    assert driver.installs == 1
+    assert waiter.timings[-1]['timed_out'] is False
+
+
+def test_network_idle_is_capped_by_max_timeout():
+    waiter = AdaptiveWaiter(FakeDriver([[0, 1]]), latencies=LatencyHistory(), poll_frequency=0.01)
+    assert waiter.wait_for_network_idle('busy', max_timeout=0.05) is None
+    assert waiter.timings[-1]['timed_out'] is True
+    assert waiter.timings[-1]['timeout'] == 0.05
+
+
+def test_network_idle_gives_up_when_counter_cannot_be_installed():
+    waiter = AdaptiveWaiter(FakeDriver([[1000, 0]], fail_install=True), latencies=LatencyHistory())
+    assert waiter.wait_for_network_idle('idle') is None
+    assert waiter.timings == []
@@ -0,0 +1,55 @@
+import gzip
+
+import pytest
+
+import result_views
+from result_views import compress, etag_matches, negotiate_encoding, result_etag
+
+
+class FakeBrotli:
+    @staticmethod
+    def compress(body, quality):
+        return b'br:' + body
+
+
+@pytest.fixture
+def with_brotli(monkeypatch):
+    monkeypatch.setattr(result_views, 'brotli', FakeBrotli)
+
+
+def test_negotiate_prefers_br_then_gzip(with_brotli):
+    assert negotiate_encoding('gzip, deflate, br') == 'br'
+    assert negotiate_encoding('gzip;q=1.0, br;q=0.5') == 'gzip'
+    assert negotiate_encoding('identity') is None
+    assert negotiate_encoding(None) is None
+
+
+def test_negotiate_honours_q_zero(with_brotli):
+    assert negotiate_encoding('br;q=0, gzip') == 'gzip'
+    assert negotiate_encoding('br;q=0, gzip;q=0') is None
+    assert negotiate_encoding('*;q=0.5, br;q=0') == 'gzip'
+    assert negotiate_encoding('gzip;q=abc') is None
+
+
+def test_negotiate_without_brotli(monkeypatch):
+    monkeypatch.setattr(result_views, 'brotli', None)
+    assert negotiate_encoding('br') is None
+    assert negotiate_encoding('br, gzip') == 'gzip'
+
+
+def test_compress_uses_negotiated_encoding():
+    body = b'x' * (result_views.MIN_COMPRESS_BYTES + 1)
+    compressed, encoding = compress(body, 'gzip')
+    assert encoding == 'gzip' and gzip.decompress(compressed) == body
+    assert compress(body, None) == (body, None)
+    assert compress(b'small', 'gzip') == (b'small', None)
+
+
+def test_etag_differs_per_encoding():
+    identity = result_etag('a1', 't1', None, 0, None)
+    gzipped = result_etag('a1', 't1', None, 0, None, encoding='gzip')
+    brotlied = result_etag('a1', 't1', None, 0, None, encoding='br')
+    assert len({identity, gzipped, brotlied}) == 3
+    assert etag_matches(gzipped, gzipped)
+    assert etag_matches(f'W/{gzipped}', gzipped)
+    assert not etag_matches(identity, gzipped)
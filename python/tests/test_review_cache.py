@@ -0,0 +1,140 @@
+import sqlite3
+
+import pytest
+
+import review_analyzer
+from coupang_http import CoupangReviewFetcher
+from job_scheduler import DomainRateLimiter
+from review_cache import SCHEMA_VERSION, ReviewCache
+from test_coupang_http import PRODUCT_URL, add_newest_review
+
+FIXTURE_REVIEWS = 12
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ReviewCache(path=str(tmp_path / 'reviews.sqlite3'), ttl_seconds=3600)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def crawl(stub_url, cache, monkeypatch):
+    """스텁 서버로 수집하는 crawl_product_cached (crawl_product에 넘긴 stop_at_known 기록)"""
+    fetcher = CoupangReviewFetcher(base_url=stub_url, concurrency=2)
+    monkeypatch.setattr(review_analyzer, 'review_cache', cache)
+    monkeypatch.setattr(review_analyzer, '_http_fetcher', fetcher)
+    monkeypatch.setattr(review_analyzer, 'domain_limiter', DomainRateLimiter(min_interval=0))
+
+    calls = []
+    crawl_product = review_analyzer.crawl_product
+
+    def recording_crawl_product(*args, **kwargs):
+        calls.append(kwargs)
+        return crawl_product(*args, **kwargs)
+
+    monkeypatch.setattr(review_analyzer, 'crawl_product', recording_crawl_product)
+
+    def run(max_reviews):
+        product_info, reviews, stats = review_analyzer.crawl_product_cached(PRODUCT_URL, max_reviews, crawl_mode='http')
+        return reviews, stats
+
+    run.calls = calls
+    yield run
+    fetcher.close()
+
+
+def expire(cache):
+    with cache._lock:
+        conn = cache._connect()
+        with conn:
+            conn.execute("UPDATE products SET crawled_at = crawled_at - ?", (cache.ttl_seconds + 1,))
+
+
+def test_miss_then_full_hit(crawl, cache):
+    first, stats = crawl(5)
+    assert stats['cache'] == 'miss'
+    assert len(first) == 5
+    assert cache.lookup('12345')['prefix_count'] == 5
+
+    second, stats = crawl(5)
+    assert stats == {'mode': 'cache', 'cache': 'hit', 'new_reviews': 0}
+    assert [review['id'] for review in second] == [review['id'] for review in first]
+    assert len(crawl.calls) == 1
+
+
+def test_incremental_recrawl_stops_at_known_reviews(crawl, cache, fixture_dir):
+    first, _ = crawl(5)
+    expire(cache)
+    add_newest_review(fixture_dir)
+
+    reviews, stats = crawl(5)
+    assert crawl.calls[-1]['stop_at_known'] is True
+    assert stats['cache'] == 'incremental'
+    assert stats['stopped_at_known'] is True
+    assert stats['new_reviews'] == 1
+    assert reviews[0]['text'] == '새로 올라온 리뷰입니다'
+    assert [review['id'] for review in reviews[1:]] == [review['id'] for review in first[:4]]
+    # 새 리뷰 바로 뒤에 예전 앞부분이 이어진다
+    assert cache.lookup('12345')['prefix_count'] == 6
+
+
+def test_short_prefix_does_not_stop_at_known_reviews(crawl, cache):
+    crawl(5)
+
+    # 캐시가 신선해도 앞부분이 요청 수보다 짧으면 적중이 아니다
+    reviews, stats = crawl(10)
+    assert crawl.calls[-1]['stop_at_known'] is False
+    assert stats['cache'] == 'incremental'
+    assert stats['stopped_at_known'] is False
+    assert stats['new_reviews'] == 5
+    assert len({review['id'] for review in reviews}) == 10
+    assert cache.lookup('12345')['prefix_count'] == 10
+
+
+def test_exhausted_product_with_fewer_reviews_is_a_hit(crawl, cache):
+    reviews, stats = crawl(50)
+    assert len(reviews) == FIXTURE_REVIEWS
+    assert stats['exhausted'] is True
+    assert cache.lookup('12345')['exhausted'] is True
+
+    again, stats = crawl(50)
+    assert stats['cache'] == 'hit'
+    assert len(again) == FIXTURE_REVIEWS
+
+    # 오래된 뒤에는 마지막 리뷰까지 이어진 앞부분이므로 아는 리뷰에서 멈춘다
+    expire(cache)
+    crawl(50)
+    assert crawl.calls[-1]['stop_at_known'] is True
+
+
+def test_ttl_expiry_forces_a_recrawl(crawl, cache):
+    crawl(5)
+    assert cache.lookup('12345')['fresh'] is True
+
+    expire(cache)
+    assert cache.lookup('12345')['fresh'] is False
+    _, stats = crawl(5)
+    assert stats['cache'] == 'incremental'
+    assert len(crawl.calls) == 2
+    assert cache.lookup('12345')['fresh'] is True
+
+
+def test_schema_version_mismatch_drops_old_cache(tmp_path):
+    path = str(tmp_path / 'reviews.sqlite3')
+    cache = ReviewCache(path=path)
+    cache.store('12345', {'title': '선풍기'}, [
+        {'id': 'abc', 'rating': 5, 'text': '좋아요', 'date': '2025.05.01', 'helpful_count': 0}
+    ], prefix_count=1)
+    cache.close()
+    # 지문 방식이 다른 예전 버전 캐시로 만든다
+    with sqlite3.connect(path) as conn:
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+
+    reopened = ReviewCache(path=path)
+    assert reopened.lookup('12345') is None
+    assert reopened.known_fingerprints('12345') == set()
+    reopened.close()
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
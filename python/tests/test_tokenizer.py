@@ -0,0 +1,52 @@
+import pytest
+
+from tokenizer import KoreanRuleTokenizer
+
+
+@pytest.fixture
+def tokenizer():
+    return KoreanRuleTokenizer(stopwords=frozenset())
+
+
+@pytest.mark.parametrize('word, stem', [
+    # 서술격 조사는 명사만 남긴다
+    ('제품이에요', '제품'),
+    ('최고예요', '최고'),
+    ('최고였어요', '최고'),
+    ('제품입니다', '제품'),
+    # 명사 + 하다는 명사, 한 글자 어근은 '하다'
+    ('만족합니다', '만족'),
+    ('튼튼해요', '튼튼'),
+    ('사용하기', '사용'),
+    ('편해요', '편하다'),
+    ('편하고', '편하다'),
+    # 용언 어미
+    ('좋았어요', '좋다'),
+    ('좋아서', '좋다'),
+    ('좋아', '좋다'),
+    ('괜찮네요', '괜찮다'),
+    ('보이네요', '보이다'),
+    ('빨라서', '빠르다'),
+    ('몰라요', '모르다'),
+    # 조사
+    ('배송이', '배송'),
+    ('배송은', '배송'),
+    # 그대로 둘 단어
+    ('사이', '사이'),
+    ('단어', '단어'),
+    ('세탁기', '세탁기'),
+    ('이해', '이해'),
+])
+def test_stem(tokenizer, word, stem):
+    assert tokenizer.stem(word) == stem
+
+
+def test_inflections_merge_into_one_keyword(tokenizer):
+    assert tokenizer.tokenize('좋아 좋다 좋아요 좋았어요') == ('좋다',) * 4
+
+
+def test_phrases(tokenizer):
+    tokens = tokenizer.tokenize('배송이 빨라서 좋아요')
+
+    assert tokens == ('배송', '빠르다', '좋다')
+    assert tokenizer.phrases(tokens) == ('배송 빠르다', '빠르다 좋다')
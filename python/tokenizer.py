@@ -0,0 +1,187 @@
+# VIBE 리뷰 분석기 - 한국어 토크나이저
+# 조사/어미를 규칙 기반으로 떼어 "배송이", "배송은"을 같은 키워드 "배송"으로 묶고,
+# 불용어 파일과 바이그램(구) 추출을 지원한다. 같은 리뷰 텍스트는 다시 토큰화하지 않는다.
+
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence, Tuple
+
+DEFAULT_STOPWORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lexicons', 'stopwords_ko.txt')
+
+_NON_HANGUL = re.compile(r'[^가-힣\s]')
+
+# 명사 + 하다 활용: 어미를 떼고 명사만 남긴다 (만족합니다 → 만족, 튼튼해요 → 튼튼, 사용하기 → 사용)
+# 남는 어근이 한 글자면 명사가 아니라 형용사/동사 어간이므로 '하다'를 붙인다 (편해요 → 편하다)
+HADA_ENDINGS = (
+    '했습니다', '하기에는', '했는데', '하네요', '하지만', '했어요', '합니다', '해서요',
+    '하기가', '하기도', '하기는', '하기에',
+    '하세요', '해요', '하고', '해서', '했고', '했다', '하다', '하게', '한데', '해도', '하기',
+)
+
+# 서술격 조사(이다): 명사만 남긴다 (제품이에요 → 제품, 최고예요 → 최고)
+# '이/였'으로 시작하는 어미는 용언(보이네요, 보였어요)과 겹치므로 두 글자 이상 명사에만 적용한다
+COPULA_ENDINGS = ('이었어요', '이었는데', '이에요', '입니다', '이네요', '이라서', '였어요', '였는데')
+SHORT_COPULA_ENDINGS = ('에요', '예요')
+
+# 르 불규칙: 앞 글자의 받침 ㄹ을 떼고 '르다'로 (빨라서 → 빠르다, 몰라요 → 모르다)
+REU_IRREGULAR_ENDINGS = ('랐어요', '랐는데', '라서', '러서', '라요', '러요', '라도')
+
+# 용언 어미: 어간 + '다'로 바꾼다 (좋았어요 → 좋다, 괜찮네요 → 괜찮다, 좋아서 → 좋다)
+PREDICATE_ENDINGS = (
+    '았어요', '었어요', '였어요', '습니다', '았는데', '었는데',
+    '어요', '아요', '네요', '지만', '는데', '었고', '았고', '어서', '아서',
+)
+
+# 반말 어미 '아/어': 앞 글자에 받침이 있을 때만 (좋아 → 좋다, 없어 → 없다)
+# 받침 ㄴ/ㅇ 뒤는 명사가 많아 제외한다 (단어, 연어, 고등어)
+BARE_ENDINGS = ('아', '어')
+_NOUN_FINALS = (0, 4, 21)  # 받침 없음, ㄴ, ㅇ
+_RIEUL_FINAL = 8
+
+# 조사: 남는 어간이 두 글자 이상일 때만 뗀다 (사이 → 사이 유지)
+PARTICLES = (
+    '에서는', '으로는', '에게서', '이라도', '까지도',
+    '에서', '에게', '한테', '으로', '이랑', '까지', '부터', '보다', '처럼', '만큼', '이나', '라도',
+    '로', '랑', '도', '만', '은', '는', '이', '가', '을', '를', '의', '에', '와', '과', '요',
+)
+
+
+def _final_consonant(syllable: str) -> int:
+    """한글 음절의 받침 번호 (없거나 한글이 아니면 0)"""
+    code = ord(syllable) - 0xAC00
+    return code % 28 if 0 <= code < 11172 else 0
+
+
+def load_stopwords(paths: Iterable[str]) -> frozenset:
+    """불용어 파일들 로드 (한 줄에 하나, # 주석 무시)"""
+    words = set()
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                word = line.strip()
+                if word and not word.startswith('#'):
+                    words.add(word)
+    return frozenset(words)
+
+
+class Tokenizer:
+    """토크나이저 인터페이스"""
+
+    name = 'base'
+
+    def tokenize(self, text: str) -> Tuple[str, ...]:
+        raise NotImplementedError
+
+    def phrases(self, tokens: Sequence[str]) -> Tuple[str, ...]:
+        """연속된 토큰으로 만든 구 (기본: 없음)"""
+        return ()
+
+
+class WhitespaceTokenizer(Tokenizer):
+    """기존 방식: 한글만 남기고 공백 분리, 1글자 단어와 불용어 제거"""
+
+    name = 'whitespace'
+
+    def __init__(self, stopwords: Optional[frozenset] = None):
+        self.stopwords = stopwords if stopwords is not None else load_stopwords([DEFAULT_STOPWORDS_PATH])
+
+    def tokenize(self, text: str) -> Tuple[str, ...]:
+        words = _NON_HANGUL.sub(' ', text).split()
+        return tuple(word for word in words if len(word) > 1 and word not in self.stopwords)
+
+
+class KoreanRuleTokenizer(Tokenizer):
+    """규칙 기반 한국어 토크나이저 (조사 제거 + 간이 어간 추출 + 바이그램)"""
+
+    name = 'korean'
+
+    def __init__(
+        self,
+        stopwords: Optional[frozenset] = None,
+        ngram: int = 2,
+        min_length: int = 2,
+        cache_size: int = 100_000,
+    ):
+        self.stopwords = stopwords if stopwords is not None else load_stopwords([DEFAULT_STOPWORDS_PATH])
+        self.ngram = ngram
+        self.min_length = min_length
+
+        # 같은 텍스트/단어는 다시 처리하지 않는다 (재분석, 반복 어휘)
+        self.tokenize = lru_cache(maxsize=cache_size)(self._tokenize)
+        self.stem = lru_cache(maxsize=cache_size)(self._stem)
+
+    def _stem(self, word: str) -> str:
+        for ending in HADA_ENDINGS:
+            if word.endswith(ending) and len(word) > len(ending):
+                root = word[:-len(ending)]
+                return root if len(root) >= 2 else root + '하다'
+
+        for ending in COPULA_ENDINGS:
+            if word.endswith(ending) and len(word) - len(ending) >= 2:
+                return word[:-len(ending)]
+
+        for ending in SHORT_COPULA_ENDINGS:
+            if word.endswith(ending) and len(word) > len(ending):
+                return word[:-len(ending)]
+
+        for ending in REU_IRREGULAR_ENDINGS:
+            if word.endswith(ending) and len(word) > len(ending):
+                last = word[-len(ending) - 1]
+                if _final_consonant(last) == _RIEUL_FINAL:
+                    return word[:-len(ending) - 1] + chr(ord(last) - _RIEUL_FINAL) + '르다'
+
+        for ending in PREDICATE_ENDINGS:
+            if word.endswith(ending) and len(word) > len(ending):
+                return word[:-len(ending)] + '다'
+
+        for ending in BARE_ENDINGS:
+            if word.endswith(ending) and len(word) > len(ending):
+                if _final_consonant(word[-len(ending) - 1]) not in _NOUN_FINALS:
+                    return word[:-len(ending)] + '다'
+
+        for particle in PARTICLES:
+            if word.endswith(particle) and len(word) - len(particle) >= 2:
+                return word[:-len(particle)]
+
+        return word
+
+    def _tokenize(self, text: str) -> Tuple[str, ...]:
+        tokens = []
+        for word in _NON_HANGUL.sub(' ', text).split():
+            stem = self.stem(word)
+            if len(stem) >= self.min_length and stem not in self.stopwords:
+                tokens.append(stem)
+        return tuple(tokens)
+
+    def phrases(self, tokens: Sequence[str]) -> Tuple[str, ...]:
+        """연속된 ngram개 토큰을 공백으로 이은 구"""
+        n = self.ngram
+        if n < 2 or len(tokens) < n:
+            return ()
+        return tuple(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+    def cache_info(self):
+        return self.tokenize.cache_info()
+
+
+_TOKENIZERS = {
+    KoreanRuleTokenizer.name: KoreanRuleTokenizer,
+    WhitespaceTokenizer.name: WhitespaceTokenizer,
+}
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(name: Optional[str] = None) -> Tokenizer:
+    """이름으로 토크나이저 생성 (프로세스마다 하나, 메모 캐시 공유)
+
+    KEYWORD_TOKENIZER: 'korean'(기본) 또는 'whitespace'
+    KEYWORD_STOPWORDS: 기본 불용어에 더할 파일 경로 (쉼표 구분)
+    """
+    name = name or os.getenv('KEYWORD_TOKENIZER', KoreanRuleTokenizer.name)
+    if name not in _TOKENIZERS:
+        raise ValueError(f"지원되지 않는 토크나이저입니다: {name}")
+
+    paths = [DEFAULT_STOPWORDS_PATH]
+    paths += [path.strip() for path in os.getenv('KEYWORD_STOPWORDS', '').split(',') if path.strip()]
+    return _TOKENIZERS[name](stopwords=load_stopwords(paths))
@@ -0,0 +1,44 @@
+import { NextRequest, NextResponse } from 'next/server';
+
+const PYTHON_API_URL = process.env.PYTHON_API_URL || 'http://localhost:8000';
+
+// 차트 이미지는 파일 이름이 내용 해시라서 백엔드의 영구 캐시 헤더를 그대로 전달
+export async function GET(
+  request: NextRequest,
+  context: { params: Promise<{ name: string }> }
+) {
+  try {
+    const params = await context.params;
+    const { name } = params;
+
+    const response = await fetch(`${PYTHON_API_URL}/charts/${encodeURIComponent(name)}`, {
+      method: 'GET',
+    });
+
+    if (!response.ok || !response.body) {
+      const data = await response.json().catch(() => ({}));
+      return NextResponse.json(
+        { error: data.detail || '차트 이미지를 찾을 수 없습니다.' },
+        { status: response.status }
+      );
+    }
+
+    const headers = new Headers({
+      'Content-Type': response.headers.get('Content-Type') || 'application/octet-stream',
+      'Cache-Control': response.headers.get('Cache-Control') || 'no-cache',
+    });
+    const etag = response.headers.get('ETag');
+    if (etag) {
+      headers.set('ETag', etag);
+    }
+
+    return new Response(response.body, { headers });
+
+  } catch (error: any) {
+    console.error('차트 이미지 조회 오류:', error);
+    return NextResponse.json(
+      { error: error.message || '서버 오류가 발생했습니다.' },
+      { status: 500 }
+    );
+  }
+}
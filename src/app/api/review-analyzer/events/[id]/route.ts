@@ -0,0 +1,42 @@
+import { NextRequest, NextResponse } from 'next/server';
+
+const PYTHON_API_URL = process.env.PYTHON_API_URL || 'http://localhost:8000';
+
+// SSE 스트림은 캐시하지 않고 그대로 중계
+export const dynamic = 'force-dynamic';
+
+export async function GET(
+  request: NextRequest,
+  context: { params: Promise<{ id: string }> }
+) {
+  try {
+    const params = await context.params;
+    const { id } = params;
+
+    const response = await fetch(`${PYTHON_API_URL}/events/${id}`, {
+      method: 'GET',
+      headers: { Accept: 'text/event-stream' },
+      signal: request.signal,
+    });
+
+    if (!response.ok || !response.body) {
+      const data = await response.json().catch(() => ({}));
+      throw new Error(data.detail || '진행 상황 스트림 연결에 실패했습니다.');
+    }
+
+    return new Response(response.body, {
+      headers: {
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache, no-transform',
+        Connection: 'keep-alive',
+      },
+    });
+
+  } catch (error: any) {
+    console.error('진행 상황 스트림 오류:', error);
+    return NextResponse.json(
+      { error: error.message || '서버 오류가 발생했습니다.' },
+      { status: 500 }
+    );
+  }
+}
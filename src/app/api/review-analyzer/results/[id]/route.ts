@@ -1,7 +1,28 @@
 import { NextRequest, NextResponse } from 'next/server';
+import type { IncomingMessage } from 'node:http';
+import { request as httpRequest } from 'node:http';
+import { request as httpsRequest } from 'node:https';
+import { Readable } from 'node:stream';
 
 const PYTHON_API_URL = process.env.PYTHON_API_URL || 'http://localhost:8000';
 
+// node:http/stream을 쓰므로 Node.js 런타임에서 실행
+export const runtime = 'nodejs';
+
+// 조건부 요청/압축 협상에 쓰는 요청 헤더와, 캐시 검증/압축에 필요한 응답 헤더는 그대로 중계
+const FORWARDED_REQUEST_HEADERS = ['if-none-match', 'accept-encoding'];
+const FORWARDED_RESPONSE_HEADERS = ['content-type', 'content-encoding', 'etag', 'cache-control', 'vary'];
+
+// fetch는 gzip/br 본문을 자동으로 풀면서 Content-Encoding 헤더는 남기므로, 압축된 본문을 그대로 넘기려고 node:http로 요청
+function requestRaw(url: string, headers: Record<string, string>, signal: AbortSignal): Promise<IncomingMessage> {
+  return new Promise((resolve, reject) => {
+    const send = url.startsWith('https:') ? httpsRequest : httpRequest;
+    const upstream = send(url, { method: 'GET', headers, signal }, resolve);
+    upstream.on('error', reject);
+    upstream.end();
+  });
+}
+
 export async function GET(
   request: NextRequest,
   context: { params: Promise<{ id: string }> }
@@ -192,17 +213,36 @@ export async function GET(
       }
     }
 
-    const response = await fetch(`${PYTHON_API_URL}/results/${id}`, {
-      method: 'GET',
-    });
+    // fields/cursor/limit 쿼리와 If-None-Match/Accept-Encoding은 그대로 전달
+    const requestHeaders: Record<string, string> = {};
+    for (const name of FORWARDED_REQUEST_HEADERS) {
+      const value = request.headers.get(name);
+      if (value) {
+        requestHeaders[name] = value;
+      }
+    }
 
-    const data = await response.json();
+    const upstream = await requestRaw(
+      `${PYTHON_API_URL}/results/${id}${request.nextUrl.search}`,
+      requestHeaders,
+      request.signal
+    );
 
-    if (!response.ok) {
-      throw new Error(data.detail || '결과 조회에 실패했습니다.');
+    const headers = new Headers();
+    for (const name of FORWARDED_RESPONSE_HEADERS) {
+      const value = upstream.headers[name];
+      if (typeof value === 'string') {
+        headers.set(name, value);
+      }
     }
 
-    return NextResponse.json(data);
+    // 상태 코드(304 포함)와 본문(압축된 그대로)을 다시 직렬화하지 않고 중계
+    const status = upstream.statusCode || 502;
+    if (status === 304) {
+      upstream.resume();
+      return new Response(null, { status, headers });
+    }
+    return new Response(Readable.toWeb(upstream) as ReadableStream<Uint8Array>, { status, headers });
 
   } catch (error: any) {
     console.error('결과 조회 오류:', error);
@@ -9,6 +9,10 @@ import AnalysisProgress from './components/AnalysisProgress';
 import ResultDashboard from './components/ResultDashboard';
 import QuickAnalyzeModal from './components/QuickAnalyzeModal';
 
+// 결과 화면이 그리는 필드만 받고, 리뷰 목록/리뷰별 감정은 앞부분만 받는다
+const RESULT_FIELDS = ['product_info', 'statistics', 'sentiment', 'keywords', 'raw_reviews', 'charts', 'generated_at'];
+const RESULT_REVIEW_LIMIT = 100;
+
 interface AnalysisState {
   status: 'idle' | 'analyzing' | 'completed' | 'error';
   progress: number;
@@ -60,7 +64,7 @@ export default function ReviewAnalyzerPage() {
         analysisId: data.analysisId
       }));
 
-      pollAnalysisStatus(data.analysisId);
+      watchAnalysisStatus(data.analysisId);
 
     } catch (error: any) {
       setAnalysisState({
@@ -73,6 +77,78 @@ export default function ReviewAnalyzerPage() {
     }
   };
 
+  // 상태 이벤트 반영 (완료/오류면 true)
+  const handleStatusUpdate = (analysisId: string, data: any): boolean => {
+    setAnalysisState(prev => ({
+      ...prev,
+      progress: data.progress,
+      currentStep: data.message
+    }));
+
+    if (data.status === 'completed') {
+      fetchResults(analysisId).catch(() => {
+        toast.error('분석 결과를 가져오는 중 오류가 발생했습니다.');
+      });
+      return true;
+    }
+    if (data.status === 'error') {
+      setAnalysisState({
+        status: 'error',
+        progress: 0,
+        currentStep: '',
+        error: data.error || data.message
+      });
+      toast.error(data.error || data.message);
+      return true;
+    }
+    return false;
+  };
+
+  // 결과 가져오기
+  const fetchResults = async (analysisId: string) => {
+    const query = new URLSearchParams({ fields: RESULT_FIELDS.join(','), limit: String(RESULT_REVIEW_LIMIT) });
+    const resultsResponse = await fetch(`/api/review-analyzer/results/${analysisId}?${query}`);
+    const resultsData = await resultsResponse.json();
+    
+    console.log('Results API 응답:', resultsData);
+    
+    setAnalysisState({
+      status: 'completed',
+      progress: 100,
+      currentStep: '분석 완료!',
+      analysisId,
+      results: resultsData.data // resultsData.analysis -> resultsData.data로 수정
+    });
+    
+    toast.success('리뷰 분석이 완료되었습니다!');
+  };
+
+  // 분석 진행상황 구독 (SSE 푸시, 연결 실패 시 폴링으로 전환)
+  const watchAnalysisStatus = (analysisId: string) => {
+    if (typeof EventSource === 'undefined' || analysisId.startsWith('mock_')) {
+      pollAnalysisStatus(analysisId);
+      return;
+    }
+
+    const source = new EventSource(`/api/review-analyzer/events/${analysisId}`);
+    let finished = false;
+
+    source.addEventListener('progress', (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+      if (handleStatusUpdate(analysisId, data)) {
+        finished = true;
+        source.close();
+      }
+    });
+
+    source.onerror = () => {
+      source.close();
+      if (!finished) {
+        pollAnalysisStatus(analysisId);
+      }
+    };
+  };
+
   // 분석 진행상황 폴링
   const pollAnalysisStatus = async (analysisId: string) => {
     const pollInterval = setInterval(async () => {
@@ -80,39 +156,8 @@ export default function ReviewAnalyzerPage() {
         const response = await fetch(`/api/review-analyzer/status/${analysisId}`);
         const data = await response.json();
 
-        setAnalysisState(prev => ({
-          ...prev,
-          progress: data.progress,
-          currentStep: data.message
-        }));
-
-        if (data.status === 'completed') {
-          clearInterval(pollInterval);
-          
-          // 결과 가져오기
-          const resultsResponse = await fetch(`/api/review-analyzer/results/${analysisId}`);
-          const resultsData = await resultsResponse.json();
-          
-          console.log('Results API 응답:', resultsData);
-          
-          setAnalysisState({
-            status: 'completed',
-            progress: 100,
-            currentStep: '분석 완료!',
-            analysisId,
-            results: resultsData.data // resultsData.analysis -> resultsData.data로 수정
-          });
-          
-          toast.success('리뷰 분석이 완료되었습니다!');
-        } else if (data.status === 'error') {
+        if (handleStatusUpdate(analysisId, data)) {
           clearInterval(pollInterval);
-          setAnalysisState({
-            status: 'error',
-            progress: 0,
-            currentStep: '',
-            error: data.error
-          });
-          toast.error(data.error);
         }
       } catch (error) {
         clearInterval(pollInterval);